@@ -0,0 +1 @@
+"""Performance benchmarks for espn_api, see benchmarks/run.py"""
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner
+
+Times League construction, player parsing and the analytics hot paths on
+synthetic leagues and writes JSON results that can be compared across commits.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --sports nfl --teams 8 12 20 --filter advanced
+    python -m benchmarks.run --compare baseline.json --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+# Allow running as a script from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import SPORTS, SyntheticLeague, player_class
+
+RESULTS_VERSION = 1
+
+# name -> (sports, setup function returning the callable to time)
+BENCHMARKS: Dict[str, tuple] = {}
+
+
+def benchmark(name: str, sports=tuple(SPORTS)):
+    """Register a benchmark setup function for the given sports"""
+    def register(setup):
+        BENCHMARKS[name] = (sports, setup)
+        return setup
+    return register
+
+
+def parse_player(sport: str, entry: Dict, year: int, pro_schedule: Optional[Dict] = None):
+    """Parse a roster entry with the sport's Player class"""
+    Player = player_class(sport)
+    if sport == 'nhl':
+        return Player(entry)
+    if SPORTS[sport]['pro_schedule']:
+        return Player(entry, year, pro_schedule)
+    return Player(entry, year)
+
+
+class BenchmarkContext:
+    """Synthetic league and lazily built objects shared by one sport/size"""
+
+    def __init__(self, sport: str, num_teams: int, args):
+        self.sport = sport
+        self.num_teams = num_teams
+        self.args = args
+        self.synthetic = SyntheticLeague(
+            sport,
+            num_teams=num_teams,
+            roster_size=args.roster_size,
+            num_free_agents=args.free_agents,
+            seed=args.seed
+        )
+        self.transport = self.synthetic.transport()
+        self.cache_dir = tempfile.mkdtemp(prefix='espn-api-bench-')
+        self._league = None
+        self._simulator = None
+
+    @property
+    def league(self):
+        if self._league is None:
+            self._league = self.synthetic.league(self.transport)
+        return self._league
+
+    @property
+    def players(self) -> List:
+        return [player for team in self.league.teams for player in team.roster]
+
+    def pro_schedule(self) -> Optional[Dict]:
+        if not SPORTS[self.sport]['pro_schedule']:
+            return None
+        return self.league._get_all_pro_schedule()
+
+    def free_agents(self) -> List:
+        pro_schedule = self.pro_schedule()
+        return [parse_player(self.sport, entry, self.synthetic.year, pro_schedule) for entry in self.synthetic.free_agent_entries()]
+
+    def simulator(self):
+        """AdvancedFantasySimulator with GMM models trained once"""
+        if self._simulator is None:
+            from espn_api.utils.advanced_simulator import AdvancedFantasySimulator
+            self._simulator = AdvancedFantasySimulator(
+                self.league,
+                num_simulations=self.args.simulations,
+                cache_dir=self.cache_dir
+            )
+        return self._simulator
+
+    def close(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+def schedule_view(league):
+    """
+    League view for MonteCarloSimulator
+
+    MonteCarloSimulator reads matchup style schedule entries (week, home_team,
+    away_team, points_for) while football teams store opponents and scores in
+    parallel lists, so wrap them without touching the League.
+    """
+    teams = {}
+    for team in league.teams:
+        teams[team.team_id] = SimpleNamespace(
+            team_id=team.team_id,
+            team_name=team.team_name,
+            wins=team.wins,
+            points_for=team.points_for,
+            roster=team.roster,
+            schedule=[]
+        )
+    for team in league.teams:
+        view = teams[team.team_id]
+        for week, (opponent, score) in enumerate(zip(team.schedule, team.scores), 1):
+            view.schedule.append(SimpleNamespace(
+                week=week,
+                home_team=view,
+                away_team=teams[opponent.team_id] if opponent.team_id != team.team_id else None,
+                points_for=score
+            ))
+    return SimpleNamespace(
+        teams=list(teams.values()),
+        current_week=league.current_week,
+        settings=league.settings,
+        year=league.year
+    )
+
+
+@benchmark('league.construct')
+def bench_league_construct(ctx: BenchmarkContext) -> Callable:
+    return lambda: ctx.synthetic.league(ctx.transport)
+
+
+@benchmark('player.parse')
+def bench_player_parse(ctx: BenchmarkContext) -> Callable:
+    entries = ctx.synthetic.player_entries()
+    pro_schedule = ctx.pro_schedule()
+    year = ctx.synthetic.year
+    return lambda: [parse_player(ctx.sport, entry, year, pro_schedule) for entry in entries]
+
+
+@benchmark('league_frame.build')
+def bench_league_frame(ctx: BenchmarkContext) -> Callable:
+    from espn_api.utils.league_frame import LeagueFrame
+    league = ctx.league
+    return lambda: LeagueFrame(league)
+
+
+@benchmark('league.standings_weekly', sports=('nfl',))
+def bench_standings_weekly(ctx: BenchmarkContext) -> Callable:
+    league = ctx.league
+    week = league.currentMatchupPeriod - 1
+    return lambda: league.standings_weekly(week)
+
+
+@benchmark('league.power_rankings', sports=('nfl',))
+def bench_power_rankings(ctx: BenchmarkContext) -> Callable:
+    league = ctx.league
+    week = league.currentMatchupPeriod - 1
+    return lambda: league.power_rankings(week)
+
+
+@benchmark('monte_carlo.run_simulations', sports=('nfl',))
+def bench_monte_carlo(ctx: BenchmarkContext) -> Callable:
+    from espn_api.utils.monte_carlo import MonteCarloSimulator
+    simulator = MonteCarloSimulator(schedule_view(ctx.league), num_simulations=ctx.args.simulations)
+    return simulator.run_simulations
+
+
+@benchmark('advanced.simulate_matchup', sports=('nfl',))
+def bench_simulate_matchup(ctx: BenchmarkContext) -> Callable:
+    simulator = ctx.simulator()
+    (team1, team2) = ctx.league.teams[:2]
+    return lambda: simulator.simulate_matchup(team1, team2, n_simulations=ctx.args.simulations)
+
+
+@benchmark('advanced.find_trade_opportunities', sports=('nfl',))
+def bench_find_trades(ctx: BenchmarkContext) -> Callable:
+    from espn_api.utils.advanced_simulator import AdvancedFantasySimulator
+    # every opponent adds thousands of roster evaluations, so trade against a
+    # fixed number of opponents using projections to keep runs comparable
+    league = ctx.league
+    view = SimpleNamespace(
+        teams=league.teams[:ctx.args.trade_opponents + 1],
+        current_week=league.current_week,
+        settings=league.settings,
+        year=league.year
+    )
+    simulator = AdvancedFantasySimulator(view, num_simulations=ctx.args.simulations, use_gmm=False)
+    my_team = league.teams[0]
+    return lambda: simulator.find_trade_opportunities(my_team)
+
+
+@benchmark('advanced.recommend_free_agents', sports=('nfl',))
+def bench_recommend_free_agents(ctx: BenchmarkContext) -> Callable:
+    simulator = ctx.simulator()
+    free_agents = ctx.free_agents()
+    my_team = ctx.league.teams[0]
+    return lambda: simulator.recommend_free_agents(my_team, free_agents)
+
+
+@benchmark('player_performance.bulk_train', sports=('nfl',))
+def bench_bulk_train(ctx: BenchmarkContext) -> Callable:
+    from espn_api.utils.player_performance import PlayerPerformanceModel
+    model = PlayerPerformanceModel(cache_dir=os.path.join(ctx.cache_dir, 'bulk_train'))
+    players = ctx.players
+    year = ctx.league.year
+    return lambda: model.bulk_train(players, year, force_retrain=True)
+
+
+def fresh_import(statement: str):
+    """Run an import statement in a new interpreter, so nothing is imported already"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, '-c', statement], cwd=root, check=True)
+
+
+@benchmark('import.league', sports=('nfl',))
+def bench_import_league(ctx: BenchmarkContext) -> Callable:
+    # includes interpreter startup, compare it across commits rather than in absolute terms
+    return lambda: fresh_import('from espn_api.football import League\n'
+                                'from espn_api.utils.advanced_simulator import AdvancedFantasySimulator')
+
+
+@benchmark('import.cli', sports=('nfl',))
+def bench_import_cli(ctx: BenchmarkContext) -> Callable:
+    return lambda: fresh_import('import fantasy_decision_maker')
+
+
+def time_callable(fn: Callable, repeat: int, quick: bool = False) -> Dict:
+    """
+    Time a callable with timeit
+
+    Args:
+        fn: Zero argument callable
+        repeat: Number of timing rounds
+        quick: Single call per round instead of calibrating the loop count
+
+    Returns:
+        Dict with per call min/median/mean/stdev in seconds
+    """
+    timer = timeit.Timer(fn)
+    # autorange also serves as the warm up call
+    number = 1 if quick else timer.autorange()[0]
+    times = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'number': number,
+        'repeat': repeat,
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'unit': 's',
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(args) -> Dict:
+    """Run every selected benchmark and return the JSON results document"""
+    import numpy as np
+
+    results = {}
+    for sport in args.sports:
+        for num_teams in args.teams:
+            ctx = BenchmarkContext(sport, num_teams, args)
+            try:
+                for name, (sports, setup) in BENCHMARKS.items():
+                    if sport not in sports or (args.filter and not any(f in name for f in args.filter)):
+                        continue
+                    key = f'{name}[{sport}-{num_teams}t]'
+                    timing = time_callable(setup(ctx), args.repeat, args.quick)
+                    timing.update({'benchmark': name, 'sport': sport, 'teams': num_teams})
+                    results[key] = timing
+                    print(f"{key:<60} {timing['median'] * 1000:12.3f} ms")
+            finally:
+                ctx.close()
+
+    return {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'config': {
+            'sports': args.sports,
+            'teams': args.teams,
+            'roster_size': args.roster_size,
+            'free_agents': args.free_agents,
+            'simulations': args.simulations,
+            'trade_opponents': args.trade_opponents,
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    Compare median timings of two results documents
+
+    Args:
+        baseline: Results loaded from an earlier run
+        current: Results of this run
+        threshold: Relative slowdown reported as a regression (0.10 = 10%)
+
+    Returns:
+        One row per benchmark present in both documents
+    """
+    rows = []
+    for key, timing in current['results'].items():
+        old = baseline.get('results', {}).get(key)
+        if not old or not old['median']:
+            continue
+        ratio = timing['median'] / old['median']
+        status = ''
+        if ratio > 1 + threshold:
+            status = 'REGRESSION'
+        elif ratio < 1 - threshold:
+            status = 'improved'
+        rows.append({'benchmark': key, 'baseline': old['median'], 'current': timing['median'], 'ratio': ratio, 'status': status})
+    return rows
+
+
+def print_comparison(rows: List[Dict], baseline: Dict):
+    print()
+    print(f"Compared with {baseline.get('commit') or 'baseline'}")
+    print(f"{'Benchmark':<60} {'Baseline':>12} {'Current':>12} {'Ratio':>7}")
+    for row in rows:
+        print(f"{row['benchmark']:<60} {row['baseline'] * 1000:10.3f}ms {row['current'] * 1000:10.3f}ms {row['ratio']:7.2f} {row['status']}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark espn_api on synthetic leagues')
+    parser.add_argument('--sports', nargs='+', default=list(SPORTS), choices=list(SPORTS), help='Sports to benchmark')
+    parser.add_argument('--teams', nargs='+', type=int, default=[12], help='League sizes to benchmark (e.g. 8 12 20)')
+    parser.add_argument('--roster-size', type=int, default=None, help='Players per team (default: sport roster template)')
+    parser.add_argument('--free-agents', type=int, default=50, help='Free agents in the player pool')
+    parser.add_argument('--simulations', type=int, default=200, help='Simulations per simulator call')
+    parser.add_argument('--trade-opponents', type=int, default=2, help='Opponents searched by find_trade_opportunities')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing rounds per benchmark')
+    parser.add_argument('--quick', action='store_true', help='One call per round, no loop calibration')
+    parser.add_argument('--filter', nargs='+', default=None, help='Only run benchmarks whose name contains one of these')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic league seed')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    parser.add_argument('--compare', help='Results JSON of a previous run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Relative slowdown treated as a regression')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    results = run_benchmarks(args)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f'\nResults written to {args.output}')
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare_results(baseline, results, args.threshold)
+        print_comparison(rows, baseline)
+        if any(row['status'] == 'REGRESSION' for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,557 @@
+"""
+Synthetic League Generator
+
+Builds ESPN shaped payloads (league, draft, pro players and pro schedule) for
+a league of any size in every sport package, with full-season player stats,
+so League construction and the analytics can be benchmarked without network
+access. Payloads are served through a ReplayTransport.
+"""
+
+import json
+import random
+from typing import Dict, List, Optional
+
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.transport import ReplayTransport, request_key
+
+# roster: (position, defaultPositionId, eligibleSlots, starter lineupSlotId, mean points per period)
+# ordered starters first, players without a starter slot sit in bench_slot.
+# splits: ESPN stat split prefixes, 00 season total, 01/02/03 last 7/15/30, 10 projections
+SPORTS = {
+    'nfl': {
+        'package': 'football',
+        'roster': [
+            ('QB', 1, [0, 7, 20, 21], 0, 18.0),
+            ('RB', 2, [2, 3, 23, 7, 20, 21], 2, 12.0),
+            ('RB', 2, [2, 3, 23, 7, 20, 21], 2, 12.0),
+            ('WR', 3, [4, 3, 5, 23, 7, 20, 21], 4, 11.0),
+            ('WR', 3, [4, 3, 5, 23, 7, 20, 21], 4, 11.0),
+            ('TE', 4, [6, 5, 23, 7, 20, 21], 6, 8.0),
+            ('RB', 2, [2, 3, 23, 7, 20, 21], 23, 10.0),
+            ('D/ST', 16, [16, 20, 21], 16, 7.0),
+            ('K', 5, [17, 20, 21], 17, 8.0),
+            ('QB', 1, [0, 7, 20, 21], None, 14.0),
+            ('RB', 2, [2, 3, 23, 7, 20, 21], None, 8.0),
+            ('WR', 3, [4, 3, 5, 23, 7, 20, 21], None, 8.0),
+            ('WR', 3, [4, 3, 5, 23, 7, 20, 21], None, 7.0),
+            ('TE', 4, [6, 5, 23, 7, 20, 21], None, 5.0),
+            ('RB', 2, [2, 3, 23, 7, 20, 21], None, 6.0),
+            ('WR', 3, [4, 3, 5, 23, 7, 20, 21], None, 6.0),
+        ],
+        'bench_slot': 20,
+        'lineup_slot_counts': {'0': 1, '2': 2, '4': 2, '6': 1, '16': 1, '17': 1, '20': 7, '21': 1, '23': 1},
+        'stat_ids': ['3', '4', '24', '25', '42', '43', '53'],
+        'matchup_periods': 14,
+        'playoff_periods': 3,
+        'periods_per_matchup': 1,
+        'splits': ('00', '10'),
+        'pro_schedule': True,
+        'weekly_stats': True,
+    },
+    'nba': {
+        'package': 'basketball',
+        'roster': [
+            ('PG', 1, [0, 5, 11, 12, 13], 0, 30.0),
+            ('SG', 2, [1, 5, 7, 8, 11, 12, 13], 1, 28.0),
+            ('SF', 3, [2, 6, 7, 8, 11, 12, 13], 2, 27.0),
+            ('PF', 4, [3, 6, 9, 10, 11, 12, 13], 3, 27.0),
+            ('C', 5, [4, 9, 10, 11, 12, 13], 4, 29.0),
+            ('PG', 1, [0, 5, 11, 12, 13], 5, 24.0),
+            ('SF', 3, [2, 6, 7, 8, 11, 12, 13], 6, 23.0),
+            ('C', 5, [4, 9, 10, 11, 12, 13], 11, 22.0),
+            ('PF', 4, [3, 6, 9, 10, 11, 12, 13], 11, 22.0),
+            ('SG', 2, [1, 5, 7, 8, 11, 12, 13], 11, 21.0),
+            ('PG', 1, [0, 5, 11, 12, 13], None, 18.0),
+            ('SF', 3, [2, 6, 7, 8, 11, 12, 13], None, 17.0),
+            ('C', 5, [4, 9, 10, 11, 12, 13], None, 16.0),
+        ],
+        'bench_slot': 12,
+        'lineup_slot_counts': {'0': 1, '1': 1, '2': 1, '3': 1, '4': 1, '5': 1, '6': 1, '11': 3, '12': 3, '13': 1},
+        'stat_ids': ['0', '1', '2', '3', '6', '11', '17', '19', '20', '42'],
+        'matchup_periods': 19,
+        'playoff_periods': 2,
+        'periods_per_matchup': 7,
+        'splits': ('00', '01', '02', '03', '10'),
+        'pro_schedule': True,
+        'daily_stats': True,
+    },
+    'nhl': {
+        'package': 'hockey',
+        'roster': [
+            ('Center', 1, [0, 3, 6, 7, 8], 0, 3.0),
+            ('Center', 1, [0, 3, 6, 7, 8], 0, 2.8),
+            ('Left Wing', 2, [1, 3, 6, 7, 8], 1, 2.7),
+            ('Left Wing', 2, [1, 3, 6, 7, 8], 1, 2.5),
+            ('Right Wing', 3, [2, 3, 6, 7, 8], 2, 2.7),
+            ('Right Wing', 3, [2, 3, 6, 7, 8], 2, 2.5),
+            ('Defense', 4, [4, 6, 7, 8], 4, 2.2),
+            ('Defense', 4, [4, 6, 7, 8], 4, 2.1),
+            ('Defense', 4, [4, 6, 7, 8], 4, 2.0),
+            ('Defense', 4, [4, 6, 7, 8], 4, 1.9),
+            ('Goalie', 5, [5, 7, 8], 5, 4.0),
+            ('Goalie', 5, [5, 7, 8], 5, 3.6),
+            ('Center', 1, [0, 3, 6, 7, 8], 6, 2.3),
+            ('Right Wing', 3, [2, 3, 6, 7, 8], None, 2.0),
+            ('Defense', 4, [4, 6, 7, 8], None, 1.7),
+            ('Goalie', 5, [5, 7, 8], None, 3.0),
+        ],
+        'bench_slot': 7,
+        'lineup_slot_counts': {'0': 2, '1': 2, '2': 2, '4': 4, '5': 2, '6': 1, '7': 3, '8': 1},
+        'stat_ids': ['0', '1', '4', '6', '13', '14', '16', '29', '31'],
+        'matchup_periods': 22,
+        'playoff_periods': 3,
+        'periods_per_matchup': 7,
+        'splits': ('00', '01', '02', '03', '10'),
+        'pro_schedule': False,
+    },
+    'mlb': {
+        'package': 'baseball',
+        'roster': [
+            ('C', 1, [0, 12, 16, 17], 0, 5.0),
+            ('1B', 2, [1, 7, 19, 12, 16, 17], 1, 6.5),
+            ('2B', 3, [2, 6, 19, 12, 16, 17], 2, 6.0),
+            ('3B', 4, [3, 7, 19, 12, 16, 17], 3, 6.2),
+            ('SS', 5, [4, 6, 19, 12, 16, 17], 4, 6.1),
+            ('OF', 6, [5, 12, 16, 17], 5, 6.3),
+            ('OF', 6, [5, 12, 16, 17], 5, 6.0),
+            ('OF', 6, [5, 12, 16, 17], 5, 5.8),
+            ('DH', 12, [11, 12, 16, 17], 12, 5.5),
+            ('SP', 15, [13, 14, 16, 17], 14, 12.0),
+            ('SP', 15, [13, 14, 16, 17], 14, 11.0),
+            ('RP', 16, [13, 15, 16, 17], 15, 4.0),
+            ('RP', 16, [13, 15, 16, 17], 15, 3.8),
+            ('SP', 15, [13, 14, 16, 17], 13, 10.0),
+            ('OF', 6, [5, 12, 16, 17], None, 4.5),
+            ('SP', 15, [13, 14, 16, 17], None, 8.0),
+            ('RP', 16, [13, 15, 16, 17], None, 3.0),
+        ],
+        'bench_slot': 16,
+        'lineup_slot_counts': {'0': 1, '1': 1, '2': 1, '3': 1, '4': 1, '5': 3, '12': 1, '13': 1, '14': 2, '15': 2, '16': 3, '17': 1},
+        'stat_ids': ['0', '1', '5', '20', '21', '23', '34', '48', '53', '57'],
+        'matchup_periods': 21,
+        'playoff_periods': 3,
+        'periods_per_matchup': 7,
+        'splits': ('00', '10'),
+        'pro_schedule': False,
+        'daily_stats': True,
+    },
+    'wnba': {
+        'package': 'wbasketball',
+        'roster': [
+            ('G', 1, [1, 5, 6, 7], 1, 25.0),
+            ('G', 1, [1, 5, 6, 7], 1, 23.0),
+            ('F', 2, [2, 4, 5, 6, 7], 2, 24.0),
+            ('F', 2, [2, 4, 5, 6, 7], 2, 22.0),
+            ('C', 3, [3, 4, 5, 6, 7], 3, 24.0),
+            ('F', 2, [2, 4, 5, 6, 7], 5, 20.0),
+            ('G', 1, [1, 5, 6, 7], None, 16.0),
+            ('C', 3, [3, 4, 5, 6, 7], None, 15.0),
+            ('F', 2, [2, 4, 5, 6, 7], None, 14.0),
+            ('G', 1, [1, 5, 6, 7], None, 13.0),
+        ],
+        'bench_slot': 6,
+        'lineup_slot_counts': {'1': 2, '2': 2, '3': 1, '5': 1, '6': 4, '7': 1},
+        'stat_ids': ['0', '1', '2', '3', '6', '11', '17', '19', '20', '42'],
+        'matchup_periods': 15,
+        'playoff_periods': 2,
+        'periods_per_matchup': 7,
+        'splits': ('00', '01', '02', '03', '10'),
+        'pro_schedule': False,
+    },
+}
+
+# first date of the synthetic season (ms since epoch)
+SEASON_START = 1725580800000
+DAY_MS = 86400000
+
+
+def league_class(sport: str):
+    '''Returns the League class of the sport package'''
+    package = __import__(f"espn_api.{SPORTS[sport]['package']}", fromlist=['League'])
+    return package.League
+
+
+def player_class(sport: str):
+    '''Returns the Player class of the sport package'''
+    package = __import__(f"espn_api.{SPORTS[sport]['package']}", fromlist=['Player'])
+    return package.Player
+
+
+class SyntheticLeague:
+    """Generates a deterministic ESPN league for one sport"""
+
+    def __init__(
+        self,
+        sport: str = 'nfl',
+        num_teams: int = 10,
+        roster_size: Optional[int] = None,
+        num_free_agents: int = 50,
+        current_matchup_period: Optional[int] = None,
+        year: int = 2024,
+        league_id: int = 123456,
+        seed: int = 0,
+        previous_seasons: Optional[List[int]] = None
+    ):
+        """
+        Initialize generator
+
+        Args:
+            sport: nfl, nba, nhl, mlb or wnba
+            num_teams: Number of teams (8-20 is typical)
+            roster_size: Players per team (default: sport template size)
+            num_free_agents: Unrostered players added to the pro player pool
+            current_matchup_period: Matchup period in progress (default: mid-season)
+            year: Season year
+            league_id: League id used in endpoints
+            seed: Random seed, the same arguments always produce the same league
+            previous_seasons: Earlier season years reported in the league status
+        """
+        if sport not in SPORTS:
+            raise ValueError(f'Unknown sport: {sport}, available options are {list(SPORTS)}')
+        if num_teams < 2:
+            raise ValueError('A league needs at least 2 teams')
+
+        self.sport = sport
+        self.spec = SPORTS[sport]
+        self.num_teams = num_teams
+        self.roster_size = roster_size or len(self.spec['roster'])
+        self.num_free_agents = num_free_agents
+        self.year = year
+        self.league_id = league_id
+        self.previous_seasons = list(previous_seasons or [])
+        self.rng = random.Random(seed)
+
+        self.reg_season_count = self.spec['matchup_periods']
+        self.num_matchup_periods = self.reg_season_count + self.spec['playoff_periods']
+        self.periods_per_matchup = self.spec['periods_per_matchup']
+        self.final_scoring_period = self.num_matchup_periods * self.periods_per_matchup
+        self.current_matchup_period = current_matchup_period or self.reg_season_count // 2 + 1
+        self.scoring_period = (self.current_matchup_period - 1) * self.periods_per_matchup + 1
+
+        package = __import__(f"espn_api.{self.spec['package']}.constant", fromlist=['PRO_TEAM_MAP'])
+        self.pro_team_ids = [team_id for team_id in package.PRO_TEAM_MAP if 0 < team_id < 100]
+
+        self._next_player_id = 1000
+        self.rosters = [self._roster(team_id) for team_id in range(1, num_teams + 1)]
+        self.free_agents = [self._player(self.rng.choice(self.spec['roster']), None, 0) for _ in range(num_free_agents)]
+        self.schedule = self._schedule()
+
+    def _periods(self, matchup_period: int) -> List[int]:
+        '''Scoring periods played in a matchup period'''
+        start = (matchup_period - 1) * self.periods_per_matchup + 1
+        return list(range(start, start + self.periods_per_matchup))
+
+    def _player(self, template, lineup_slot: Optional[int], team_id: int) -> Dict:
+        '''Creates a roster entry with season stats for one player'''
+        (position, default_position, eligible_slots, _, mean) = template
+        player_id = self._next_player_id
+        self._next_player_id += 1
+
+        quality = self.rng.uniform(0.6, 1.4)
+        mean = mean * quality
+        played = list(range(1, self.scoring_period))
+        points = {period: round(max(0.0, self.rng.gauss(mean, mean * 0.35)), 2) for period in played}
+        season_points = round(sum(points.values()), 2)
+        season_avg = season_points / len(played) if played else 0
+
+        stats = []
+        for prefix in self.spec['splits']:
+            projected = prefix == '10'
+            total = mean * self.final_scoring_period if projected else season_points
+            stats.append(self._stat_line(prefix, 0, total, mean if projected else season_avg, 1 if projected else 0, 0))
+        if self.spec.get('weekly_stats') or self.spec.get('daily_stats'):
+            for period in range(1, self.final_scoring_period + 1):
+                if self.spec.get('weekly_stats'):
+                    projection = round(mean * self.rng.uniform(0.85, 1.15), 2)
+                    stats.append(self._stat_line('10', period, projection, projection, 1, 1))
+                if period in points:
+                    stats.append(self._stat_line('05', period, points[period], points[period], 0, 1 if self.spec.get('weekly_stats') else 5))
+
+        entry = {
+            'playerId': player_id,
+            'lineupSlotId': lineup_slot if lineup_slot is not None else self.spec['bench_slot'],
+            'acquisitionType': 'DRAFT' if team_id else '',
+            'injuryStatus': 'ACTIVE',
+            'status': 'ONTEAM' if team_id else 'FREEAGENT',
+            'playerPoolEntry': {
+                'id': player_id,
+                'onTeamId': team_id,
+                'appliedStatTotal': season_points,
+                'player': {
+                    'fullName': f'Player {player_id}',
+                    'defaultPositionId': default_position,
+                    'eligibleSlots': eligible_slots,
+                    'proTeamId': self.rng.choice(self.pro_team_ids),
+                    'jersey': str(self.rng.randint(0, 99)),
+                    'injured': False,
+                    'ownership': {
+                        'percentOwned': round(min(100.0, 40 * quality ** 2), 2) if team_id else round(self.rng.uniform(0, 30), 2),
+                        'percentStarted': round(min(100.0, 30 * quality ** 2), 2) if team_id else 0.0,
+                    },
+                    'stats': stats,
+                },
+            },
+        }
+        # keep weekly points around to build matchup scores
+        entry['_points'] = points
+        return entry
+
+    def _stat_line(self, prefix: str, period: int, total: float, average: float, source: int, split: int) -> Dict:
+        '''Creates one ESPN stats split'''
+        stat_ids = self.spec['stat_ids']
+        breakdown = {stat_id: round(total * self.rng.uniform(0.05, 0.3), 2) for stat_id in stat_ids}
+        line = {
+            'id': f'{prefix}{self.year}',
+            'seasonId': self.year,
+            'scoringPeriodId': period,
+            'statSourceId': source,
+            'statSplitTypeId': split,
+            'appliedTotal': round(total, 2),
+            'appliedAverage': round(average, 2),
+            'stats': breakdown,
+            'appliedStats': {stat_id: round(value * 0.1, 2) for stat_id, value in breakdown.items()},
+        }
+        if prefix != '05':
+            line['averageStats'] = breakdown
+        return line
+
+    def _roster(self, team_id: int) -> List[Dict]:
+        '''Creates a full roster following the sport template'''
+        template = self.spec['roster']
+        roster = []
+        for index in range(self.roster_size):
+            position = template[index % len(template)]
+            lineup_slot = position[3] if index < len(template) else None
+            roster.append(self._player(position, lineup_slot, team_id))
+        return roster
+
+    def _schedule(self) -> List[Dict]:
+        '''Round robin regular season schedule, odd team counts get a bye each period'''
+        team_ids = list(range(1, self.num_teams + 1))
+        if len(team_ids) % 2:
+            team_ids.append(None)
+        half = len(team_ids) // 2
+
+        schedule = []
+        rotation = team_ids[:]
+        for matchup_period in range(1, self.reg_season_count + 1):
+            periods = self._periods(matchup_period)
+            for i in range(half):
+                (home, away) = (rotation[i], rotation[-i - 1])
+                if home is None:
+                    (home, away) = (away, home)
+                schedule.append(self._matchup(len(schedule) + 1, matchup_period, periods, home, away))
+            # circle method, keep the first team fixed
+            rotation = [rotation[0]] + [rotation[-1]] + rotation[1:-1]
+        return schedule
+
+    def _team_score(self, team_id: int, periods: List[int]) -> Dict[str, float]:
+        '''Points scored by a team's starters in each scoring period'''
+        scores = {}
+        for period in periods:
+            if period >= self.scoring_period:
+                continue
+            scores[str(period)] = round(sum(
+                player['_points'].get(period, 0)
+                for player in self.rosters[team_id - 1]
+                if player['lineupSlotId'] != self.spec['bench_slot']
+            ), 2)
+        return scores
+
+    def _matchup(self, matchup_id: int, matchup_period: int, periods: List[int], home: int, away: Optional[int]) -> Dict:
+        '''Creates one schedule entry'''
+        matchup = {'id': matchup_id, 'matchupPeriodId': matchup_period}
+        sides = [('home', home)] + ([('away', away)] if away else [])
+        totals = {}
+        for side, team_id in sides:
+            by_period = self._team_score(team_id, periods)
+            totals[side] = round(sum(by_period.values()), 2)
+            matchup[side] = {
+                'teamId': team_id,
+                'totalPoints': totals[side],
+                'pointsByScoringPeriod': by_period,
+            }
+
+        if matchup_period >= self.current_matchup_period:
+            matchup['winner'] = 'UNDECIDED'
+        elif not away:
+            matchup['winner'] = 'HOME'
+        elif totals['home'] == totals['away']:
+            matchup['winner'] = 'TIE'
+        else:
+            matchup['winner'] = 'HOME' if totals['home'] > totals['away'] else 'AWAY'
+        return matchup
+
+    def _team(self, team_id: int) -> Dict:
+        '''Creates a team with record totals derived from the schedule'''
+        record = {'wins': 0, 'losses': 0, 'ties': 0, 'pointsFor': 0.0, 'pointsAgainst': 0.0}
+        streak = (0, 'NONE')
+        for matchup in self.schedule:
+            if matchup['winner'] == 'UNDECIDED':
+                continue
+            side = 'home' if matchup['home']['teamId'] == team_id else 'away' if matchup.get('away', {}).get('teamId') == team_id else None
+            if side is None:
+                continue
+            other = 'away' if side == 'home' else 'home'
+            record['pointsFor'] += matchup[side]['totalPoints']
+            record['pointsAgainst'] += matchup.get(other, {}).get('totalPoints', 0)
+            if matchup['winner'] == 'TIE':
+                result = 'TIE'
+                record['ties'] += 1
+            elif matchup['winner'] == side.upper():
+                result = 'WIN'
+                record['wins'] += 1
+            else:
+                result = 'LOSS'
+                record['losses'] += 1
+            streak = (streak[0] + 1, result) if streak[1] == result else (1, result)
+
+        record['pointsFor'] = round(record['pointsFor'], 2)
+        record['streakLength'] = streak[0]
+        record['streakType'] = streak[1]
+        return {
+            'id': team_id,
+            'abbrev': f'T{team_id}',
+            'name': f'Team {team_id}',
+            'divisionId': (team_id - 1) % 2,
+            'owners': [f'{{OWNER-{team_id}}}'],
+            'playoffSeed': 0,
+            'rankCalculatedFinal': 0,
+            'waiverRank': team_id,
+            'record': {'overall': record},
+            'transactionCounter': {'acquisitions': 0, 'drops': 0, 'trades': 0, 'moveToIR': 0, 'acquisitionBudgetSpent': 0},
+            'roster': {'entries': [self._clean(player) for player in self.rosters[team_id - 1]]},
+        }
+
+    def _clean(self, entry: Dict) -> Dict:
+        '''Drops generator bookkeeping from an entry'''
+        return {key: value for key, value in entry.items() if not key.startswith('_')}
+
+    def league_payload(self) -> Dict:
+        '''mTeam, mRoster, mMatchup, mSettings and mStandings view'''
+        teams = [self._team(team_id) for team_id in range(1, self.num_teams + 1)]
+        ranked = sorted(teams, key=lambda team: (team['record']['overall']['wins'], team['record']['overall']['pointsFor']), reverse=True)
+        for seed, team in enumerate(ranked, 1):
+            team['playoffSeed'] = seed
+
+        scoring_type = 'H2H_POINTS'
+        return {
+            'id': self.league_id,
+            'seasonId': self.year,
+            'scoringPeriodId': self.scoring_period,
+            'status': {
+                'currentMatchupPeriod': self.current_matchup_period,
+                'firstScoringPeriod': 1,
+                'finalScoringPeriod': self.final_scoring_period,
+                'latestScoringPeriod': self.scoring_period,
+                'previousSeasons': self.previous_seasons,
+            },
+            'members': [{'id': f'{{OWNER-{team_id}}}', 'displayName': f'owner{team_id}', 'firstName': 'Owner', 'lastName': str(team_id)} for team_id in range(1, self.num_teams + 1)],
+            'settings': {
+                'name': f'Synthetic {self.sport.upper()} League',
+                'size': self.num_teams,
+                'scheduleSettings': {
+                    'matchupPeriodCount': self.reg_season_count,
+                    'matchupPeriods': {str(period): self._periods(period) for period in range(1, self.num_matchup_periods + 1)},
+                    'playoffTeamCount': min(6, self.num_teams),
+                    'playoffMatchupPeriodLength': 1,
+                    'playoffSeedingRule': 'TOTAL_POINTS_SCORED',
+                    'divisions': [{'id': 0, 'name': 'East'}, {'id': 1, 'name': 'West'}],
+                },
+                'tradeSettings': {'vetoVotesRequired': 4},
+                'draftSettings': {'keeperCount': 0},
+                'scoringSettings': {
+                    'matchupTieRule': 'NONE',
+                    'playoffMatchupTieRule': 'NONE',
+                    'scoringType': scoring_type,
+                    'scoringItems': [{'statId': int(stat_id), 'points': 0.1} for stat_id in self.spec['stat_ids']],
+                },
+                'acquisitionSettings': {'isUsingAcquisitionBudget': False, 'acquisitionBudget': 100},
+                'rosterSettings': {'lineupSlotCounts': self.spec['lineup_slot_counts']},
+            },
+            'teams': teams,
+            'schedule': self.schedule,
+        }
+
+    def draft_payload(self) -> Dict:
+        '''mDraftDetail view, snake draft of every rostered player'''
+        picks = []
+        for round_id in range(1, self.roster_size + 1):
+            order = range(1, self.num_teams + 1) if round_id % 2 else range(self.num_teams, 0, -1)
+            for round_pick, team_id in enumerate(order, 1):
+                picks.append({
+                    'teamId': team_id,
+                    'playerId': self.rosters[team_id - 1][round_id - 1]['playerId'],
+                    'roundId': round_id,
+                    'roundPickNumber': round_pick,
+                    'bidAmount': 0,
+                    'keeper': False,
+                    'nominatingTeamId': 0,
+                })
+        return {'draftDetail': {'drafted': True, 'picks': picks}}
+
+    def players_payload(self) -> List[Dict]:
+        '''players_wl view of every rostered and free agent player'''
+        players = [entry for roster in self.rosters for entry in roster] + self.free_agents
+        return [{'id': entry['playerId'], 'fullName': entry['playerPoolEntry']['player']['fullName']} for entry in players]
+
+    def pro_schedule_payload(self) -> Dict:
+        '''proTeamSchedules_wl view, every pro team plays once per matchup period'''
+        pro_teams = [{'id': team_id, 'proGamesByScoringPeriod': {}} for team_id in self.pro_team_ids]
+        for matchup_period in range(1, self.num_matchup_periods + 1):
+            order = pro_teams[:]
+            self.rng.shuffle(order)
+            period = self._periods(matchup_period)[0]
+            # football scoring periods are weeks, the other sports use days
+            day = (matchup_period - 1) * 7 if self.periods_per_matchup == 1 else period - 1
+            for game_id, (home, away) in enumerate(zip(order[::2], order[1::2])):
+                game = {
+                    'id': matchup_period * 100 + game_id,
+                    'homeProTeamId': home['id'],
+                    'awayProTeamId': away['id'],
+                    'date': SEASON_START + day * DAY_MS,
+                }
+                home['proGamesByScoringPeriod'][str(period)] = [game]
+                away['proGamesByScoringPeriod'][str(period)] = [game]
+        return {'settings': {'proTeams': [{'id': 0, 'proGamesByScoringPeriod': {}}] + pro_teams}}
+
+    def player_entries(self) -> List[Dict]:
+        '''Every roster and free agent entry, for Player parsing benchmarks'''
+        return [self._clean(entry) for roster in self.rosters for entry in roster] + [self._clean(entry) for entry in self.free_agents]
+
+    def free_agent_entries(self) -> List[Dict]:
+        '''Free agent entries'''
+        return [self._clean(entry) for entry in self.free_agents]
+
+    def cassette(self) -> List[Dict]:
+        '''ReplayTransport entries for every request made while constructing the League'''
+        request = EspnFantasyRequests(sport=self.sport, year=self.year, league_id=self.league_id)
+        filters = {'x-fantasy-filter': json.dumps({"filterActive": {"value": True}})}
+        requests = [
+            (request.LEAGUE_ENDPOINT, {'view': ['mTeam', 'mRoster', 'mMatchup', 'mSettings', 'mStandings']}, None, self.league_payload()),
+            (request.LEAGUE_ENDPOINT, {'view': 'mDraftDetail'}, None, self.draft_payload()),
+            (request.ENDPOINT + '/players', {'view': 'players_wl'}, filters, self.players_payload()),
+        ]
+        if self.spec['pro_schedule']:
+            requests.append((request.ENDPOINT, {'view': 'proTeamSchedules_wl'}, None, self.pro_schedule_payload()))
+
+        entries = []
+        for url, params, headers, body in requests:
+            (key_url, key_params, key_filter) = request_key(url, params, headers)
+            entries.append({
+                'url': key_url,
+                'params': [list(item) for item in key_params],
+                'filter': key_filter,
+                'status': 200,
+                'headers': {'Content-Type': 'application/json'},
+                'body': json.dumps(body, separators=(',', ':')),
+            })
+        return entries
+
+    def transport(self) -> ReplayTransport:
+        '''ReplayTransport serving this league'''
+        return ReplayTransport(entries=self.cassette())
+
+    def league(self, transport: Optional[ReplayTransport] = None):
+        '''Constructs the sport League from replayed payloads'''
+        return league_class(self.sport)(self.league_id, self.year, transport=transport or self.transport())
@@ -0,0 +1,408 @@
+"""
+Fantasy Football Decision Service
+
+Long running JSON API over a FantasyDecisionMaker. The league, the trained player
+models and computed answers stay in memory, so queries for any team are answered
+from memory instead of rebuilding everything per command. A background thread
+refreshes the league and only drops answers when something changed.
+
+Each answer is computed by a single thread at a time per cache key, so a slow
+answer for one team never holds up the others. Refreshes fetch the league while
+queries go on, queries only wait while the fetched data is applied to the league,
+the frame and the player models, so no answer sees a half refreshed league.
+
+Usage:
+    python fantasy_decision_maker.py --config config.json --serve --port 8765
+
+Routes (all answers are JSON):
+    GET  /health                       service status
+    GET  /teams                        teams of the league
+    GET  /outlook                      rest of season projections of every team
+    GET  /timing                       timing summary of the decision maker
+    GET  /teams/<id>/matchup           current week matchup simulation
+    GET  /teams/<id>/free-agents?top_n=10
+    GET  /teams/<id>/trades?limit=5
+    POST /refresh                      refresh the league now
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Hashable, Optional
+from urllib.parse import parse_qs, urlparse
+
+from espn_api.utils.league_frame import LeagueFrame
+
+
+def _default(value):
+    """JSON fallback for numpy values and players"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if hasattr(value, 'playerId'):
+        return {
+            'playerId': value.playerId,
+            'name': getattr(value, 'name', None),
+            'position': getattr(value, 'position', None),
+            'proTeam': getattr(value, 'proTeam', None)
+        }
+    return str(value)
+
+
+def dumps(value) -> str:
+    """Serialize a service answer to JSON"""
+    return json.dumps(value, default=_default)
+
+
+class _ReadWriteLock:
+    """Shared lock for readers, exclusive for a writer. Waiting writers go first, a thread
+    already reading may read again without waiting"""
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+        self._depth = threading.local()
+
+    @contextmanager
+    def read(self):
+        depth = getattr(self._depth, 'value', 0)
+        if not depth:
+            with self._condition:
+                while self._writing or self._writers_waiting:
+                    self._condition.wait()
+                self._readers += 1
+        self._depth.value = depth + 1
+        try:
+            yield
+        finally:
+            self._depth.value = depth
+            if not depth:
+                with self._condition:
+                    self._readers -= 1
+                    if not self._readers:
+                        self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+class DecisionService:
+    """Answers decision queries for any team of a warm FantasyDecisionMaker"""
+
+    def __init__(self, decision_maker, refresh_interval: float = 5 * 60, free_agent_pool_size: int = 100):
+        """
+        Initialize decision service
+
+        Args:
+            decision_maker: FantasyDecisionMaker with its league and simulator built
+            refresh_interval: Seconds between background league refreshes
+            free_agent_pool_size: Free agents fetched once and scored for every team
+        """
+        self.dm = decision_maker
+        self.refresh_interval = refresh_interval
+        self.free_agent_pool_size = free_agent_pool_size
+        self.generation = 0  # bumped whenever the league changed and answers were dropped
+        self.refreshed_at = time.time()
+        self.stats = {'hits': 0, 'misses': 0, 'refreshes': 0, 'refresh_errors': 0}
+        self._results: Dict[Hashable, tuple] = {}
+        # one lock per cache key so each answer is computed once, by one thread
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        # guards stats, generation, _results and _key_locks, never held while computing
+        self._lock = threading.Lock()
+        # read while answering from the league and models, written while a refresh changes them
+        self._league_lock = _ReadWriteLock()
+        # one refresh at a time
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def league(self):
+        return self.dm.league
+
+    def _cached(self, key: Hashable, compute: Callable):
+        """Answer for key from this generation, computed once when missing"""
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None and entry[0] == self.generation:
+                self.stats['hits'] += 1
+                return entry[1]
+
+        # the generation cannot change while reading, key locks are taken after the read lock
+        # so a thread waiting for a key never holds up a refresh
+        with self._league_lock.read():
+            with self._lock:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                with self._lock:
+                    # another thread may have computed it while we waited
+                    entry = self._results.get(key)
+                    if entry is not None and entry[0] == self.generation:
+                        self.stats['hits'] += 1
+                        return entry[1]
+                    self.stats['misses'] += 1
+                value = compute()
+                with self._lock:
+                    self._results[key] = (self.generation, value)
+                return value
+
+    def teams(self) -> list:
+        """Teams of the league"""
+        with self._league_lock.read():
+            return [{
+                'team_id': team.team_id,
+                'team_name': team.team_name,
+                'wins': team.wins,
+                'losses': team.losses
+            } for team in self.league.teams]
+
+    def matchup(self, team_id: int) -> dict:
+        """Current week matchup simulation of a team"""
+        def compute():
+            team = self.dm.team(team_id)
+            opponent = self.dm.opponent(team)
+            answer = {
+                'week': self.league.current_week,
+                'team': team.team_name,
+                'opponent': opponent.team_name if opponent else None
+            }
+            if opponent:
+                results = self.dm.matchup_results(team, opponent)
+                # the raw scores of every simulation are too large to send
+                answer.update({k: v for k, v in results.items() if k not in ('team1_scores', 'team2_scores')})
+            return answer
+        return self._cached(('matchup', team_id), compute)
+
+    def free_agent_pool(self) -> list:
+        """Free agents shared by the free agent answers of every team"""
+        return self._cached(('free_agent_pool',), lambda: self.dm.free_agent_pool(size=self.free_agent_pool_size))
+
+    def free_agents(self, team_id: int, top_n: int = 10) -> dict:
+        """Free agent recommendations of a team"""
+        def compute():
+            team = self.dm.team(team_id)
+            return {
+                'week': self.league.current_week,
+                'team': team.team_name,
+                'recommendations': self.dm.free_agent_recommendations(team, self.free_agent_pool(), top_n=top_n)
+            }
+        return self._cached(('free_agents', team_id, top_n), compute)
+
+    def trades(self, team_id: int, limit: int = 5) -> dict:
+        """Trade opportunities of a team"""
+        def compute():
+            team = self.dm.team(team_id)
+            return {
+                'week': self.league.current_week,
+                'team': team.team_name,
+                'opportunities': self.dm.trade_opportunities(team)
+            }
+        answer = self._cached(('trades', team_id), compute)
+        return dict(answer, opportunities=answer['opportunities'][:limit])
+
+    def outlook(self) -> dict:
+        """Rest of season projections of every team, by projected wins"""
+        def compute():
+            results = self.dm.season_outlook()
+            teams = [dict(results[team.team_id], team_id=team.team_id, team_name=team.team_name,
+                          wins=team.wins, losses=team.losses) for team in self.league.teams]
+            teams.sort(key=lambda team: team['projected_wins'], reverse=True)
+            return {'week': self.league.current_week, 'teams': teams}
+        return self._cached(('outlook',), compute)
+
+    def health(self) -> dict:
+        """Service status"""
+        return {
+            'league_id': self.dm.league_id,
+            'week': self.league.current_week,
+            'generation': self.generation,
+            'refreshed_at': self.refreshed_at,
+            'cached_answers': len(self._results),
+            'stats': self._stats()
+        }
+
+    def _stats(self) -> dict:
+        with self._lock:
+            return dict(self.stats)
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def timing(self) -> dict:
+        """Timing summary of the decision maker"""
+        return self.dm.timing_summary()
+
+    def warm(self):
+        """Computes the answers shared by every team ahead of the first query"""
+        self.outlook()
+        self.free_agent_pool()
+
+    def refresh(self) -> bool:
+        """
+        Refresh the league, dropping the cached answers only if it changed
+
+        The league is fetched while queries keep being answered. Applying it, rebuilding
+        the simulator's league frame and training the players new to a roster happen
+        while no query runs, so answers never mix the old and the refreshed league.
+
+        Returns:
+            True if the league changed
+        """
+        with self._refresh_lock:
+            with self.dm.timer.phase('league_refresh'):
+                fetched = self.league.fetch_refresh()
+                with self._league_lock.write():
+                    changed = self._apply_refresh(fetched)
+            with self._lock:
+                self.refreshed_at = time.time()
+                self.stats['refreshes'] += 1
+            return changed
+
+    def _apply_refresh(self, fetched) -> bool:
+        """Applies fetched league data, called with the league write locked"""
+        week = self.league.current_week
+        changes = self.league.refresh(fetched) or {}
+        changed_teams = {team.team_id: team for kind in changes.values() for team in kind}
+        if not changed_teams and self.league.current_week == week:
+            return False
+
+        simulator = self.dm.simulator
+        if simulator.frame is not None:
+            simulator.frame = LeagueFrame(self.league)
+        rosters = [player for team in changed_teams.values() for player in team.roster]
+        if rosters and simulator.use_gmm:
+            with self.dm.timer.phase('gmm_training'):
+                simulator.player_model.bulk_train(rosters, self.league.year, frame=simulator.frame)
+        with self._lock:
+            self.generation += 1
+            self._results = {}
+            self._key_locks = {}
+        return True
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                if self.refresh():
+                    self.warm()
+            except Exception as e:
+                # keep serving the last answers, the next refresh tries again
+                self._count('refresh_errors')
+                print(f"⚠️  Refresh failed: {e}")
+
+    def start(self, warm: bool = True):
+        """Starts refreshing the league in the background"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        if warm:
+            self.warm()
+        self._thread = threading.Thread(target=self._refresh_loop, name='decision-service-refresh', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops the background refresh"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service: DecisionService = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, value):
+        body = dumps(value).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _answer(self, route: Callable):
+        try:
+            self._send(200, route())
+        except ValueError as e:
+            # unknown team or invalid query parameter
+            self._send(404 if 'not found' in str(e) else 400, {'error': str(e)})
+        except Exception as e:
+            self._send(500, {'error': str(e)})
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split('/') if part]
+        service = self.service
+
+        if parts == ['health']:
+            return self._answer(service.health)
+        if parts == ['teams']:
+            return self._answer(service.teams)
+        if parts == ['outlook']:
+            return self._answer(service.outlook)
+        if parts == ['timing']:
+            return self._answer(service.timing)
+        if len(parts) == 3 and parts[0] == 'teams':
+            routes = {
+                'matchup': lambda: service.matchup(int(parts[1])),
+                'free-agents': lambda: service.free_agents(int(parts[1]), top_n=int(query.get('top_n', 10))),
+                'trades': lambda: service.trades(int(parts[1]), limit=int(query.get('limit', 5)))
+            }
+            if parts[2] in routes:
+                return self._answer(routes[parts[2]])
+        self._send(404, {'error': f'Unknown route: {url.path}'})
+
+    def do_POST(self):
+        if urlparse(self.path).path.strip('/') == 'refresh':
+            return self._answer(lambda: {'changed': self.service.refresh(), 'generation': self.service.generation})
+        self._send(404, {'error': f'Unknown route: {self.path}'})
+
+
+def make_server(service: DecisionService, host: str = '127.0.0.1', port: int = 8765) -> ThreadingHTTPServer:
+    """
+    HTTP server answering queries from service, one thread per request
+
+    Args:
+        service: Decision service to answer from
+        host: Interface to listen on (default: localhost only)
+        port: Port to listen on, 0 picks a free one
+    """
+    handler = type('DecisionServiceHandler', (_Handler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(decision_maker, host: str = '127.0.0.1', port: int = 8765, refresh_interval: float = 5 * 60):
+    """Serve decision queries until interrupted"""
+    service = DecisionService(decision_maker, refresh_interval=refresh_interval)
+    print("🔥 Warming up outlook and free agents...")
+    service.start()
+    server = make_server(service, host, port)
+    print(f"🚀 Decision service listening on http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down decision service")
+    finally:
+        service.stop()
+        server.server_close()
+    return service
@@ -0,0 +1,200 @@
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ACTIVITY = 'activity'
+TRANSACTIONS = 'transactions'
+# same default as League.transactions
+DEFAULT_TRANSACTION_TYPES = {'FREEAGENT', 'WAIVER', 'WAIVER_ERROR'}
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS items (
+    sport TEXT NOT NULL,
+    league_id INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    date INTEGER,
+    scoring_period INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (sport, league_id, year, kind, item_id)
+);
+CREATE INDEX IF NOT EXISTS items_by_date ON items (sport, league_id, year, kind, date);
+CREATE TABLE IF NOT EXISTS watermarks (
+    sport TEXT NOT NULL,
+    league_id INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    date INTEGER,
+    scoring_period INTEGER,
+    PRIMARY KEY (sport, league_id, year, kind)
+);
+CREATE TABLE IF NOT EXISTS cursors (
+    sport TEXT NOT NULL,
+    league_id INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    resume_offset INTEGER NOT NULL,
+    date INTEGER,
+    PRIMARY KEY (sport, league_id, year, kind)
+);
+'''
+
+
+def _topic_id(topic: dict) -> str:
+    if topic.get('id') is not None:
+        return str(topic['id'])
+    return json.dumps(topic, sort_keys=True, separators=(',', ':'))
+
+
+def _transaction_date(transaction: dict) -> Optional[int]:
+    return transaction.get('processDate') or transaction.get('proposedDate')
+
+
+class ActivityLog(object):
+    '''Local append only log of league activity and transactions kept in SQLite
+
+    Every league has a watermark per kind: the newest activity date and the last scoring
+    period whose transactions were read. ingest_activity() pages recent activity (newest
+    first) only until it reaches the watermark and ingest_transactions() only reads the
+    scoring periods from the watermark on, so a poll costs O(new items) requests. Items are
+    stored as the raw ESPN payloads and can be read back with activity() and transactions()
+    without contacting ESPN. Use a file path to keep the log between runs.
+
+    An ingest_activity() stopped by max_pages before it reached the watermark keeps the
+    watermark and saves a cursor instead, the next ingest resumes paging from the cursor.'''
+    def __init__(self, path: str = ':memory:'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def _league_key(league) -> Tuple[str, int, int]:
+        return (league.sport, league.league_id, league.year)
+
+    def watermark(self, league, kind: str = ACTIVITY) -> Tuple[Optional[int], Optional[int]]:
+        '''(newest date, last scoring period) ingested for the league, (None, None) before the first ingest'''
+        with self._lock:
+            row = self._db.execute(
+                'SELECT date, scoring_period FROM watermarks WHERE sport = ? AND league_id = ? AND year = ? AND kind = ?',
+                self._league_key(league) + (kind,)).fetchone()
+        return tuple(row) if row else (None, None)
+
+    def _cursor(self, league, kind: str) -> Optional[Tuple[int, Optional[int]]]:
+        '''(offset to resume paging at, newest date of the interrupted ingest), None if the last ingest completed'''
+        with self._lock:
+            row = self._db.execute(
+                'SELECT resume_offset, date FROM cursors WHERE sport = ? AND league_id = ? AND year = ? AND kind = ?',
+                self._league_key(league) + (kind,)).fetchone()
+        return tuple(row) if row else None
+
+    def _store(self, league, kind: str, items: Iterable[Tuple[str, Optional[int], Optional[int], dict]],
+               date: Optional[int], scoring_period: Optional[int], cursor: Tuple[int, Optional[int]] = None) -> int:
+        '''Inserts new items, moves the watermark forward and sets (or with None clears) the cursor in one
+        transaction, returns the number of new items'''
+        key = self._league_key(league)
+        rows = [key + (kind, item_id, item_date, item_period, json.dumps(data, separators=(',', ':')))
+                for (item_id, item_date, item_period, data) in items]
+        with self._lock, self._db:
+            before = self._db.total_changes
+            self._db.executemany('INSERT OR IGNORE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            added = self._db.total_changes - before
+            self._db.execute(
+                'INSERT INTO watermarks VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (sport, league_id, year, kind) '
+                'DO UPDATE SET date = COALESCE(MAX(date, excluded.date), date, excluded.date), '
+                'scoring_period = COALESCE(MAX(scoring_period, excluded.scoring_period), scoring_period, excluded.scoring_period)',
+                key + (kind, date, scoring_period))
+            if cursor is None:
+                self._db.execute('DELETE FROM cursors WHERE sport = ? AND league_id = ? AND year = ? AND kind = ?', key + (kind,))
+            else:
+                self._db.execute('INSERT OR REPLACE INTO cursors VALUES (?, ?, ?, ?, ?, ?)', key + (kind,) + tuple(cursor))
+        return added
+
+    def ingest_activity(self, league, page_size: int = 25, max_pages: int = None) -> int:
+        '''Appends the leagues activity newer than its watermark, returns the number of new topics'''
+        (watermark, _) = self.watermark(league, ACTIVITY)
+        # an interrupted ingest continues where it stopped, newest is the date it started from
+        (offset, newest) = self._cursor(league, ACTIVITY) or (0, None)
+        topics = []
+        pages = 0
+        complete = False
+        while max_pages is None or pages < max_pages:
+            page = league._get_activity_topics(size=page_size, offset=offset)
+            pages += 1
+            topics.extend(page)
+            # newest first, a topic at or before the watermark means the rest was ingested before
+            if len(page) < page_size or (watermark is not None and any(topic.get('date', 0) <= watermark for topic in page)):
+                complete = True
+                break
+            offset += page_size
+
+        if newest is None:
+            newest = max((topic.get('date', 0) for topic in topics), default=None)
+        items = [(_topic_id(topic), topic.get('date'), None, topic)
+                 for topic in topics if watermark is None or topic.get('date', 0) >= watermark]
+        if complete:
+            return self._store(league, ACTIVITY, items, newest, None)
+        # topics between the last page read and the watermark are still missing, keep the watermark
+        return self._store(league, ACTIVITY, items, None, None, cursor=(offset, newest))
+
+    def ingest_transactions(self, league, types: Iterable[str] = None) -> int:
+        '''Appends the leagues transactions from its watermark period to the current one, returns the number of new transactions
+
+        The watermark period is read again since transactions keep being added to it until it ends.'''
+        if not hasattr(league, 'transactions'):
+            raise Exception('%s leagues have no transactions' % league.sport)
+        types = set(types or DEFAULT_TRANSACTION_TYPES)
+        (_, watermark) = self.watermark(league, TRANSACTIONS)
+        current = league.scoringPeriodId
+        first = min(watermark or 1, current)
+
+        items = []
+        for scoring_period in range(first, current + 1):
+            data = league._get_transactions_data(scoring_period, types)
+            for transaction in data.get('transactions', []):
+                items.append((str(transaction['id']), _transaction_date(transaction),
+                              transaction.get('scoringPeriodId', scoring_period), transaction))
+        return self._store(league, TRANSACTIONS, items, None, current)
+
+    def ingest(self, league, page_size: int = 25, types: Iterable[str] = None) -> Dict[str, int]:
+        '''Ingests activity and, for sports that have them, transactions. Returns the new item counts'''
+        added = {ACTIVITY: self.ingest_activity(league, page_size=page_size)}
+        if hasattr(league, 'transactions'):
+            added[TRANSACTIONS] = self.ingest_transactions(league, types=types)
+        return added
+
+    def _items(self, league, kind: str, since: int = None, scoring_period: int = None, limit: int = None) -> List[dict]:
+        query = 'SELECT data FROM items WHERE sport = ? AND league_id = ? AND year = ? AND kind = ?'
+        args = list(self._league_key(league)) + [kind]
+        if since is not None:
+            query += ' AND date > ?'
+            args.append(since)
+        if scoring_period is not None:
+            query += ' AND scoring_period = ?'
+            args.append(scoring_period)
+        query += ' ORDER BY date DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            args.append(limit)
+        with self._lock:
+            rows = self._db.execute(query, args).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def activity(self, league, since: int = None, limit: int = None) -> List[dict]:
+        '''Logged activity topics newest first, since is a date in epoch milliseconds'''
+        return self._items(league, ACTIVITY, since=since, limit=limit)
+
+    def transactions(self, league, since: int = None, scoring_period: int = None, limit: int = None) -> List[dict]:
+        '''Logged transactions newest first'''
+        return self._items(league, TRANSACTIONS, since=since, scoring_period=scoring_period, limit=limit)
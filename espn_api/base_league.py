@@ -1,21 +1,42 @@
+import gzip
+import json
 from abc import ABC
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Tuple, Union
 
 from .base_settings import BaseSettings
 from .base_pick import BasePick
+from .player_cards import PlayerCards
+from .player_pool import PlayerPool, player_pools
 from .utils.logger import Logger
+from .utils.utils import news_items
 from .requests.espn_requests import EspnFantasyRequests
 
+SNAPSHOT_VERSION = 1
+# only these fields of the pro player pool are decoded
+PLAYER_POOL_FIELDS = ('id', 'fullName')
+
 class BaseLeague(ABC):
     '''Creates a League instance for Public/Private ESPN league'''
-    def __init__(self, league_id: int, year: int, sport: str, espn_s2=None, swid=None, debug=False):
+    # activity message types of recent_activity (added, dropped, traded, ...)
+    ACTIVITY_MSG_TYPES = [178,180,179,239,181,244]
+    # position name -> ESPN slot id, set by each sport
+    _positions = {}
+    # Player class of kona_player_info and kona_playercard entries, set by each sport
+    _player_class = None
+
+    def __init__(self, league_id: int, year: int, sport: str, espn_s2=None, swid=None, debug=False, transport=None, keep_payloads=False):
         self.logger = Logger(name=f'{sport} league', debug=debug)
         self.league_id = league_id
         self.year = year
+        self.sport = sport
         self.teams = []
         self.members = []
         self.draft = []
         self.player_map = {}
+        # raw ESPN payloads for save_snapshot, only kept with keep_payloads since they take several MB
+        self.keep_payloads = keep_payloads
+        self._payloads = {}
 
         cookies = None
         if espn_s2 and swid:
@@ -23,13 +44,61 @@ class BaseLeague(ABC):
                 'espn_s2': espn_s2,
                 'SWID': swid
             }
-        self.espn_request = EspnFantasyRequests(sport=sport, year=year, league_id=league_id, cookies=cookies, logger=self.logger)
+        self.espn_request = EspnFantasyRequests(sport=sport, year=year, league_id=league_id, cookies=cookies, logger=self.logger, transport=transport)
+        # player cards by (player id, scoring period, current scoring period), see player_info
+        self.player_cards = PlayerCards(self.espn_request)
+        # pro team id -> games by scoring period, from the last _get_all_pro_schedule
+        self._all_pro_schedule = None
 
     def __repr__(self):
         return 'League(%s, %s)' % (self.league_id, self.year, )
 
-    def _fetch_league(self, SettingsClass = BaseSettings):
-        data = self.espn_request.get_league()
+    def save_snapshot(self, path: str):
+        '''Saves the raw ESPN payloads and player index to a gzip compressed JSON file, the league must be created with keep_payloads=True'''
+        if not self.keep_payloads:
+            raise ValueError('Create the league with keep_payloads=True to save snapshots')
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'sport': self.sport,
+            'league_id': self.league_id,
+            'year': self.year,
+            'payloads': self._payloads,
+            # only id and fullName of the pro player pool are ever used
+            'players': [[key, value] for key, value in self.player_map.items() if isinstance(key, int)],
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(snapshot, f, separators=(',', ':'))
+
+    @classmethod
+    def from_snapshot(cls, path: str, espn_s2=None, swid=None, debug=False, transport=None):
+        '''Creates a League from a file written by save_snapshot without any network access'''
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        if snapshot.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {snapshot.get('version')}")
+
+        league = cls(league_id=snapshot['league_id'], year=snapshot['year'], espn_s2=espn_s2, swid=swid, fetch_league=False, debug=debug,
+                     transport=transport, keep_payloads=True)
+        if league.sport != snapshot['sport']:
+            raise ValueError(f"Snapshot is for sport {snapshot['sport']} not {league.sport}")
+
+        payloads = dict(snapshot['payloads'])
+        payloads['players'] = [{'id': player_id, 'fullName': name} for player_id, name in snapshot['players']]
+        league.espn_request.preload(payloads)
+        league.fetch_league()
+        return league
+
+    def _keep_payload(self, name: str, data):
+        if self.keep_payloads:
+            self._payloads[name] = data
+
+    def _fetch_league(self, SettingsClass = BaseSettings, data = None):
+        '''Reads league settings and status from data (default: fetched now)'''
+        if data is None:
+            data = self.espn_request.get_league()
+        self._keep_payload('league', data)
+        # cards hold stats and injury status of the last fetch
+        self.player_cards.clear()
         self.currentMatchupPeriod = data['status']['currentMatchupPeriod']
         self.scoringPeriodId = data['scoringPeriodId']
         self.firstScoringPeriod = data['status']['firstScoringPeriod']
@@ -48,6 +117,9 @@ class BaseLeague(ABC):
     def _fetch_draft(self):
         '''Creates list of Pick objects from the leagues draft'''
         data = self.espn_request.get_league_draft()
+        self._keep_payload('draft', data)
+        # fetched again on every fetch_league and refresh_draft
+        self.draft = []
         # League has not drafted yet
         if not data.get('draftDetail', {}).get('drafted'):
             return
@@ -87,18 +159,19 @@ class BaseLeague(ABC):
         self.teams = sorted(self.teams, key=lambda x: x.team_id, reverse=False)
 
     def _fetch_players(self):
-        data = self.espn_request.get_pro_players()
-        # Map all player id's to player name
-        for player in data:
-            # two way map to find playerId's by name
-            self.player_map[player['id']] = player['fullName']
-            # if two players have the same fullname use first one for now TODO update for multiple player names
-            if player['fullName'] not in self.player_map:
-                self.player_map[player['fullName']] = player['id']
+        '''Two way map of player id's and names, shared by every league of this sport and year'''
+        if self.espn_request.shares_player_pool():
+            self.player_map = player_pools.get(self.sport, self.year, lambda: self.espn_request.get_pro_players(fields=PLAYER_POOL_FIELDS))
+        else:
+            self.player_map = PlayerPool(self.espn_request.get_pro_players(fields=PLAYER_POOL_FIELDS))
 
     def _get_pro_schedule(self, scoringPeriodId: int = None):
         data = self.espn_request.get_pro_schedule()
+        self._keep_payload('pro_schedule', data)
+        return self._pro_schedule_for_period(data, scoringPeriodId)
 
+    def _pro_schedule_for_period(self, data: dict, scoringPeriodId: int = None):
+        '''Maps pro team id to (opponent pro team id, game date) for one scoring period of a pro schedule payload'''
         pro_teams = data['settings']['proTeams']
         pro_team_schedule = {}
 
@@ -109,8 +182,10 @@ class BaseLeague(ABC):
                 pro_team_schedule[team['id']] = (game_data['homeProTeamId'], game_data['date'])  if team['id'] == game_data['awayProTeamId'] else (game_data['awayProTeamId'], game_data['date'])
         return pro_team_schedule
     
-    def _get_all_pro_schedule(self):
-        data = self.espn_request.get_pro_schedule()
+    def _get_all_pro_schedule(self, data = None):
+        if data is None:
+            data = self.espn_request.get_pro_schedule()
+        self._keep_payload('pro_schedule', data)
 
         pro_teams = data.get('settings', {}).get('proTeams', {})
         pro_team_schedule = {}
@@ -118,8 +193,131 @@ class BaseLeague(ABC):
         for team in pro_teams:
             pro_game = team.get('proGamesByScoringPeriod', {})
             pro_team_schedule[team['id']] = pro_game
+        self._all_pro_schedule = pro_team_schedule
         return pro_team_schedule
 
+    def _get_activity_topics(self, size: int = 25, offset: int = 0, msg_types: List[int] = None) -> List[dict]:
+        '''Raw activity topics, newest first'''
+        params = {
+            'view': 'kona_league_communication'
+        }
+
+        filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types or self.ACTIVITY_MSG_TYPES}}}
+        headers = {'x-fantasy-filter': json.dumps(filters)}
+        data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
+        return data['topics']
+
+    def _get_transactions_data(self, scoring_period: int, types: Iterable[str]) -> dict:
+        '''Raw mTransactions2 payload of one scoring period'''
+        params = {
+            'view': 'mTransactions2',
+            'scoringPeriodId': scoring_period,
+        }
+
+        filters = {"transactions":{"filterType":{"value":list(types)}}}
+        headers = {'x-fantasy-filter': json.dumps(filters)}
+        return self.espn_request.league_get(params=params, headers=headers)
+
+    def _free_agents_filter(self, size: int, slot_filter: List[int], offset: int = 0) -> dict:
+        '''kona_player_info filter of free agents and waivers, most owned first'''
+        filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
+        if offset:
+            filters['players']['offset'] = offset
+        return filters
+
+    def _get_free_agents_page(self, week: int, size: int, offset: int, slot_filter: List[int]) -> List[dict]:
+        '''Raw players of one page of free agents'''
+        params = {
+            'view': 'kona_player_info',
+            'scoringPeriodId': week,
+        }
+        headers = {'x-fantasy-filter': json.dumps(self._free_agents_filter(size, slot_filter, offset))}
+        data = self.espn_request.league_get(params=params, headers=headers)
+        return data['players']
+
+    def _player(self, data: dict):
+        '''Player of a kona_player_info or kona_playercard entry'''
+        if self._player_class is None:
+            raise Exception('%s leagues do not build players, the sport sets no _player_class' % self.sport)
+        return self._player_class(data, self.year)
+
+    def iter_free_agents(self, week: int = None, page_size: int = 50, positions: List[str] = None,
+                         position_ids: List[int] = None, limit: int = None, prefetch: bool = True) -> Iterator:
+        '''Yields free agents most owned first, fetching page_size players at a time\n
+        The next page is fetched in the background while the current one is consumed, stop
+        iterating to stop fetching. Players are plain Player objects without pro schedule
+        or positional ratings, use free_agents() for those. Should only be used with most recent season'''
+        if self.year < 2019:
+            raise Exception('Cant use free agents before 2019')
+        if not week:
+            week = self.current_week
+
+        slot_filter = [self._positions[position] for position in positions or [] if position in self._positions]
+        slot_filter.extend(position_ids or [])
+
+        def fetch(offset):
+            return self._get_free_agents_page(week, page_size, offset, slot_filter)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        yielded = 0
+        offset = 0
+        try:
+            page = fetch(offset)
+            while page:
+                more = len(page) == page_size and (limit is None or yielded + len(page) < limit)
+                next_page = executor.submit(fetch, offset + page_size) if executor and more else None
+                for data in page:
+                    if limit is not None and yielded >= limit:
+                        return
+                    yield self._player(data)
+                    yielded += 1
+                if not more:
+                    return
+                offset += page_size
+                page = next_page.result() if next_page else fetch(offset)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def _player_card_data(self, name: str = None, playerId: Union[int, list] = None) -> List[dict]:
+        '''Player cards of a player name or one or more ids, None for an unknown name'''
+        if name:
+            playerId = self.player_map.get(name)
+        if playerId is None or isinstance(playerId, str):
+            return None
+        if not isinstance(playerId, list):
+            playerId = [playerId]
+        return list(self.player_cards.get(playerId, self.finalScoringPeriod, self.scoringPeriodId).values())
+
+    def player_info(self, name: str = None, playerId: Union[int, list] = None):
+        ''' Returns Player class if name found, a list of them for a list of ids '''
+        cards = self._player_card_data(name, playerId)
+        if not cards:
+            return None
+        players = [self._player(card) for card in cards]
+        return players[0] if len(players) == 1 else players
+
+    def player_news(self, playerIds: List[int], max_workers: int = 8, ttl: float = None) -> dict:
+        '''Maps player id to its news feed, fetched concurrently and cached for ttl seconds'''
+        return self.espn_request.get_players_news(playerIds, max_workers=max_workers, ttl=ttl)
+
+    def attach_news(self, players: List, max_workers: int = 8, ttl: float = None) -> List:
+        '''Sets news (published, headline and story of each item) on the players, returns them.
+        Players whose feed could not be fetched keep the news they had'''
+        news = self.player_news([player.playerId for player in players], max_workers=max_workers, ttl=ttl)
+        for player in players:
+            feed = news[player.playerId]
+            player.news = news_items(feed) if feed is not None else getattr(player, 'news', [])
+        return players
+
+    def _map_concurrently(self, fn: Callable, items: Iterable, max_workers: int = 4) -> List:
+        '''Calls fn for every item on a thread pool (used for network bound per week fetches), results are in item order'''
+        items = list(items)
+        if len(items) <= 1 or max_workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(fn, items))
+
     def standings(self) -> List:
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
         return standings
@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from .base_pick import BasePick
+
+# matchup results that count towards records
+DECIDED = ('HOME', 'AWAY', 'TIE')
+
+
+def _empty_record() -> Dict:
+    return {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0}
+
+
+class BaseLeagueHistory(object):
+    '''Loads every season of a league concurrently and indexes all-time records, head to head results and drafts
+
+    Seasons are only used for their league, team and draft data, so the pro player pool and
+    pro schedule downloads are skipped unless fetch_players / fetch_pro_schedule are set.
+    Teams are identified by team_id, which ESPN keeps across seasons of a league. Only the raw
+    schedule of each season is kept, matchups are indexed from it.'''
+    LeagueClass = None
+
+    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, years: List[int] = None, max_workers: int = 4,
+                 fetch_players: bool = False, fetch_pro_schedule: bool = False, debug=False, transport=None):
+        self.league_id = league_id
+        self.year = year
+        self.espn_s2 = espn_s2
+        self.swid = swid
+        self.max_workers = max_workers
+        self.fetch_players = fetch_players
+        self.fetch_pro_schedule = fetch_pro_schedule
+        self.debug = debug
+        self.transport = transport
+        # season -> raw schedule matchups of the league payload
+        self._schedules = {}
+
+        seasons = {}
+        if years is None:
+            # the latest season lists the league's previous seasons
+            seasons[year] = self._load_season(year)
+            years = seasons[year].previousSeasons + [year]
+        remaining = [season for season in years if season not in seasons]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(remaining) or 1))) as executor:
+            for season, league in zip(remaining, executor.map(self._load_season, remaining)):
+                seasons[season] = league
+
+        self.seasons = {season: seasons[season] for season in sorted(seasons)}
+        self._build_indexes()
+
+    def __repr__(self):
+        return 'LeagueHistory(%s, %s-%s)' % (self.league_id, self.years[0], self.years[-1])
+
+    @property
+    def years(self) -> List[int]:
+        return list(self.seasons)
+
+    def _load_season(self, year: int):
+        '''Creates the League for one season, skipping downloads the history does not use'''
+        league = self.LeagueClass(league_id=self.league_id, year=year, espn_s2=self.espn_s2, swid=self.swid,
+                                  fetch_league=False, debug=self.debug, transport=self.transport)
+        # the league payload is fetched here so its schedule can be kept without the rest of it
+        data = league.espn_request.get_league()
+        preloaded = {'league': data}
+        if not self.fetch_players:
+            preloaded['players'] = []
+        if not self.fetch_pro_schedule:
+            preloaded['pro_schedule'] = {}
+        league.espn_request.preload(preloaded)
+        league.fetch_league()
+        self._schedules[year] = data.get('schedule', [])
+        # sports that do not load these on construction should still get real data later
+        league.espn_request.clear_preloaded()
+        return league
+
+    def _build_indexes(self):
+        self.team_names = {}
+        self.records = {}
+        self.head_to_head = {}
+        self.championships = {}
+        self.drafts = {}
+
+        player_names = {}
+        for season, league in self.seasons.items():
+            for team in league.teams:
+                self.team_names[team.team_id] = team.team_name
+                self.records.setdefault(team.team_id, dict(_empty_record(), seasons=0, playoff_wins=0, playoff_losses=0))['seasons'] += 1
+                if team.final_standing == 1:
+                    self.championships.setdefault(team.team_id, []).append(season)
+                for player in getattr(team, 'roster', []):
+                    player_names.setdefault(player.playerId, player.name)
+
+            for matchup in self._schedules.get(season, []):
+                self._add_matchup(matchup)
+
+        # seasons loaded without the player pool only know rostered players by name
+        for season, league in self.seasons.items():
+            for pick in league.draft:
+                if not pick.playerName and pick.playerId in player_names:
+                    pick.playerName = player_names[pick.playerId]
+            self.drafts[season] = league.draft
+
+    def _add_matchup(self, matchup: Dict):
+        home = matchup.get('home', {})
+        away = matchup.get('away', {})
+        winner = matchup.get('winner')
+        # byes and unplayed matchups
+        if winner not in DECIDED or 'teamId' not in home or 'teamId' not in away:
+            return
+        playoff = matchup.get('playoffTierType', 'NONE') not in ('NONE', None)
+        if playoff and matchup.get('playoffTierType') != 'WINNERS_BRACKET':
+            # consolation games do not count
+            return
+
+        for side, other, side_name in ((home, away, 'HOME'), (away, home, 'AWAY')):
+            team_id = side['teamId']
+            opponent_id = other['teamId']
+            points_for = side.get('totalPoints', 0)
+            points_against = other.get('totalPoints', 0)
+            h2h = self.head_to_head.setdefault(team_id, {}).setdefault(opponent_id, _empty_record())
+            record = self.records.setdefault(team_id, dict(_empty_record(), seasons=0, playoff_wins=0, playoff_losses=0))
+
+            if winner == 'TIE':
+                result = 'ties'
+            else:
+                result = 'wins' if winner == side_name else 'losses'
+            for totals in (h2h, record):
+                totals[result] += 1
+                totals['points_for'] += points_for
+                totals['points_against'] += points_against
+            if playoff and result != 'ties':
+                record['playoff_' + result] += 1
+
+    def all_time_standings(self) -> List[Dict]:
+        '''Teams sorted by all-time win percentage, each with its record and championship count'''
+        standings = []
+        for team_id, record in self.records.items():
+            games = record['wins'] + record['losses'] + record['ties']
+            standings.append(dict(record,
+                                  team_id=team_id,
+                                  team_name=self.team_names.get(team_id, ''),
+                                  win_pct=(record['wins'] + 0.5 * record['ties']) / games if games else 0,
+                                  championships=len(self.championships.get(team_id, []))))
+        return sorted(standings, key=lambda x: (x['win_pct'], x['points_for']), reverse=True)
+
+    def head_to_head_record(self, team_id: int, opponent_id: int) -> Dict:
+        '''All-time record of team_id against opponent_id'''
+        return dict(self.head_to_head.get(team_id, {}).get(opponent_id, _empty_record()))
+
+    def team_draft_history(self, team_id: int) -> Dict[int, List[BasePick]]:
+        '''Draft picks made by team_id, by season'''
+        return {season: [pick for pick in picks if pick.team and pick.team.team_id == team_id]
+                for season, picks in self.drafts.items()}
@@ -2,7 +2,7 @@ import datetime
 import time
 import json
 import math
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union
 import pdb
 
 from ..base_league import BaseLeague
@@ -15,11 +15,13 @@ from .constant import POSITION_MAP, ACTIVITY_MAP
 
 class League(BaseLeague):
     '''Creates a League instance for Public/Private ESPN league'''
+    _positions = POSITION_MAP
+    _player_class = Player
 
     ScoreTypes = {'H2H_CATEGORY': H2HCategoryBoxScore, 'H2H_POINTS': H2HPointsBoxScore}
 
-    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False):
-        super().__init__(league_id=league_id, year=year, sport='mlb', espn_s2=espn_s2, swid=swid, debug=debug)
+    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False, transport=None, keep_payloads=False):
+        super().__init__(league_id=league_id, year=year, sport='mlb', espn_s2=espn_s2, swid=swid, debug=debug, transport=transport, keep_payloads=keep_payloads)
 
         self._set_scoring_class = lambda scoring_type: League.ScoreTypes.get(scoring_type, BoxScore)
 
@@ -87,17 +89,10 @@ class League(BaseLeague):
         if self.year < 2019:
             raise Exception('Cant use recent activity before 2019')
 
-        msg_types = [178,180,179,239,181,244]
+        msg_types = self.ACTIVITY_MSG_TYPES
         if msg_type in ACTIVITY_MAP:
             msg_types = [ACTIVITY_MAP[msg_type]]
-        params = {
-            'view': 'kona_league_communication'
-        }
-
-        filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
-        data = data['topics']
+        data = self._get_activity_topics(size=size, offset=offset, msg_types=msg_types)
         activity = [Activity(topic, self.player_map, self.get_team_data) for topic in data]
 
         return activity
@@ -117,16 +112,7 @@ class League(BaseLeague):
         if position_id:
             slot_filter.append(position_id)
 
-
-        params = {
-            'view': 'kona_player_info',
-            'scoringPeriodId': week,
-        }
-        filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-
-        data = self.espn_request.league_get(params=params, headers=headers)
-        players = data['players']
+        players = self._get_free_agents_page(week, size, 0, slot_filter)
 
         return [Player(player, self.year) for player in players]
 
@@ -135,6 +121,27 @@ class League(BaseLeague):
         if self.year < 2019:
             raise Exception('Cant use box score before 2019')
 
+        (matchup_id, scoring_id) = self._box_score_periods(matchup_period, scoring_period)
+        schedule = self._get_box_score_schedule(matchup_id, scoring_id)
+        pro_schedule = self._get_pro_schedule(scoring_id)
+        return self._build_box_scores(schedule, pro_schedule, scoring_id)
+
+    def box_scores_range(self, start: int = 1, end: int = None, max_workers: int = 4) -> Dict[int, List[Union[BoxScore, H2HCategoryBoxScore]]]:
+        '''Returns box scores for every matchup period from start to end (default current matchup period) keyed by matchup period\n
+        Matchup periods are fetched concurrently and shared data is only downloaded once'''
+        if self.year < 2019:
+            raise Exception('Cant use box score before 2019')
+        end = min(end or self.currentMatchupPeriod, self.currentMatchupPeriod)
+        matchup_periods = list(range(max(start, 1), end + 1))
+        periods = [self._box_score_periods(matchup_period=matchup_period) for matchup_period in matchup_periods]
+
+        schedules = self._map_concurrently(lambda period: self._get_box_score_schedule(*period), periods, max_workers=max_workers)
+        pro_schedule = self.espn_request.get_pro_schedule() if matchup_periods else {}
+        return {matchup_id: self._build_box_scores(schedule, self._pro_schedule_for_period(pro_schedule, scoring_id), scoring_id)
+                for (matchup_id, scoring_id), schedule in zip(periods, schedules)}
+
+    def _box_score_periods(self, matchup_period: int = None, scoring_period: int = None) -> Tuple[int, int]:
+        '''Returns (matchup period, scoring period) for box scores, defaults to the current ones'''
         matchup_id = self.currentMatchupPeriod
         scoring_id = self.current_week
         if matchup_period and scoring_period:
@@ -142,7 +149,9 @@ class League(BaseLeague):
             scoring_id = scoring_period
         elif matchup_period and matchup_period < matchup_id:
             matchup_id = matchup_period
+        return (matchup_id, scoring_id)
 
+    def _get_box_score_schedule(self, matchup_id: int, scoring_id: int) -> List[dict]:
         params = {
             'view': ['mMatchupScore', 'mScoreboard'],
             'scoringPeriodId': scoring_id
@@ -151,9 +160,9 @@ class League(BaseLeague):
         filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_id]}}}
         headers = {'x-fantasy-filter': json.dumps(filters)}
         data = self.espn_request.league_get(params=params, headers=headers)
-        pro_schedule = self._get_pro_schedule(scoring_id)
+        return data['schedule']
 
-        schedule = data['schedule']
+    def _build_box_scores(self, schedule: List[dict], pro_schedule, scoring_id: int) -> List[Union[BoxScore, H2HCategoryBoxScore]]:
         box_data = [self._box_score_class(matchup, pro_schedule, self.year, scoring_id) for matchup in schedule]
 
         for team in self.teams:
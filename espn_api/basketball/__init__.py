@@ -1,10 +1,12 @@
 __all__ = ['League',
+           'LeagueHistory',
            'Team',
            'Player',
            'Matchup',
            ]
 
 from .league import League
+from .league_history import LeagueHistory
 from .team import Team
 from .player import Player
 from .matchup import Matchup
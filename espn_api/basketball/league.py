@@ -1,5 +1,5 @@
 import json
-from typing import List, Set, Union
+from typing import Dict, List, Set, Tuple, Union
 
 from ..base_league import BaseLeague
 from .team import Team
@@ -13,8 +13,13 @@ from .constant import POSITION_MAP, ACTIVITY_MAP, TRANSACTION_TYPES
 class League(BaseLeague):
     teams: List[Team]
     '''Creates a League instance for Public/Private ESPN league'''
-    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False):
-        super().__init__(league_id=league_id, year=year, sport='nba', espn_s2=espn_s2, swid=swid, debug=debug)
+    _positions = POSITION_MAP
+    _player_class = Player
+    # activity message types of recent_activity, includes moved players
+    ACTIVITY_MSG_TYPES = [178,180,179,239,181,244,188]
+
+    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False, transport=None, keep_payloads=False):
+        super().__init__(league_id=league_id, year=year, sport='nba', espn_s2=espn_s2, swid=swid, debug=debug, transport=transport, keep_payloads=keep_payloads)
 
         if fetch_league:
             self.fetch_league()
@@ -90,17 +95,10 @@ class League(BaseLeague):
         if self.year < 2019:
             raise Exception('Cant use recent activity before 2019')
 
-        msg_types = [178,180,179,239,181,244,188]
+        msg_types = self.ACTIVITY_MSG_TYPES
         if msg_type in ACTIVITY_MAP:
             msg_types = [ACTIVITY_MAP[msg_type]]
-        params = {
-            'view': 'kona_league_communication'
-        }
-
-        filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
-        data = data['topics']
+        data = self._get_activity_topics(size=size, offset=offset, msg_types=msg_types)
         activity = [Activity(topic, self.player_map, self.get_team_data, include_moved=include_moved) for topic in data]
 
         return activity
@@ -113,15 +111,7 @@ class League(BaseLeague):
         if types > TRANSACTION_TYPES:
             raise Exception('Invalid transaction type')
 
-        params = {
-            'view': 'mTransactions2',
-            'scoringPeriodId': scoring_period,
-        }
-
-        filters = {"transactions":{"filterType":{"value":list(types)}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-
-        data = self.espn_request.league_get(params=params, headers=headers)
+        data = self._get_transactions_data(scoring_period, types)
         transactions = data['transactions']
 
         return [Transaction(transaction, self.player_map, self.get_team_data) for transaction in transactions]
@@ -141,16 +131,7 @@ class League(BaseLeague):
         if position_id:
             slot_filter.append(position_id)
 
-
-        params = {
-            'view': 'kona_player_info',
-            'scoringPeriodId': week,
-        }
-        filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-
-        data = self.espn_request.league_get(params=params, headers=headers)
-        players = data['players']
+        players = self._get_free_agents_page(week, size, 0, slot_filter)
 
         return [Player(player, self.year) for player in players]
 
@@ -159,6 +140,26 @@ class League(BaseLeague):
         if self.year < 2019:
             raise Exception('Cant use box score before 2019')
 
+        (matchup_id, scoring_id) = self._box_score_periods(matchup_period, scoring_period)
+        schedule = self._get_box_score_schedule(matchup_id, scoring_id)
+        pro_schedule = self.pro_schedule
+        return self._build_box_scores(schedule, pro_schedule, scoring_id, matchup_total)
+
+    def box_scores_range(self, start: int = 1, end: int = None, matchup_total: bool = True, max_workers: int = 4) -> Dict[int, List[BoxScore]]:
+        '''Returns box scores for every matchup period from start to end (default current matchup period) keyed by matchup period\n
+        Matchup periods are fetched concurrently and shared data is only downloaded once'''
+        if self.year < 2019:
+            raise Exception('Cant use box score before 2019')
+        end = min(end or self.currentMatchupPeriod, self.currentMatchupPeriod)
+        matchup_periods = list(range(max(start, 1), end + 1))
+        periods = [self._box_score_periods(matchup_period=matchup_period) for matchup_period in matchup_periods]
+
+        schedules = self._map_concurrently(lambda period: self._get_box_score_schedule(*period), periods, max_workers=max_workers)
+        return {matchup_id: self._build_box_scores(schedule, self.pro_schedule, scoring_id, matchup_total)
+                for (matchup_id, scoring_id), schedule in zip(periods, schedules)}
+
+    def _box_score_periods(self, matchup_period: int = None, scoring_period: int = None) -> Tuple[int, int]:
+        '''Returns (matchup period, scoring period) for box scores, defaults to the current ones'''
         matchup_id = self.currentMatchupPeriod
         scoring_id = self.current_week
         if matchup_period and scoring_period:
@@ -173,7 +174,9 @@ class League(BaseLeague):
                 if str(scoring_id) in self.matchup_ids[matchup]:
                     matchup_id = matchup
                     break
+        return (matchup_id, scoring_id)
 
+    def _get_box_score_schedule(self, matchup_id: int, scoring_id: int) -> List[dict]:
         params = {
             'view': ['mMatchupScore', 'mScoreboard'],
             'scoringPeriodId': scoring_id
@@ -182,9 +185,10 @@ class League(BaseLeague):
         filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_id]}}}
         headers = {'x-fantasy-filter': json.dumps(filters)}
         data = self.espn_request.league_get(params=params, headers=headers)
+        return data['schedule']
 
-        schedule = data['schedule']
-        box_data = [self.BoxScoreClass(matchup, self.pro_schedule, matchup_total, self.year, scoring_id) for matchup in schedule]
+    def _build_box_scores(self, schedule: List[dict], pro_schedule, scoring_id: int, matchup_total: bool = True) -> List[BoxScore]:
+        box_data = [self.BoxScoreClass(matchup, pro_schedule, matchup_total, self.year, scoring_id) for matchup in schedule]
 
         for team in self.teams:
             for matchup in box_data:
@@ -197,21 +201,13 @@ class League(BaseLeague):
     def player_info(self, name: str = None, playerId: Union[int, list] = None, include_news = False) -> Union[Player, List[Player]]:
         ''' Returns Player class if name found '''
 
-        if name:
-            playerId = self.player_map.get(name)
-        if playerId is None or isinstance(playerId, str):
+        cards = self._player_card_data(name, playerId)
+        if not cards:
             return None
-        if not isinstance(playerId, list):
-            playerId = [playerId]
-
-        data = self.espn_request.get_player_card(playerId, self.finalScoringPeriod)
 
         if include_news:
-            news = {}
-            for id in playerId:
-                news[id] = self.espn_request.get_player_news(id)
-
-        if len(data['players']) == 1:
-            return Player(data['players'][0], self.year, self.pro_schedule, news=news.get(playerId[0], []) if include_news else None)
-        if len(data['players']) > 1:
-            return [Player(player, self.year, self.pro_schedule, news=news.get(player['id'], []) if include_news else None) for player in data['players']]
\ No newline at end of file
+            news = self.player_news([card['id'] for card in cards])
+
+        if len(cards) == 1:
+            return Player(cards[0], self.year, self.pro_schedule, news=news.get(cards[0]['id'], []) if include_news else None)
+        return [Player(player, self.year, self.pro_schedule, news=news.get(player['id'], []) if include_news else None) for player in cards]
\ No newline at end of file
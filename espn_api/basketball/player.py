@@ -1,5 +1,5 @@
 from .constant import NINE_CAT_STATS, POSITION_MAP, PRO_TEAM_MAP, STATS_MAP, STAT_ID_MAP
-from espn_api.utils.utils import json_parsing
+from espn_api.utils.utils import json_parsing, news_items
 from datetime import datetime
 from functools import cached_property
 
@@ -31,15 +31,7 @@ class Player(object):
                 self.schedule[key] = { 'team': PRO_TEAM_MAP[team], 'date': datetime.fromtimestamp(game['date']/1000.0) }
 
         if news:
-            news_feed = news.get("news", {}).get("feed", [])
-            self.news = [
-                {
-                    "published": item.get("published", ""),
-                    "headline": item.get("headline", ""),
-                    "story": item.get("story", "")
-                }
-                for item in news_feed
-            ]
+            self.news = news_items(news)
 
         # add available stats
 
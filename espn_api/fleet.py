@@ -0,0 +1,162 @@
+import importlib
+import threading
+from http.cookiejar import DefaultCookiePolicy
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .requests.shared_payloads import SharedPayloads
+from .requests.throttle import RequestThrottle, throttle
+from .requests.transport import LiveTransport
+
+# sport -> package of its League class
+SPORT_PACKAGES = {
+    'nfl': 'football',
+    'nba': 'basketball',
+    'nhl': 'hockey',
+    'mlb': 'baseball',
+    'wnba': 'wbasketball',
+}
+
+
+class FleetEntry(NamedTuple):
+    sport: str
+    league_id: int
+    year: int
+    cookies: Optional[Dict[str, str]] = None
+
+    @property
+    def key(self) -> Tuple[str, int, int]:
+        '''(sport, league_id, year), entries are compared without their cookies'''
+        return (self.sport, self.league_id, self.year)
+
+
+class FleetResult(NamedTuple):
+    '''Outcome of one league, error is set instead of value when building the league or the work failed'''
+    entry: FleetEntry
+    league: Any
+    value: Any
+    error: Optional[BaseException]
+    seconds: float
+
+
+def league_class(sport: str):
+    '''League class of a sport (nfl, nba, nhl, mlb, wnba), the sport package is imported on first use'''
+    if sport not in SPORT_PACKAGES:
+        raise Exception(f'Unknown sport: {sport}, available options are {list(SPORT_PACKAGES)}')
+    return importlib.import_module(f'espn_api.{SPORT_PACKAGES[sport]}').League
+
+
+def shared_session(pool_size: int) -> requests.Session:
+    '''Session for the leagues of a fleet: pool_size kept alive connections per host and no
+    cookie jar, cookies are sent per request so one leagues cookies never reach another'''
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _entry(entry: Union[FleetEntry, tuple, dict]) -> FleetEntry:
+    if isinstance(entry, dict):
+        return FleetEntry(**entry)
+    return FleetEntry(*entry)
+
+
+class LeagueFleet(object):
+    '''Runs work over many leagues on one worker pool
+
+    Entries are (sport, league_id, year, cookies) with cookies None or a dict holding
+    espn_s2 and SWID. Leagues are built on first use and kept. Every request goes through
+    one pooled LiveTransport, so connections to ESPN are reused across leagues, and the
+    process wide throttle, unless requests_per_second gives the fleet its own rate budget.
+    Leagues using a transport of the transport callable bring their own throttle. Player pools are shared through player_pools and pro schedules through one
+    SharedPayloads per fleet, so each is downloaded once per sport and year.'''
+    def __init__(self, entries: Iterable[Union[FleetEntry, tuple, dict]], max_workers: int = 8,
+                 requests_per_second: float = None, pro_schedule_ttl: float = 10 * 60,
+                 transport: Callable[[FleetEntry], Any] = None):
+        self.entries: List[FleetEntry] = [_entry(entry) for entry in entries]
+        self.max_workers = max_workers
+        # entry -> transport of its league, the shared live transport by default
+        self.transport = transport
+        # the leagues of other fleets and Leagues keep the process wide budget
+        self.throttle = throttle if requests_per_second is None else RequestThrottle(requests_per_second=requests_per_second)
+        self.live_transport = LiveTransport(session=shared_session(max(10, max_workers)), throttle=self.throttle)
+        self.shared_payloads = SharedPayloads(ttl=pro_schedule_ttl)
+        self._leagues: Dict[Tuple[str, int, int], Any] = {}
+        self._locks: Dict[Tuple[str, int, int], threading.Lock] = {entry.key: threading.Lock() for entry in self.entries}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def league(self, entry: Union[FleetEntry, tuple, dict]):
+        '''The League of an entry, built (and fetched) on first use'''
+        entry = _entry(entry)
+        league = self._leagues.get(entry.key)
+        if league is not None:
+            return league
+        with self._lock:
+            key_lock = self._locks.setdefault(entry.key, threading.Lock())
+        # one build per league, other threads wait for it
+        with key_lock:
+            league = self._leagues.get(entry.key)
+            if league is None:
+                league = self._build(entry)
+                self._leagues[entry.key] = league
+        return league
+
+    def _build(self, entry: FleetEntry):
+        cookies = entry.cookies or {}
+        transport = self.transport(entry) if self.transport else self.live_transport
+        league = league_class(entry.sport)(league_id=entry.league_id, year=entry.year, espn_s2=cookies.get('espn_s2'),
+                                           swid=cookies.get('SWID', cookies.get('swid')), fetch_league=False, transport=transport)
+        league.espn_request.shared_payloads = self.shared_payloads
+        league.fetch_league()
+        return league
+
+    def map(self, fn: Callable[[Any], Any] = None, entries: Iterable = None) -> Iterator[FleetResult]:
+        '''Calls fn(league) for every league on the worker pool, yielding results as they complete
+
+        Leagues are built first when needed. A failing league gives a result with error set,
+        the others keep running. Without fn the results hold the leagues themselves.'''
+        entries = self.entries if entries is None else [_entry(entry) for entry in entries]
+        if not entries:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(entries)))) as executor:
+            futures = [executor.submit(self._run, entry, fn) for entry in entries]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                # a caller that stopped iterating does not wait for leagues that have not started
+                for future in futures:
+                    future.cancel()
+
+    def _run(self, entry: FleetEntry, fn: Optional[Callable[[Any], Any]]) -> FleetResult:
+        start = time.perf_counter()
+        league = None
+        try:
+            league = self.league(entry)
+            value = fn(league) if fn else league
+        except Exception as e:
+            return FleetResult(entry, league, None, e, time.perf_counter() - start)
+        return FleetResult(entry, league, value, None, time.perf_counter() - start)
+
+    def leagues(self) -> Iterator[FleetResult]:
+        '''Builds every league, yielding them as they are ready'''
+        return self.map()
+
+    def refresh(self) -> Iterator[FleetResult]:
+        '''Refreshes every built league (football refresh, fetch_league for the other sports)'''
+        def refresh(league):
+            return league.refresh() if hasattr(league, 'refresh') else league.fetch_league()
+        return self.map(refresh, [entry for entry in self.entries if entry.key in self._leagues])
+
+    def run(self, fn: Callable[[Any], Any]) -> Dict[Tuple[str, int, int], FleetResult]:
+        '''map() collected into (sport, league_id, year) -> result'''
+        return {result.entry.key: result for result in self.map(fn)}
@@ -1,12 +1,33 @@
 __all__ = ['League',
+           'LeagueHistory',
+           'LiveScoring',
            'Team',
            'Matchup',
            'Player',
            'BoxPlayer'
            ]
 
-from .league import League
-from .team import Team
-from .matchup import Matchup
-from .player import Player
-from .box_player import BoxPlayer
\ No newline at end of file
+import importlib
+
+# name -> submodule, loaded on first access so importing the package only loads what is used
+_EXPORTS = {
+    'League': 'league',
+    'LeagueHistory': 'league_history',
+    'LiveScoring': 'live_scoring',
+    'Team': 'team',
+    'Matchup': 'matchup',
+    'Player': 'player',
+    'BoxPlayer': 'box_player',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module('.' + _EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
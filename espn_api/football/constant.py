@@ -43,6 +43,16 @@ POSITION_MAP = {
     'HC': 19
 }
 
+# position -> defaultPositionId used as key of mPositionalRatings
+POSITIONAL_RATINGS_POSITION_MAP = {
+    'QB': '1',
+    'RB': '2',
+    'WR': '3',
+    'TE': '4',
+    'K': '5',
+    'D/ST': '16',
+}
+
 PRO_TEAM_MAP = {
     0 : 'None',
     1 : 'ATL',
@@ -1,6 +1,7 @@
+import hashlib
 import json
 import random
-from typing import Callable, Dict, List, Set, Tuple, Union
+from typing import Dict, List, Set, Tuple, Union
 
 from ..base_league import BaseLeague
 from .team import Team
@@ -26,8 +27,16 @@ from .helper import (
 
 class League(BaseLeague):
     '''Creates a League instance for Public/Private ESPN league'''
-    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False):
-        super().__init__(league_id=league_id, year=year, sport='nfl', espn_s2=espn_s2, swid=swid, debug=debug)
+    _positions = POSITION_MAP
+    _player_class = Player
+    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False, transport=None, keep_payloads=False):
+        super().__init__(league_id=league_id, year=year, sport='nfl', espn_s2=espn_s2, swid=swid, debug=debug, transport=transport, keep_payloads=keep_payloads)
+        # scoring period -> positional ratings, see positional_ratings
+        self._positional_ratings = {}
+        # league payload the teams were built from
+        self._teams_payload = None
+        # team id -> fingerprints of its record, roster and schedule, see refresh
+        self._team_fingerprints = {}
 
         if fetch_league:
             self.fetch_league()
@@ -43,31 +52,144 @@ class League(BaseLeague):
         self._fetch_teams(data)
         super()._fetch_draft()
 
-    def _fetch_teams(self, data):
+    def _fetch_teams(self, data, pro_schedule_data=None):
         '''Fetch teams in league'''
-        pro_schedule = self._get_all_pro_schedule()
+        pro_schedule = self._get_all_pro_schedule(pro_schedule_data)
         super()._fetch_teams(data, TeamClass=Team, pro_schedule=pro_schedule)
+        self._teams_payload = data
+        self._team_fingerprints = self._fingerprint_teams(data)
 
-        # replace opponentIds in schedule with team instances
+        teams_by_id = {team.team_id: team for team in self.teams}
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup == opponent.team_id:
-                        team.schedule[week] = opponent
-
-        # calculate margin of victory
+            self._link_schedule(team, teams_by_id)
         for team in self.teams:
-            for week, opponent in enumerate(team.schedule):
-                mov = team.scores[week] - opponent.scores[week]
-                team.mov.append(mov)
+            self._calculate_mov(team)
+
+    def _link_schedule(self, team: Team, teams_by_id: Dict[int, Team]):
+        '''Replaces opponentIds in the teams schedule with team instances'''
+        team.schedule = [teams_by_id.get(opponent, opponent) for opponent in team.schedule]
+
+    def _calculate_mov(self, team: Team):
+        '''Margin of victory for every week of the teams schedule'''
+        team.mov = [team.scores[week] - opponent.scores[week] for week, opponent in enumerate(team.schedule)]
+
+    def _fingerprint_teams(self, data) -> Dict[int, Dict[str, str]]:
+        '''Hashes of each teams raw record (with owners), roster entries and schedule matchups'''
+        def digest(value) -> str:
+            return hashlib.blake2b(json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8'), digest_size=16).hexdigest()
+
+        schedules = {}
+        for matchup in data['schedule']:
+            for side in ('home', 'away'):
+                team_id = matchup.get(side, {}).get('teamId')
+                if team_id is not None:
+                    schedules.setdefault(team_id, []).append(matchup)
+
+        members = data.get('members', [])
+        fingerprints = {}
+        for team in data['teams']:
+            record = {key: value for key, value in team.items() if key != 'roster'}
+            owners = [member for member in members if member.get('id') in team.get('owners', [])]
+            fingerprints[team['id']] = {
+                'team': digest([record, owners]),
+                'roster': digest(team.get('roster', {})),
+                'schedule': digest(schedules.get(team['id'], [])),
+            }
+        return fingerprints
+
+    def _refresh_teams(self, data, pro_schedule_data=None) -> Dict[str, List[Team]]:
+        '''Rebuilds only the parts of teams whose fingerprints changed, unchanged Team and Player objects are kept'''
+        fingerprints = self._fingerprint_teams(data)
+        changes = {'teams': [], 'rosters': [], 'schedules': []}
+        if set(fingerprints) != set(self._team_fingerprints):
+            # teams were added or removed
+            self._fetch_teams(data, pro_schedule_data)
+            return {part: list(self.teams) for part in changes}
+
+        previous_pro_schedule = self._all_pro_schedule
+        pro_schedule = self._get_all_pro_schedule(pro_schedule_data)
+        # a deep equality check, cheap for an unchanged (cached) payload: its game dicts are the
+        # same objects as last time and == skips comparing identical objects
+        pro_schedule_changed = pro_schedule != previous_pro_schedule
+        members = data.get('members', [])
+        teams_by_id = {team.team_id: team for team in self.teams}
+
+        for team_data in data['teams']:
+            team = teams_by_id[team_data['id']]
+            new = fingerprints[team.team_id]
+            old = self._team_fingerprints[team.team_id]
+
+            if new['team'] != old['team']:
+                owners = [member for member in members if member.get('id') in team_data.get('owners', [])]
+                record = Team(team_data, roster={}, schedule=[], year=data['seasonId'], owners=owners)
+                for name, value in vars(record).items():
+                    if name not in ('roster', 'schedule', 'scores', 'outcomes', 'mov'):
+                        setattr(team, name, value)
+                team.division_name = self.settings.division_map.get(team.division_id, '')
+                changes['teams'].append(team)
+
+            if new['roster'] != old['roster'] or pro_schedule_changed:
+                team._fetch_roster(team_data.get('roster', {}), data['seasonId'], pro_schedule)
+                changes['rosters'].append(team)
+
+            if new['schedule'] != old['schedule']:
+                (team.schedule, team.scores, team.outcomes) = ([], [], [])
+                team._fetch_schedule(data['schedule'])
+                self._link_schedule(team, teams_by_id)
+                changes['schedules'].append(team)
+
+        # an opponents new score changes this teams margin of victory too, both schedules changed then
+        for team in changes['schedules']:
+            self._calculate_mov(team)
+
+        self._teams_payload = data
+        self._team_fingerprints = fingerprints
+        return changes
+
+    def positional_ratings(self, week: int = None, refresh: bool = False) -> Dict[str, Dict[str, int]]:
+        '''Returns {defaultPositionId: {proTeamId: rank}} for a scoring period (default current week)\n
+        Ratings are fetched once per scoring period, past weeks never change so only the current
+        and future weeks are fetched again after refresh() or with refresh=True'''
+        if not week:
+            week = self.current_week
+        if refresh and week >= self.current_week:
+            self._positional_ratings.pop(week, None)
+        if week not in self._positional_ratings:
+            self._positional_ratings[week] = self._fetch_positional_ratings(week)
+        return self._positional_ratings[week]
+
+    def prefetch_positional_ratings(self, weeks: List[int] = None, max_workers: int = 4) -> None:
+        '''Fetches positional ratings for weeks (default every week up to the current one) concurrently'''
+        if weeks is None:
+            weeks = range(1, self.current_week + 1)
+        missing = [week for week in weeks if week not in self._positional_ratings]
+        for week, ratings in zip(missing, self._map_concurrently(self._fetch_positional_ratings, missing, max_workers=max_workers)):
+            self._positional_ratings[week] = ratings
 
     def _get_positional_ratings(self, week: int):
+        return self.positional_ratings(week)
+
+    def _fetch_positional_ratings(self, week: int):
         params = {
             'view': 'mPositionalRatings',
             'scoringPeriodId': week,
         }
         data = self.espn_request.league_get(params=params)
+        return self._parse_positional_ratings(data)
+
+    def _league_get_with_ratings(self, week: int, views: List[str], params: dict = None, headers: dict = None) -> Tuple[dict, Dict]:
+        '''league_get of views for a scoring period, the weeks positional ratings are
+        requested in the same call unless cached. Returns (data, positional ratings)'''
+        plan = self.espn_request.plan()
+        request = plan.add(views, params=dict(params or {}, scoringPeriodId=week), headers=headers)
+        ratings_request = None if week in self._positional_ratings else plan.add('mPositionalRatings', params={'scoringPeriodId': week})
+        plan.execute()
+        if ratings_request is not None:
+            self._positional_ratings[week] = self._parse_positional_ratings(ratings_request.response)
+        return (request.response, self._positional_ratings[week])
+
+    def _parse_positional_ratings(self, data: dict) -> Dict[str, Dict[str, int]]:
         ratings = data.get('positionAgainstOpponent', {}).get('positionalRatings', {})
 
         positional_ratings = {}
@@ -78,12 +200,27 @@ class League(BaseLeague):
             positional_ratings[pos] = teams_rating
         return positional_ratings
 
-    def refresh(self):
-        '''Gets latest league data. This can be used instead of creating a new League class each week'''
-        data = super()._fetch_league()
+    def fetch_refresh(self) -> Tuple[dict, dict]:
+        '''Fetches the league and pro schedule payloads of a refresh without changing the league\n
+        Pass them to refresh() to apply them, e.g. to fetch while the league is still in use'''
+        return (self.espn_request.get_league(), self.espn_request.get_pro_schedule())
+
+    def refresh(self, fetched: Tuple[dict, dict] = None) -> Dict[str, List[Team]]:
+        '''Gets latest league data. This can be used instead of creating a new League class each week\n
+        Only teams whose record, roster or schedule changed are updated, in place. Returns the
+        changed teams: {'teams': [...], 'rosters': [...], 'schedules': [...]}\n
+        fetched: payloads from fetch_refresh() to apply instead of fetching them now'''
+        (league_data, pro_schedule_data) = fetched or (None, None)
+        data = super()._fetch_league(data=league_data)
+        # ESPN answered 304 or the same body (see response_cache.py), teams are already up to date
+        if data is self._teams_payload:
+            return {'teams': [], 'rosters': [], 'schedules': []}
 
         self.nfl_week = data['status']['latestScoringPeriod']
-        self._fetch_teams(data)
+        changes = self._refresh_teams(data, pro_schedule_data)
+        # ratings of weeks still in progress may have changed
+        self._positional_ratings = {week: ratings for week, ratings in self._positional_ratings.items() if week < self.current_week}
+        return changes
 
     def refresh_draft(self, refresh_players=False, refresh__teams=False):
         super()._fetch_draft()
@@ -107,6 +244,10 @@ class League(BaseLeague):
         for team in self.teams:
             roster = team_roster[team.team_id]
             team._fetch_roster(roster, self.year)
+        # rosters no longer match the league payload, the next refresh rebuilds them
+        self._teams_payload = None
+        for fingerprints in self._team_fingerprints.values():
+            fingerprints['roster'] = None
 
     def standings(self) -> List[Team]:
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
@@ -255,17 +396,10 @@ class League(BaseLeague):
         if self.year < 2019:
             raise Exception('Cant use recent activity before 2019')
 
-        msg_types = [178,180,179,239,181,244]
+        msg_types = self.ACTIVITY_MSG_TYPES
         if msg_type in ACTIVITY_MAP:
             msg_types = [ACTIVITY_MAP[msg_type]]
-        params = {
-            'view': 'kona_league_communication'
-        }
-
-        filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
-        data = data['topics']
+        data = self._get_activity_topics(size=size, offset=offset, msg_types=msg_types)
         activity = [Activity(topic, self.player_map, self.get_team_data, self.player_info) for topic in data]
 
         return activity
@@ -297,6 +431,30 @@ class League(BaseLeague):
         Should only be used with most recent season'''
         if self.year < 2019:
             raise Exception('Cant use box score before 2019')
+        (matchup_period, scoring_period) = self._box_score_periods(week)
+        (schedule, positional_rankings) = self._get_box_score_data(matchup_period, scoring_period)
+        pro_schedule = self._get_pro_schedule(scoring_period)
+        return self._build_box_scores(schedule, pro_schedule, positional_rankings, scoring_period)
+
+    def box_scores_range(self, start: int = 1, end: int = None, max_workers: int = 4) -> Dict[int, List[BoxScore]]:
+        '''Returns box scores for every week from start to end (default current week) keyed by week\n
+        Weeks are fetched concurrently and the pro schedule is only downloaded once'''
+        if self.year < 2019:
+            raise Exception('Cant use box score before 2019')
+        end = min(end or self.current_week, self.current_week)
+        weeks = list(range(max(start, 1), end + 1))
+
+        def fetch_week(week):
+            (matchup_period, scoring_period) = self._box_score_periods(week)
+            return self._get_box_score_data(matchup_period, scoring_period)
+
+        week_data = self._map_concurrently(fetch_week, weeks, max_workers=max_workers)
+        pro_schedule = self.espn_request.get_pro_schedule() if weeks else {}
+        return {week: self._build_box_scores(schedule, self._pro_schedule_for_period(pro_schedule, week), positional_rankings, week)
+                for week, (schedule, positional_rankings) in zip(weeks, week_data)}
+
+    def _box_score_periods(self, week: int = None) -> Tuple[int, int]:
+        '''Returns (matchup period, scoring period) of a week, defaults to the current week'''
         matchup_period = self.currentMatchupPeriod
         scoring_period = self.current_week
         if week and week <= self.current_week:
@@ -305,19 +463,16 @@ class League(BaseLeague):
               if week in self.settings.matchup_periods[matchup_id]:
                 matchup_period = matchup_id
                 break
+        return (matchup_period, scoring_period)
 
-        params = {
-            'view': ['mMatchupScore', 'mScoreboard'],
-            'scoringPeriodId': scoring_period,
-        }
-
+    def _get_box_score_data(self, matchup_period: int, scoring_period: int) -> Tuple[List[dict], Dict]:
+        '''Returns (schedule, positional ratings) of a week from a single request'''
         filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_period]}}}
         headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(params=params, headers=headers)
+        (data, positional_rankings) = self._league_get_with_ratings(scoring_period, ['mMatchupScore', 'mScoreboard'], headers=headers)
+        return (data['schedule'], positional_rankings)
 
-        schedule = data['schedule']
-        pro_schedule = self._get_pro_schedule(scoring_period)
-        positional_rankings = self._get_positional_ratings(scoring_period)
+    def _build_box_scores(self, schedule: List[dict], pro_schedule, positional_rankings, scoring_period: int) -> List[BoxScore]:
         box_data = [BoxScore(matchup, pro_schedule, positional_rankings, scoring_period, self.year) for matchup in schedule]
 
         for team in self.teams:
@@ -365,37 +520,27 @@ class League(BaseLeague):
             slot_filter.append(position_id)
 
 
-        params = {
-            'view': 'kona_player_info',
-            'scoringPeriodId': week,
-        }
-        filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json.dumps(self._free_agents_filter(size, slot_filter))}
 
-        data = self.espn_request.league_get(params=params, headers=headers)
+        (data, positional_rankings) = self._league_get_with_ratings(week, ['kona_player_info'], headers=headers)
 
         players = data['players']
         pro_schedule = self._get_pro_schedule(week)
-        positional_rankings = self._get_positional_ratings(week)
 
         return [BoxPlayer(player, pro_schedule, positional_rankings, week, self.year) for player in players]
 
     def player_info(self, name: str = None, playerId: Union[int, list] = None) -> Union[Player, List[Player]]:
         ''' Returns Player class if name found '''
 
-        if name:
-            playerId = self.player_map.get(name)
-        if playerId is None or isinstance(playerId, str):
+        cards = self._player_card_data(name, playerId)
+        if not cards:
             return None
-        if not isinstance(playerId, list):
-            playerId = [playerId]
-
-        data = self.espn_request.get_player_card(playerId, self.finalScoringPeriod)
-        pro_schedule = self._get_all_pro_schedule()
-        if len(data['players']) == 1:
-            return Player(data['players'][0], self.year, pro_schedule)
-        if len(data['players']) > 1:
-            return [Player(player, self.year, pro_schedule) for player in data['players']]
+        pro_schedule = self._all_pro_schedule
+        if pro_schedule is None:
+            pro_schedule = self._get_all_pro_schedule()
+        if len(cards) == 1:
+            return Player(cards[0], self.year, pro_schedule)
+        return [Player(player, self.year, pro_schedule) for player in cards]
 
     def message_board(self, msg_types: List[str] = None):
         ''' Returns a list of league messages'''
@@ -417,15 +562,7 @@ class League(BaseLeague):
         if types > TRANSACTION_TYPES:
             raise Exception('Invalid transaction type')
 
-        params = {
-            'view': 'mTransactions2',
-            'scoringPeriodId': scoring_period,
-        }
-
-        filters = {"transactions":{"filterType":{"value":list(types)}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-
-        data = self.espn_request.league_get(params=params, headers=headers)
+        data = self._get_transactions_data(scoring_period, types)
         if 'transactions' not in data:
             raise Exception('No transactions found')
         transactions = data['transactions']
@@ -0,0 +1,166 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from .box_score import BoxScore
+
+# a game counts as in progress this long after kickoff unless its players show it finished
+GAME_LENGTH = timedelta(hours=3, minutes=30)
+
+
+def _team_id(team) -> int:
+    return getattr(team, 'team_id', team)
+
+
+class ScoreUpdate(object):
+    '''Score change of one matchup between two polls'''
+    def __init__(self, box_score: BoxScore, home_delta: float, away_delta: float, players: Dict[int, Tuple[float, float]]):
+        self.box_score = box_score
+        self.home_delta = home_delta
+        self.away_delta = away_delta
+        # playerId -> (previous points, points)
+        self.players = players
+
+    def __repr__(self):
+        return f'ScoreUpdate({self.box_score}, home:{self.home_delta:+.2f}, away:{self.away_delta:+.2f})'
+
+
+class LiveScoring(object):
+    '''Polls a weeks box scores as often as its pro games need
+
+    A matchup is polled every live_interval seconds while one of its players' games is in
+    progress, right at the next kickoff while it waits (at most idle_interval seconds apart)
+    and not at all once every game is over. All matchups come from one request, so the league
+    is polled when the first matchup is due. Unchanged box score payloads (see response_cache.py)
+    are not parsed again. Score changes are sent to the callbacks and the updates() iterator.'''
+    def __init__(self, league, week: int = None, live_interval: float = 30, idle_interval: float = 15 * 60,
+                 callbacks: List[Callable[[ScoreUpdate], None]] = None,
+                 clock: Callable[[], datetime] = datetime.now, sleep: Callable[[float], None] = time.sleep):
+        self.league = league
+        self.week = week or league.current_week
+        self.live_interval = live_interval
+        self.idle_interval = idle_interval
+        self.callbacks = list(callbacks or [])
+        self.clock = clock
+        self.sleep = sleep
+        self.box_scores: List[BoxScore] = []
+        self.polls = 0
+        # whether a game of any matchup was in progress at the last poll
+        self.live = False
+        # (home team id, away team id) -> when the matchup should be polled next, None when final
+        self._due: Dict[Tuple[int, int], Optional[datetime]] = {}
+        self._schedule = None
+        self._pro_schedule_payload = None
+        self._pro_schedule = None
+        (self._matchup_period, self._scoring_period) = league._box_score_periods(self.week)
+
+    def subscribe(self, callback: Callable[[ScoreUpdate], None]):
+        self.callbacks.append(callback)
+
+    @property
+    def finished(self) -> bool:
+        '''Whether every game of every matchup is over'''
+        return self.polls > 0 and all(due is None for due in self._due.values())
+
+    def poll(self) -> List[ScoreUpdate]:
+        '''Fetches the box scores once, returns and publishes the matchups whose scores changed'''
+        # kickoff times only change between games, the pro schedule is not re-read while they are live
+        if not self.live:
+            payload = self.league.espn_request.get_pro_schedule()
+            if payload is not self._pro_schedule_payload:
+                self._pro_schedule_payload = payload
+                self._pro_schedule = self.league._pro_schedule_for_period(payload, self._scoring_period)
+                # box scores carry the game times, build them again
+                self._schedule = None
+        (schedule, positional_rankings) = self.league._get_box_score_data(self._matchup_period, self._scoring_period)
+        self.polls += 1
+        now = self.clock()
+
+        updates = []
+        if schedule is not self._schedule:
+            self._schedule = schedule
+            box_scores = self.league._build_box_scores(schedule, self._pro_schedule, positional_rankings, self._scoring_period)
+            updates = self._diff(self.box_scores, box_scores)
+            self.box_scores = box_scores
+
+        self.live = False
+        for box_score in self.box_scores:
+            (self._due[self._key(box_score)], in_progress) = self._next_poll(box_score, now)
+            self.live = self.live or in_progress
+        for update in updates:
+            for callback in self.callbacks:
+                callback(update)
+        return updates
+
+    def next_delay(self) -> Optional[float]:
+        '''Seconds until the next poll is due, None once every game is over'''
+        if not self.polls:
+            return 0
+        due = [when for when in self._due.values() if when is not None]
+        if not due:
+            return None
+        return max(0.0, (min(due) - self.clock()).total_seconds())
+
+    def run(self, max_polls: int = None):
+        '''Polls until every game is over (or max_polls), sleeping between polls'''
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            delay = self.next_delay()
+            if delay is None:
+                return
+            if delay:
+                self.sleep(delay)
+            self.poll()
+            polls += 1
+
+    async def updates(self) -> AsyncIterator[ScoreUpdate]:
+        '''Yields score updates until every game is over, polls run in the default executor'''
+        loop = asyncio.get_running_loop()
+        while True:
+            delay = self.next_delay()
+            if delay is None:
+                return
+            if delay:
+                await asyncio.sleep(delay)
+            for update in await loop.run_in_executor(None, self.poll):
+                yield update
+
+    def _next_poll(self, box_score: BoxScore, now: datetime) -> Tuple[Optional[datetime], bool]:
+        '''When the matchup should be polled again given its players pro games, and whether one is in progress'''
+        kickoffs = []
+        for player in box_score.home_lineup + box_score.away_lineup:
+            kickoff = getattr(player, 'game_date', None)
+            if player.on_bye_week or kickoff is None:
+                continue
+            if kickoff <= now:
+                if player.game_played < 100 and now < kickoff + GAME_LENGTH:
+                    return (now + timedelta(seconds=self.live_interval), True)
+            else:
+                kickoffs.append(kickoff)
+        if not kickoffs:
+            return (None, False)
+        return (min(min(kickoffs), now + timedelta(seconds=self.idle_interval)), False)
+
+    @staticmethod
+    def _key(box_score: BoxScore) -> Tuple[int, int]:
+        return (_team_id(box_score.home_team), _team_id(box_score.away_team))
+
+    def _diff(self, previous: List[BoxScore], current: List[BoxScore]) -> List[ScoreUpdate]:
+        previous = {self._key(box_score): box_score for box_score in previous}
+        updates = []
+        for box_score in current:
+            old = previous.get(self._key(box_score))
+            old_points = {}
+            if old is not None:
+                old_points = {player.playerId: player.points for player in old.home_lineup + old.away_lineup}
+            players = {}
+            for player in box_score.home_lineup + box_score.away_lineup:
+                before = old_points.get(player.playerId, 0)
+                if player.points != before:
+                    players[player.playerId] = (before, player.points)
+            home_delta = box_score.home_score - (old.home_score if old else 0)
+            away_delta = box_score.away_score - (old.away_score if old else 0)
+            if home_delta or away_delta or players:
+                updates.append(ScoreUpdate(box_score, home_delta, away_delta, players))
+        return updates
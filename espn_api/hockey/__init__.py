@@ -1,4 +1,5 @@
 __all__ = ['League',
+           'LeagueHistory',
            'Team',
            'Player',
            'Record',
@@ -8,6 +9,7 @@ __all__ = ['League',
            ]
 
 from .league import League
+from .league_history import LeagueHistory
 from .player import Player
 from .record import Record
 from .team import Team
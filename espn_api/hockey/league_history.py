@@ -0,0 +1,7 @@
+from ..base_league_history import BaseLeagueHistory
+from .league import League
+
+
+class LeagueHistory(BaseLeagueHistory):
+    '''Every season of a league, see BaseLeagueHistory'''
+    LeagueClass = League
@@ -4,7 +4,8 @@ from .constant import POSITION_MAP, STATS_MAP, PRO_TEAM_MAP, STATS_IDENTIFIER
 
 class Player(object):
 
-    def __init__(self, data):
+    # year is taken like the players of the other sports, hockey stats are keyed without it
+    def __init__(self, data, year=None):
         self.name = json_parsing(data, 'fullName')
         self.playerId = json_parsing(data, 'id')
         self.position = POSITION_MAP.get(json_parsing(data, 'defaultPositionId') - 1
@@ -0,0 +1,88 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Tuple
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_TTL = 5 * 60  # seconds
+
+
+def batches(ids: List[int], batch_size: int) -> List[List[int]]:
+    '''Splits ids into the fewest chunks of at most batch_size, sized evenly so no request is left with a few ids'''
+    if not ids:
+        return []
+    count = math.ceil(len(ids) / batch_size)
+    size = math.ceil(len(ids) / count)
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+class PlayerCards(object):
+    '''Cache of kona_playercard entries per (player id, max scoring period, current scoring period)
+
+    get() only requests the ids that are not cached yet, split into batches of at most
+    batch_size ids (large filters get slow) which are fetched concurrently. Cards hold live
+    stats and injury status, so they expire after ttl seconds and are keyed on the scoring
+    period they were read in. Players ESPN does not return are not cached. Cached entries
+    are shared, do not modify them.'''
+    def __init__(self, espn_request, batch_size: int = DEFAULT_BATCH_SIZE, max_workers: int = 4, max_entries: int = 4096,
+                 ttl: float = DEFAULT_TTL, clock: Callable[[], float] = time.monotonic):
+        self.espn_request = espn_request
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._cards: 'OrderedDict[Tuple[int, int, int], Tuple[float, dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'requests': 0}
+
+    def get(self, player_ids: Iterable[int], scoring_period: int, current_period: int = None) -> Dict[int, dict]:
+        '''Maps each player id ESPN knows to its card with stats up to scoring_period, in the order given'''
+        player_ids = list(dict.fromkeys(player_ids))
+        cards = {}
+        now = self.clock()
+        with self._lock:
+            for player_id in player_ids:
+                key = (player_id, scoring_period, current_period)
+                entry = self._cards.get(key)
+                if entry is not None and now - entry[0] < self.ttl:
+                    self._cards.move_to_end(key)
+                    cards[player_id] = entry[1]
+            missing = [player_id for player_id in player_ids if player_id not in cards]
+            self.stats['hits'] += len(cards)
+            self.stats['misses'] += len(missing)
+
+        for card in self._fetch(missing, scoring_period, current_period):
+            cards[card['id']] = card
+        return {player_id: cards[player_id] for player_id in player_ids if player_id in cards}
+
+    def _fetch(self, player_ids: List[int], scoring_period: int, current_period: int = None) -> List[dict]:
+        chunks = batches(player_ids, self.batch_size)
+
+        def fetch(chunk):
+            return self.espn_request.get_player_card(chunk, scoring_period).get('players', [])
+
+        if len(chunks) <= 1 or self.max_workers <= 1:
+            pages = [fetch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                pages = list(executor.map(fetch, chunks))
+
+        cards = [card for page in pages for card in page]
+        fetched_at = self.clock()
+        with self._lock:
+            self.stats['requests'] += len(chunks)
+            for card in cards:
+                self._cards[(card['id'], scoring_period, current_period)] = (fetched_at, card)
+            while len(self._cards) > self.max_entries:
+                self._cards.popitem(last=False)
+        return cards
+
+    def clear(self):
+        with self._lock:
+            self._cards.clear()
+
+    def __len__(self):
+        return len(self._cards)
@@ -0,0 +1,101 @@
+import threading
+import time
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, Tuple
+
+DEFAULT_REFRESH_INTERVAL = 24 * 60 * 60  # seconds
+
+
+class PlayerPool(Mapping):
+    '''Immutable two way index of a sports pro player pool
+
+    Behaves like the player_map dict leagues have always had: player id -> full name
+    and full name -> player id (first id when names are shared). Use ids(name) for
+    every id with that name.'''
+    def __init__(self, players: Iterable[dict], fetched_at: float = None):
+        by_id = {}
+        by_name = {}
+        for player in players:
+            by_id[player['id']] = player['fullName']
+            by_name.setdefault(player['fullName'], []).append(player['id'])
+
+        self._by_id = by_id
+        self._by_name = {name: tuple(ids) for name, ids in by_name.items()}
+        self._map = dict(by_id)
+        for name, ids in self._by_name.items():
+            self._map.setdefault(name, ids[0])
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+    def __getitem__(self, key):
+        return self._map[key]
+
+    def __iter__(self):
+        return iter(self._map)
+
+    def __len__(self):
+        return len(self._map)
+
+    def __repr__(self):
+        return 'PlayerPool(%s players)' % len(self._by_id)
+
+    def name(self, player_id: int) -> str:
+        '''Returns the players full name or None'''
+        return self._by_id.get(player_id)
+
+    def ids(self, name: str) -> Tuple[int, ...]:
+        '''Returns every player id with this full name'''
+        return self._by_name.get(name, ())
+
+    def players(self) -> Iterable[Tuple[int, str]]:
+        '''Returns (player id, full name) pairs'''
+        return self._by_id.items()
+
+
+class PlayerPoolRegistry:
+    '''Process wide PlayerPool cache keyed by (sport, year)
+
+    The pro player pool is the same for every league of a sport and year, so it is
+    downloaded once per process and shared by every League. Pools older than
+    refresh_interval seconds are downloaded again on next use.'''
+    def __init__(self, refresh_interval: float = DEFAULT_REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self._pools: Dict[Tuple[str, int], PlayerPool] = {}
+        self._locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, sport: str, year: int, fetch: Callable[[], list]) -> PlayerPool:
+        '''Returns the pool for sport and year, calling fetch for the raw players when missing or stale'''
+        key = (sport, year)
+        pool = self._pools.get(key)
+        if pool is not None and not self._is_stale(pool):
+            return pool
+
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        # one download per key, other threads wait for it
+        with key_lock:
+            pool = self._pools.get(key)
+            if pool is None or self._is_stale(pool):
+                pool = PlayerPool(fetch())
+                self._pools[key] = pool
+        return pool
+
+    def _is_stale(self, pool: PlayerPool) -> bool:
+        return self.refresh_interval is not None and time.time() - pool.fetched_at > self.refresh_interval
+
+    def invalidate(self, sport: str, year: int):
+        '''Drops one pool so it is downloaded again on next use'''
+        self._pools.pop((sport, year), None)
+
+    def clear(self):
+        '''Drops every pool'''
+        self._pools.clear()
+
+    def __contains__(self, key):
+        return key in self._pools
+
+    def __len__(self):
+        return len(self._pools)
+
+
+player_pools = PlayerPoolRegistry()
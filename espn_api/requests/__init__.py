@@ -1,3 +1,20 @@
-__all__ = ['EspnFantasyRequests']
+__all__ = ['EspnFantasyRequests',
+           'LiveTransport',
+           'NewsCache',
+           'RecordTransport',
+           'ReplayTransport',
+           'RequestPlanner',
+           'RequestThrottle',
+           'SharedPayloads',
+           'SingleFlight',
+           'news_cache',
+           'throttle',
+           ]
 
-from .espn_requests import EspnFantasyRequests
\ No newline at end of file
+from .espn_requests import EspnFantasyRequests
+from .news_cache import NewsCache, news_cache
+from .planner import RequestPlanner
+from .shared_payloads import SharedPayloads
+from .single_flight import SingleFlight
+from .throttle import RequestThrottle, throttle
+from .transport import LiveTransport, RecordTransport, ReplayTransport
\ No newline at end of file
@@ -0,0 +1,62 @@
+import importlib
+import io
+import json
+from typing import Iterable, Iterator
+
+# optional faster/streaming decoders, imported on first use
+_modules = {}
+
+
+def _optional(name: str):
+    '''Imports an optional decoder module once, None when it is not installed'''
+    if name not in _modules:
+        try:
+            _modules[name] = importlib.import_module(name)
+        except ImportError:
+            _modules[name] = None
+    return _modules[name]
+
+
+def loads(content):
+    '''Decodes a JSON response body, using orjson when it is installed'''
+    orjson = _optional('orjson')
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def decode_response(r, fields: Iterable[str] = None):
+    '''Decodes a transport response, falling back to r.json() for response stand ins without a body
+
+    When fields is set the body must be a JSON array of objects and only those top level
+    fields of each object are kept, see iter_fields'''
+    content = getattr(r, 'content', None)
+    if not isinstance(content, (bytes, str)):
+        data = r.json()
+        return data if fields is None else project(data, fields)
+    if fields is None:
+        return loads(content)
+    return list(iter_fields(content, fields))
+
+
+def project(items: Iterable[dict], fields: Iterable[str]) -> list:
+    '''Keeps only the given top level fields of each dict'''
+    fields = tuple(fields)
+    return [{field: item[field] for field in fields if field in item} for item in items]
+
+
+def iter_fields(content, fields: Iterable[str]) -> Iterator[dict]:
+    '''Yields dicts with only the given top level fields from each object of a JSON array body
+
+    With ijson installed the array is parsed one object at a time so the full list of
+    objects is never built, otherwise the body is decoded with loads and projected.'''
+    fields = tuple(fields)
+    ijson = _optional('ijson')
+    if ijson is None:
+        yield from project(loads(content), fields)
+        return
+
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    for item in ijson.items(io.BytesIO(content), 'item'):
+        yield {field: item[field] for field in fields if field in item}
@@ -0,0 +1,66 @@
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+# league endpoint flavors, see EspnFantasyRequests.checkRequestStatus
+SEASONS = 'seasons'
+LEAGUE_HISTORY = 'leagueHistory'
+
+
+class EndpointCache(object):
+    '''Remembers which league endpoint flavor answered for (sport, league_id, year)
+
+    ESPN serves a season from either /seasons/ or /leagueHistory/ and the only way to
+    find out is a 401 on the wrong one. Resolved flavors are kept in memory for every
+    EspnFantasyRequests in the process and, when a path is set, in a JSON file so later
+    runs skip the failing request too.'''
+    def __init__(self, path: str = None):
+        self.path = None
+        self._flavors: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        if path:
+            self.use_file(path)
+
+    @staticmethod
+    def _key(sport: str, league_id: int, year: int) -> Tuple[str, int, int]:
+        return (sport, int(league_id), int(year))
+
+    def use_file(self, path: str):
+        '''Loads flavors saved at path and saves new ones there'''
+        with self._lock:
+            self.path = path
+            if os.path.exists(path):
+                with open(path) as f:
+                    for sport, league_id, year, flavor in json.load(f):
+                        self._flavors.setdefault(self._key(sport, league_id, year), flavor)
+
+    def get(self, sport: str, league_id: int, year: int) -> Optional[str]:
+        return self._flavors.get(self._key(sport, league_id, year))
+
+    def set(self, sport: str, league_id: int, year: int, flavor: str):
+        key = self._key(sport, league_id, year)
+        with self._lock:
+            if self._flavors.get(key) == flavor:
+                return
+            self._flavors[key] = flavor
+            if self.path:
+                self._save()
+
+    def _save(self):
+        entries = [[sport, league_id, year, flavor] for (sport, league_id, year), flavor in sorted(self._flavors.items())]
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        '''Forgets every flavor held in memory, the file is left alone'''
+        with self._lock:
+            self._flavors.clear()
+
+    def __len__(self):
+        return len(self._flavors)
+
+
+endpoint_cache = EndpointCache()
@@ -1,8 +1,17 @@
-import requests
+import asyncio
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from .constant import FANTASY_BASE_ENDPOINT, NEWS_BASE_ENDPOINT, FANTASY_SPORTS
+from .transport import LiveTransport, request_key
+from .decode import decode_response, project
+from .endpoint_cache import endpoint_cache, SEASONS, LEAGUE_HISTORY
+from .planner import RequestPlanner
+from .single_flight import single_flight, async_single_flight, flight_key
+from .response_cache import ResponseCache, CachedResponse, body_digest
+from .news_cache import news_cache
 from ..utils.logger import Logger
-from typing import List
+from typing import Dict, List
 
 
 class ESPNAccessDenied(Exception):
@@ -18,41 +27,54 @@ class ESPNUnknownError(Exception):
 
 
 class EspnFantasyRequests(object):
-    def __init__(self, sport: str, year: int, league_id: int, cookies: dict = None, logger: Logger = None):
+    def __init__(self, sport: str, year: int, league_id: int, cookies: dict = None, logger: Logger = None, transport = None):
         if sport not in FANTASY_SPORTS:
             raise Exception(f'Unknown sport: {sport}, available options are {FANTASY_SPORTS.keys()}')
+        self.sport = sport
         self.year = year
         self.league_id = league_id
         self.ENDPOINT = FANTASY_BASE_ENDPOINT + FANTASY_SPORTS[sport] + '/seasons/' + str(self.year)
         self.NEWS_ENDPOINT = NEWS_BASE_ENDPOINT + FANTASY_SPORTS[sport] + '/news/' + 'players'
         self.cookies = cookies
         self.logger = logger
-
-        self.LEAGUE_ENDPOINT = FANTASY_BASE_ENDPOINT + FANTASY_SPORTS[sport]
-        # older season data is stored at a different endpoint
-        if year < 2018:
-            self.LEAGUE_ENDPOINT += "/leagueHistory/" + str(league_id) + "?seasonId=" + str(year)
-        else:
-            self.LEAGUE_ENDPOINT += "/seasons/" + str(year) + "/segments/0/leagues/" + str(league_id)
+        # live, record or replay, see transport.py
+        self.transport = transport or LiveTransport()
+        # payloads served once instead of requested, see preload
+        self._preloaded = {}
+        # request counters, bytes are the undecoded response body size
+        self.stats = {'requests': 0, 'bytes': 0}
+        # decoded responses revalidated with ETag / Last-Modified / body hash, see response_cache.py
+        self.response_cache = ResponseCache()
+        # registry of payloads shared with other leagues of the sport and year, see shared_payloads.py
+        self.shared_payloads = None
+
+        # older season data is stored at a different endpoint, use the flavor that answered last time if known
+        flavor = endpoint_cache.get(sport, league_id, year) or (LEAGUE_HISTORY if year < 2018 else SEASONS)
+        self.LEAGUE_ENDPOINT = self._league_endpoint(flavor)
+
+    def _league_endpoint(self, flavor: str) -> str:
+        '''League endpoint for the /seasons/ or /leagueHistory/ flavor'''
+        base_endpoint = FANTASY_BASE_ENDPOINT + FANTASY_SPORTS[self.sport]
+        if flavor == LEAGUE_HISTORY:
+            return f"{base_endpoint}/leagueHistory/{self.league_id}?seasonId={self.year}"
+        return f"{base_endpoint}/seasons/{self.year}/segments/0/leagues/{self.league_id}"
 
     def checkRequestStatus(self, status: int, extend: str = "", params: dict = None, headers: dict = None) -> dict:
         '''Handles ESPN API response status codes and endpoint format switching'''
         if status == 401:
             # If the current LEAGUE_ENDPOINT was using the /leagueHistory/ endpoint, switch to "/seasons/" endpoint
-            if "/leagueHistory/" in self.LEAGUE_ENDPOINT:
-                base_endpoint = self.LEAGUE_ENDPOINT.split("/leagueHistory/")[0]
-                self.LEAGUE_ENDPOINT = f"{base_endpoint}/seasons/{self.year}/segments/0/leagues/{self.league_id}"
-            else:
-                # If the current LEAGUE_ENDPOINT was using /seasons, switch to the "/leagueHistory/" endpoint
-                base_endpoint = self.LEAGUE_ENDPOINT.split(f"/seasons/")[0]
-                self.LEAGUE_ENDPOINT = f"{base_endpoint}/leagueHistory/{self.league_id}?seasonId={self.year}"
+            # and the other way around
+            flavor = SEASONS if "/leagueHistory/" in self.LEAGUE_ENDPOINT else LEAGUE_HISTORY
+            self.LEAGUE_ENDPOINT = self._league_endpoint(flavor)
 
             #try the alternate endpoint
-            r = requests.get(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, cookies=self.cookies)
+            r = self._transport_get(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers)
 
             if r.status_code == 200:
+                # Remember the flavor for every later request of this league and season
+                endpoint_cache.set(self.sport, self.league_id, self.year, flavor)
                 # Return the updated response if alternate works
-                return r.json()
+                return decode_response(r)
 
             # If all endpoints failed, raise the corresponding error
             if not self.cookies or 'espn_s2' not in self.cookies or 'SWID' not in self.cookies:
@@ -69,38 +91,120 @@ class EspnFantasyRequests(object):
         # If no issues with the status code, return None
         return None
 
+    def _transport_get(self, url: str, params: dict = None, headers: dict = None):
+        '''Sends a GET through the transport and updates the request counters'''
+        r = self.transport.get(url, params=params, headers=headers, cookies=self.cookies)
+        self.stats['requests'] += 1
+        content = getattr(r, 'content', None)
+        self.stats['bytes'] += len(content) if isinstance(content, (bytes, str)) else 0
+        return r
+
+    def _flight_key(self, endpoint: str, params: dict = None, headers: dict = None, *extra) -> tuple:
+        '''single flight key, requests sent with different (recording, replaying) transports are never shared'''
+        transport = 'live' if type(self.transport) is LiveTransport else id(self.transport)
+        return flight_key(endpoint, params, headers, self.cookies) + (transport,) + extra
+
+    def _conditional_headers(self, headers: dict, cached: CachedResponse) -> dict:
+        '''headers plus If-None-Match / If-Modified-Since for a cached response'''
+        conditional = cached.conditional_headers() if cached is not None else {}
+        return dict(headers or {}, **conditional) if conditional else headers
+
+    def _decode_cached(self, key: tuple, r, cached: CachedResponse, fields: tuple = None):
+        '''Decodes a 200 response, an identical body to the cached one returns the cached object instead'''
+        digest = body_digest(getattr(r, 'content', None))
+        if cached is not None and digest is not None and digest == cached.digest:
+            self.response_cache.count('unchanged')
+            return cached.response
+
+        response = decode_response(r, fields=fields)
+        if digest is not None:
+            self.response_cache.count('changed')
+            validators = getattr(r, 'headers', None) or {}
+            self.response_cache.put(key, CachedResponse(response, validators.get('ETag'), validators.get('Last-Modified'), digest))
+        return response
+
     def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
-        endpoint = self.LEAGUE_ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
-        alternate_response = self.checkRequestStatus(r.status_code, extend=extend, params=params, headers=headers)
+        '''GET from the league endpoint, concurrent identical calls share one request and its decoded response'''
+        key = self._flight_key(self.LEAGUE_ENDPOINT + extend, params, headers)
+        return single_flight.do(key, lambda: self._league_get(params=params, headers=headers, extend=extend))
 
+    async def league_get_async(self, params: dict = None, headers: dict = None, extend: str = ''):
+        '''league_get for asyncio callers, runs in the default executor and identical calls awaited together share one request'''
+        key = self._flight_key(self.LEAGUE_ENDPOINT + extend, params, headers)
+        loop = asyncio.get_running_loop()
+        return await async_single_flight.do(key, lambda: loop.run_in_executor(None, lambda: self.league_get(params=params, headers=headers, extend=extend)))
 
-        response = alternate_response if alternate_response else r.json()
+    def _league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        endpoint = self.LEAGUE_ENDPOINT + extend
+        key = request_key(endpoint, params, headers)
+        cached = self.response_cache.get(key)
+        r = self._transport_get(endpoint, params=params, headers=self._conditional_headers(headers, cached))
+        if cached is not None and r.status_code == 304:
+            self.response_cache.count('not_modified')
+            response = cached.response
+        else:
+            alternate_response = self.checkRequestStatus(r.status_code, extend=extend, params=params, headers=headers)
+            response = alternate_response if alternate_response else self._decode_cached(key, r, cached)
 
         if self.logger:
             self.logger.log_request(endpoint=self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, response=response)
 
         return response[0] if isinstance(response, list) else response
 
-    def get(self, params: dict = None, headers: dict = None, extend: str = ''):
+    def plan(self) -> RequestPlanner:
+        '''Starts a RequestPlanner, league requests added to it are merged into as few multi-view requests as possible'''
+        return RequestPlanner(self)
+
+    def get(self, params: dict = None, headers: dict = None, extend: str = '', fields: tuple = None):
+        '''GET from the sport endpoint, fields keeps only those keys of each item of a list response.
+        Concurrent identical calls share one request and its decoded response'''
+        key = self._flight_key(self.ENDPOINT + extend, params, headers, fields)
+        return single_flight.do(key, lambda: self._get(params=params, headers=headers, extend=extend, fields=fields))
+
+    async def get_async(self, params: dict = None, headers: dict = None, extend: str = '', fields: tuple = None):
+        '''get for asyncio callers, see league_get_async'''
+        key = self._flight_key(self.ENDPOINT + extend, params, headers, fields)
+        loop = asyncio.get_running_loop()
+        return await async_single_flight.do(key, lambda: loop.run_in_executor(None, lambda: self.get(params=params, headers=headers, extend=extend, fields=fields)))
+
+    def _get(self, params: dict = None, headers: dict = None, extend: str = '', fields: tuple = None):
         endpoint = self.ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
-        self.checkRequestStatus(r.status_code)
+        key = request_key(endpoint, params, headers) + (fields,)
+        cached = self.response_cache.get(key)
+        r = self._transport_get(endpoint, params=params, headers=self._conditional_headers(headers, cached))
+        if cached is not None and r.status_code == 304:
+            self.response_cache.count('not_modified')
+            response = cached.response
+        else:
+            self.checkRequestStatus(r.status_code)
+            response = self._decode_cached(key, r, cached, fields=fields)
 
         if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json()
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=response)
+        return response
 
     def news_get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.NEWS_ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        r = self._transport_get(endpoint, params=params, headers=headers)
+        response = decode_response(r)
 
         if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json()
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=response)
+        return response
+
+    def preload(self, payloads: dict):
+        '''Serves the next get_league, get_pro_players, get_pro_schedule and get_league_draft
+        calls from the given payloads (keys league, players, pro_schedule, draft) instead of ESPN'''
+        self._preloaded.update(payloads)
+
+    def clear_preloaded(self):
+        '''Drops preloaded payloads that were never requested'''
+        self._preloaded.clear()
 
     def get_league(self):
         '''Gets all of the leagues initial data (teams, roster, matchups, settings)'''
+        if 'league' in self._preloaded:
+            return self._preloaded.pop('league')
         params = {
             'view': ['mTeam', 'mRoster', 'mMatchup', 'mSettings', 'mStandings']
         }
@@ -109,24 +213,39 @@ class EspnFantasyRequests(object):
 
     def get_pro_schedule(self):
         '''Gets the current sports professional team schedules'''
+        if 'pro_schedule' in self._preloaded:
+            return self._preloaded.pop('pro_schedule')
         params = {
             'view': 'proTeamSchedules_wl'
         }
+        if self.shared_payloads is not None:
+            return self.shared_payloads.get((self.sport, self.year, 'pro_schedule'), lambda: self.get(params=params))
         data = self.get(params=params)
         return data
 
-    def get_pro_players(self):
-        '''Gets the current sports professional players'''
+    def shares_player_pool(self) -> bool:
+        '''Whether the pro player pool can come from the process wide registry, recorded,
+        replayed and preloaded requests always fetch their own'''
+        return type(self.transport) is LiveTransport and 'players' not in self._preloaded
+
+    def get_pro_players(self, fields: tuple = None):
+        '''Gets the current sports professional players, fields (e.g. ('id', 'fullName'))
+        decodes only those keys of each player instead of the full player objects'''
+        if 'players' in self._preloaded:
+            players = self._preloaded.pop('players')
+            return players if fields is None else project(players, fields)
         params = {
             'view': 'players_wl'
         }
         filters = {"filterActive": {"value": True}}
         headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.get(extend='/players', params=params, headers=headers)
+        data = self.get(extend='/players', params=params, headers=headers, fields=fields)
         return data
 
     def get_league_draft(self):
         '''Gets the leagues draft'''
+        if 'draft' in self._preloaded:
+            return self._preloaded.pop('draft')
         params = {
             'view': 'mDraftDetail',
         }
@@ -170,6 +289,36 @@ class EspnFantasyRequests(object):
         data = self.news_get(params=params)
         return data
 
+    def get_players_news(self, playerIds: List[int], max_workers: int = 8, ttl: float = None) -> Dict[int, dict]:
+        '''Gets the news of many players, max_workers requests at a time. With a live transport
+        feeds younger than ttl seconds (default news_cache.ttl) come from the process wide news_cache.
+        A feed that fails is logged and None for its player, the other players still get theirs'''
+        playerIds = list(dict.fromkeys(playerIds))
+        cache = news_cache if type(self.transport) is LiveTransport else None
+        news = {}
+        for playerId in playerIds:
+            feed = cache.get((self.sport, playerId), ttl) if cache is not None else None
+            if feed is not None:
+                news[playerId] = feed
+        missing = [playerId for playerId in playerIds if playerId not in news]
+
+        def fetch(playerId):
+            try:
+                return self.get_player_news(playerId)
+            except Exception as e:
+                logger = self.logger.logging if self.logger else logging.getLogger(__name__)
+                logger.warning(f'News of player {playerId} could not be fetched: {e}')
+                return None
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+                for playerId, feed in zip(missing, executor.map(fetch, missing)):
+                    news[playerId] = feed
+                    # failures are requested again next time
+                    if cache is not None and feed is not None:
+                        cache.put((self.sport, playerId), feed)
+        return {playerId: news[playerId] for playerId in playerIds}
+
     # Username and password no longer works using their API without using google recaptcha
     # Possibly revisit in future if anything changes
 
@@ -0,0 +1,49 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_TTL = 5 * 60  # seconds
+
+
+class NewsCache(object):
+    '''Process wide cache of player news feeds that expire after ttl seconds
+
+    Feeds are per sport, not per league, so every EspnFantasyRequests of a sport with a
+    live transport shares them (see EspnFantasyRequests.get_players_news).'''
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._feeds: 'OrderedDict[Hashable, Tuple[float, dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, key: Hashable, ttl: float = None) -> Optional[dict]:
+        '''Cached feed younger than ttl (default self.ttl), None otherwise'''
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            entry = self._feeds.get(key)
+            if entry is None or self.clock() - entry[0] >= ttl:
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            return entry[1]
+
+    def put(self, key: Hashable, feed: dict):
+        with self._lock:
+            self._feeds[key] = (self.clock(), feed)
+            self._feeds.move_to_end(key)
+            while len(self._feeds) > self.max_entries:
+                self._feeds.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._feeds.clear()
+            self.stats = {'hits': 0, 'misses': 0}
+
+    def __len__(self):
+        return len(self._feeds)
+
+
+news_cache = NewsCache()
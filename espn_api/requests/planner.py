@@ -0,0 +1,114 @@
+import json
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+# top level response collections each league view fills
+VIEW_KEYS = {
+    'mTeam': ('teams', 'members'),
+    'mRoster': ('teams',),
+    'mMatchup': ('schedule',),
+    'mMatchupScore': ('schedule',),
+    'mScoreboard': ('schedule',),
+    'mSettings': ('settings',),
+    'mStandings': ('teams',),
+    'mDraftDetail': ('draftDetail',),
+    'mPositionalRatings': ('positionAgainstOpponent',),
+    'kona_player_info': ('players',),
+    'kona_playercard': ('players',),
+}
+
+FILTER_HEADER = 'x-fantasy-filter'
+
+
+class PlannedRequest(object):
+    '''One callers views of a planned league request, response is set once the plan is executed'''
+    def __init__(self, views: Union[str, Iterable[str]], params: dict = None, headers: dict = None, extend: str = ''):
+        self.views = [views] if isinstance(views, str) else list(views)
+        self.params = dict(params or {})
+        self.params.pop('view', None)
+        headers = dict(headers or {})
+        self.filters = json.loads(headers.pop(FILTER_HEADER)) if FILTER_HEADER in headers else {}
+        self.headers = headers
+        self.extend = extend
+        self.response = None
+
+    @property
+    def collections(self) -> Optional[Set[str]]:
+        '''Top level response keys this request reads or filters, None when a view is unknown'''
+        if any(view not in VIEW_KEYS for view in self.views):
+            return None
+        return set(self.filters).union(*(VIEW_KEYS[view] for view in self.views))
+
+    def compatible(self, other: 'PlannedRequest') -> bool:
+        '''Whether both requests can be sent as one without one's filters changing the others data'''
+        if self.extend != other.extend or self.params != other.params or self.headers != other.headers:
+            return False
+        if not self.filters and not other.filters:
+            return True
+        if self.collections is None or other.collections is None:
+            return False
+        return not (set(self.filters) & other.collections or set(other.filters) & self.collections)
+
+
+class RequestPlanner(object):
+    '''Collects league endpoint requests and sends compatible ones as a single multi-view request
+
+    ESPN accepts a list of views and answers with one merged object. Requests to the same
+    endpoint with the same params apart from view (e.g. the same scoringPeriodId) are merged
+    when their x-fantasy-filter headers filter collections the others do not read. Each caller
+    gets the merged response without the collections only other callers asked for.'''
+    def __init__(self, espn_request):
+        self.espn_request = espn_request
+        self._requests: List[PlannedRequest] = []
+
+    def add(self, views: Union[str, Iterable[str]], params: dict = None, headers: dict = None, extend: str = '') -> PlannedRequest:
+        '''Plans a league_get, the returned request holds the response after execute()'''
+        request = PlannedRequest(views, params=params, headers=headers, extend=extend)
+        self._requests.append(request)
+        return request
+
+    def groups(self) -> List[List[PlannedRequest]]:
+        '''Planned requests grouped into the requests that will be sent'''
+        groups = []
+        for request in self._requests:
+            for group in groups:
+                if all(request.compatible(other) for other in group):
+                    group.append(request)
+                    break
+            else:
+                groups.append([request])
+        return groups
+
+    def execute(self) -> int:
+        '''Sends the planned requests and returns how many were sent'''
+        groups = self.groups()
+        for group in groups:
+            response = self._send(group)
+            for request in group:
+                request.response = self._split(response, request, group)
+        self._requests = []
+        return len(groups)
+
+    def _send(self, group: List[PlannedRequest]) -> Dict:
+        first = group[0]
+        views = []
+        filters = {}
+        for request in group:
+            views.extend(view for view in request.views if view not in views)
+            filters.update(request.filters)
+
+        params = dict(first.params, view=views[0] if len(views) == 1 else views)
+        headers = dict(first.headers)
+        if filters:
+            headers[FILTER_HEADER] = json.dumps(filters)
+        return self.espn_request.league_get(params=params, headers=headers or None, extend=first.extend)
+
+    @staticmethod
+    def _split(response: Dict, request: PlannedRequest, group: List[PlannedRequest]) -> Dict:
+        if len(group) == 1:
+            return response
+        own = request.collections or set()
+        others = set()
+        for other in group:
+            if other is not request:
+                others |= (other.collections or set()) - own
+        return {key: value for key, value in response.items() if key not in others}
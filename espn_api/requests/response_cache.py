@@ -0,0 +1,71 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class CachedResponse(object):
+    '''Decoded response of one request with the validators needed to revalidate it'''
+    def __init__(self, response: Any, etag: str = None, last_modified: str = None, digest: str = None):
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+def body_digest(content) -> Optional[str]:
+    '''Hash of a response body, None for response stand ins without a body'''
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    if not isinstance(content, bytes):
+        return None
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class ResponseCache(object):
+    '''LRU of decoded responses kept for revalidation
+
+    Requests for a cached key are sent with If-None-Match / If-Modified-Since when ESPN
+    gave an ETag / Last-Modified. A 304, or a body with the same hash when ESPN sends no
+    validators, returns the previously decoded object so callers can skip parsing it again
+    (it is the same object, compare with is). Cached objects are shared, do not modify them.'''
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'not_modified': 0, 'unchanged': 0, 'changed': 0}
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: CachedResponse):
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
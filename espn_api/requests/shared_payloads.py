@@ -0,0 +1,50 @@
+import threading
+import time
+from typing import Callable, Dict, Hashable, Tuple
+
+DEFAULT_TTL = 10 * 60  # seconds
+
+
+class SharedPayloads(object):
+    '''Payloads that are the same for every league of a sport and year, like the pro schedule
+
+    EspnFantasyRequests with shared_payloads set take those payloads from here, so leagues
+    sharing a registry download each once. Payloads older than ttl seconds are downloaded
+    again on next use, concurrent uses of a missing payload wait for one download.'''
+    def __init__(self, ttl: float = DEFAULT_TTL, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._payloads: Dict[Hashable, Tuple[float, object]] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'fetches': 0}
+
+    def _fresh(self, key: Hashable):
+        entry = self._payloads.get(key)
+        if entry is not None and (self.ttl is None or self.clock() - entry[0] < self.ttl):
+            return entry
+        return None
+
+    def get(self, key: Hashable, fetch: Callable[[], object]):
+        '''Returns the payload of key, calling fetch when it is missing or older than ttl'''
+        entry = self._fresh(key)
+        if entry is None:
+            with self._lock:
+                key_lock = self._locks.setdefault(key, threading.Lock())
+            with key_lock:
+                entry = self._fresh(key)
+                if entry is None:
+                    entry = self._payloads[key] = (self.clock(), fetch())
+                    with self._lock:
+                        self.stats['fetches'] += 1
+                    return entry[1]
+        with self._lock:
+            self.stats['hits'] += 1
+        return entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._payloads.clear()
+
+    def __len__(self):
+        return len(self._payloads)
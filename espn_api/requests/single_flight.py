@@ -0,0 +1,93 @@
+import asyncio
+import os
+import threading
+import weakref
+from typing import Awaitable, Callable, Dict, Hashable, Tuple
+
+from .transport import request_key
+
+
+def flight_key(url: str, params: dict = None, headers: dict = None, cookies: dict = None) -> Tuple:
+    '''Key of identical requests, cookies are included since they decide what ESPN answers'''
+    return request_key(url, params, headers) + (tuple(sorted((cookies or {}).items())),)
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    '''Collapses concurrent identical calls into one
+
+    The first thread to call do() with a key runs fn, threads calling with the same key
+    while it runs wait and get the same result (or exception). Nothing is cached once
+    the call finished, see do().'''
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.stats = {'calls': 0, 'shared': 0}
+
+    def do(self, key: Hashable, fn: Callable):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats['calls'] += 1
+            else:
+                self.stats['shared'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def _after_fork(self):
+        '''A forked child gets a new lock and no calls in flight, their leaders stayed in the parent'''
+        self._lock = threading.Lock()
+        self._calls = {}
+
+
+class AsyncSingleFlight(object):
+    '''asyncio version of SingleFlight, coroutines awaiting the same key share one task
+
+    Tasks belong to the running event loop, so each loop has its own in flight calls.'''
+    def __init__(self):
+        self._tasks: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]' = weakref.WeakKeyDictionary()
+        self.stats = {'calls': 0, 'shared': 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable]):
+        tasks = self._tasks.setdefault(asyncio.get_running_loop(), {})
+        task = tasks.get(key)
+        if task is None:
+            task = tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: tasks.pop(key, None))
+            self.stats['calls'] += 1
+        else:
+            self.stats['shared'] += 1
+        # a cancelled waiter must not cancel the call the others are waiting for
+        return await asyncio.shield(task)
+
+
+single_flight = SingleFlight()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=single_flight._after_fork)
+async_single_flight = AsyncSingleFlight()
@@ -0,0 +1,245 @@
+import os
+import random
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import requests
+
+# statuses worth retrying, everything else is handled by EspnFantasyRequests.checkRequestStatus
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# statuses that count towards opening the circuit, a 429 means ESPN is up but busy
+OUTAGE_STATUSES = (500, 502, 503, 504)
+
+
+class ESPNUnavailable(Exception):
+    '''Raised without contacting ESPN while the circuit breaker is open'''
+    pass
+
+
+def parse_retry_after(value: Optional[str], now: float = None) -> Optional[float]:
+    '''Seconds to wait from a Retry-After header (delta seconds or HTTP date), None when missing or invalid'''
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - now)
+
+
+class TokenBucket(object):
+    '''Thread safe token bucket, reserve() tells callers how long to wait before sending
+
+    Tokens refill at rate per second up to burst. A rate of None disables limiting.'''
+    def __init__(self, rate: Optional[float], burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        '''Takes a token and returns how many seconds to wait before using it'''
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # tokens below zero are owed by waiting callers
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class CircuitBreaker(object):
+    '''Fails fast after failure_threshold consecutive outage responses
+
+    Once open no request is sent for reset_timeout seconds, then a single trial request
+    is let through (half open). Its success closes the circuit, a failure opens it again.'''
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        '''Whether a request may be sent now'''
+        if not self.failure_threshold:
+            return True
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_running = False
+            if self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def release_trial(self):
+        '''Lets another trial through after one that said nothing about an outage (429)'''
+        with self._lock:
+            self._trial_running = False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_running = False
+
+    def record_failure(self) -> bool:
+        '''Counts a failure, returns True when it opened the circuit'''
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.failure_threshold and self.failures >= self.failure_threshold):
+                opened = self.state != self.OPEN
+                self.state = self.OPEN
+                self._opened_at = self.clock()
+                self._trial_running = False
+                return opened
+            return False
+
+
+class RequestThrottle(object):
+    '''Process wide rate limiting, retries and circuit breaking for requests sent to ESPN
+
+    Every LiveTransport sends through the same throttle (see throttle below) so concurrent
+    Leagues share one request budget. 429 and 5xx responses and connection errors are retried
+    with jittered exponential backoff, honoring Retry-After. stats counts what happened.'''
+    def __init__(self, requests_per_second: Optional[float] = 20.0, burst: int = 40, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0, sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        self.sleep = sleep
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.configure(requests_per_second=requests_per_second, burst=burst, max_retries=max_retries,
+                       backoff_base=backoff_base, backoff_max=backoff_max, failure_threshold=failure_threshold,
+                       reset_timeout=reset_timeout)
+        self.reset_stats()
+
+    def configure(self, requests_per_second: Optional[float] = None, burst: int = None, max_retries: int = None,
+                  backoff_base: float = None, backoff_max: float = None, failure_threshold: int = None,
+                  reset_timeout: float = None):
+        '''Changes the given settings, a requests_per_second of 0 disables rate limiting'''
+        bucket = getattr(self, 'bucket', None)
+        breaker = getattr(self, 'breaker', None)
+        if requests_per_second is not None or burst is not None or bucket is None:
+            self.bucket = TokenBucket(requests_per_second if requests_per_second is not None else bucket.rate,
+                                      burst if burst is not None else bucket.burst, clock=self.clock)
+        if failure_threshold is not None or reset_timeout is not None or breaker is None:
+            self.breaker = CircuitBreaker(failure_threshold if failure_threshold is not None else breaker.failure_threshold,
+                                          reset_timeout if reset_timeout is not None else breaker.reset_timeout, clock=self.clock)
+        if max_retries is not None:
+            self.max_retries = max_retries
+        if backoff_base is not None:
+            self.backoff_base = backoff_base
+        if backoff_max is not None:
+            self.backoff_max = backoff_max
+
+    def reset(self):
+        '''Closes the circuit, refills the bucket and clears stats'''
+        self.bucket = TokenBucket(self.bucket.rate, self.bucket.burst, clock=self.clock)
+        self.breaker = CircuitBreaker(self.breaker.failure_threshold, self.breaker.reset_timeout, clock=self.clock)
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {
+                'requests': 0,
+                'throttled': 0,
+                'throttle_wait_seconds': 0.0,
+                'retries': 0,
+                'retry_wait_seconds': 0.0,
+                'failures': 0,
+                'circuit_opened': 0,
+                'circuit_rejected': 0,
+            }
+
+    def _count(self, name: str, amount: float = 1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def backoff(self, attempt: int, retry_after: float = None) -> float:
+        '''Seconds to wait before retry number attempt (0 based), full jitter unless ESPN sent Retry-After'''
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def send(self, request: Callable[[], requests.Response]):
+        '''Calls request (one GET) under the rate limit, retrying failures and honoring the circuit breaker'''
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                self._count('circuit_rejected')
+                raise ESPNUnavailable('ESPN is failing, requests are paused for %ss' % self.breaker.reset_timeout)
+
+            wait = self.bucket.reserve()
+            if wait > 0:
+                self._count('throttled')
+                self._count('throttle_wait_seconds', wait)
+                self.sleep(wait)
+
+            self._count('requests')
+            retry_after = None
+            try:
+                r = request()
+            except (requests.ConnectionError, requests.Timeout):
+                # no retries once the failure opened the circuit
+                if self._failed() or attempt >= self.max_retries:
+                    raise
+            else:
+                opened = False
+                if r.status_code in OUTAGE_STATUSES:
+                    opened = self._failed()
+                elif r.status_code in RETRY_STATUSES:
+                    # a 429 says nothing about an outage, the breaker is left as it is
+                    self.breaker.release_trial()
+                else:
+                    self.breaker.record_success()
+                if r.status_code not in RETRY_STATUSES or opened or attempt >= self.max_retries:
+                    return r
+                retry_after = parse_retry_after(r.headers.get('Retry-After'))
+
+            delay = self.backoff(attempt, retry_after)
+            self._count('retries')
+            self._count('retry_wait_seconds', delay)
+            self.sleep(delay)
+            attempt += 1
+
+    def _after_fork(self):
+        '''A forked child gets new locks, a thread of the parent may have held them while forking'''
+        self._lock = threading.Lock()
+        self.bucket._lock = threading.Lock()
+        self.breaker._lock = threading.Lock()
+
+    def _failed(self) -> bool:
+        '''Counts an outage, returns True when the circuit is open'''
+        self._count('failures')
+        if self.breaker.record_failure():
+            self._count('circuit_opened')
+        return self.breaker.state == CircuitBreaker.OPEN
+
+
+throttle = RequestThrottle()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=throttle._after_fork)
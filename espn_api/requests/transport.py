@@ -0,0 +1,132 @@
+import json
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from .throttle import RequestThrottle, throttle as default_throttle
+
+
+class CassetteMiss(Exception):
+    pass
+
+
+def request_key(url: str, params: dict = None, headers: dict = None) -> Tuple:
+    '''Normalized (url, params, filter header) key used to match recorded requests'''
+    items = []
+    for key, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        items.extend((str(key), str(v)) for v in values)
+    fantasy_filter = (headers or {}).get('x-fantasy-filter')
+    return (url, tuple(sorted(items)), fantasy_filter)
+
+
+class TransportResponse(object):
+    '''Minimal requests.Response stand in for replayed responses'''
+    def __init__(self, status_code: int, content: bytes, headers: dict = None, url: str = ''):
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class LiveTransport(object):
+    '''Sends requests to ESPN over one pooled requests.Session
+
+    Requests go through throttle (the process wide one by default) for rate limiting,
+    retries with backoff and circuit breaking, see throttle.py'''
+    def __init__(self, session: requests.Session = None, throttle: RequestThrottle = None):
+        self.session = session or requests.Session()
+        self.throttle = throttle or default_throttle
+
+    def get(self, url: str, params: dict = None, headers: dict = None, cookies: dict = None):
+        return self.throttle.send(lambda: self.session.get(url, params=params, headers=headers, cookies=cookies))
+
+
+class RecordTransport(LiveTransport):
+    '''Sends requests to ESPN and appends every request and response to a JSONL cassette'''
+    # response headers worth keeping for replay
+    KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Retry-After')
+
+    def __init__(self, path: str, transport: LiveTransport = None):
+        self.path = path
+        self.transport = transport or LiveTransport()
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: dict = None, headers: dict = None, cookies: dict = None):
+        r = self.transport.get(url, params=params, headers=headers, cookies=cookies)
+        (key_url, key_params, key_filter) = request_key(url, params, headers)
+        entry = {
+            'url': key_url,
+            'params': [list(item) for item in key_params],
+            'filter': key_filter,
+            'status': r.status_code,
+            'headers': {name: r.headers[name] for name in self.KEPT_HEADERS if name in r.headers},
+            'body': r.content.decode('utf-8'),
+        }
+        line = json.dumps(entry, separators=(',', ':'))
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+        return r
+
+
+class ReplayTransport(object):
+    '''Serves responses from a cassette written by RecordTransport without network access
+
+    strict matching requires the url, params and x-fantasy-filter header to match.
+    lenient matching falls back to ignoring the filter header and then the params.
+    Repeated identical requests are answered in recorded order, the last response
+    is reused once a request has been replayed more times than it was recorded.
+    '''
+    def __init__(self, path: str = None, match: str = 'strict', entries: List[Dict] = None):
+        if match not in ('strict', 'lenient'):
+            raise ValueError(f'Unknown match mode: {match}, available options are strict, lenient')
+        self.match = match
+        self._lock = threading.Lock()
+        self._served: Dict[Tuple, int] = {}
+        self._exact: Dict[Tuple, List[Dict]] = {}
+        self._no_filter: Dict[Tuple, List[Dict]] = {}
+        self._url_only: Dict[str, List[Dict]] = {}
+
+        if path:
+            with open(path, encoding='utf-8') as f:
+                entries = [json.loads(line) for line in f if line.strip()] + (entries or [])
+        for entry in entries or []:
+            self.add(entry)
+
+    def add(self, entry: Dict):
+        '''Adds a recorded {url, params, filter, status, headers, body} entry'''
+        params = tuple(tuple(item) for item in entry.get('params', []))
+        self._exact.setdefault((entry['url'], params, entry.get('filter')), []).append(entry)
+        self._no_filter.setdefault((entry['url'], params), []).append(entry)
+        self._url_only.setdefault(entry['url'], []).append(entry)
+
+    def _lookup(self, key: Tuple) -> Tuple[Tuple, Optional[List[Dict]]]:
+        (url, params, _) = key
+        if key in self._exact:
+            return key, self._exact[key]
+        if self.match == 'lenient':
+            if (url, params) in self._no_filter:
+                return (url, params), self._no_filter[(url, params)]
+            if url in self._url_only:
+                return (url,), self._url_only[url]
+        return key, None
+
+    def get(self, url: str, params: dict = None, headers: dict = None, cookies: dict = None):
+        (match_key, entries) = self._lookup(request_key(url, params, headers))
+        if not entries:
+            raise CassetteMiss(f'No recorded response for {url} params: {params} headers: {headers}')
+
+        with self._lock:
+            served = self._served.get(match_key, 0)
+            self._served[match_key] = served + 1
+        entry = entries[min(served, len(entries) - 1)]
+        return TransportResponse(entry['status'], entry['body'].encode('utf-8'), entry.get('headers'), url)
@@ -11,6 +11,10 @@ This module provides enhanced Monte Carlo simulation with:
 import numpy as np
 from typing import List, Dict, Optional, Tuple
 from .player_performance import PlayerPerformanceModel
+from ..football.constant import POSITIONAL_RATINGS_POSITION_MAP, PRO_TEAM_MAP
+
+# pro team abbreviation -> proTeamId
+PRO_TEAM_IDS = {abbrev: team_id for team_id, abbrev in PRO_TEAM_MAP.items()}
 
 
 class AdvancedFantasySimulator:
@@ -21,7 +25,9 @@ class AdvancedFantasySimulator:
         league,
         num_simulations: int = 10000,
         cache_dir: str = '.cache',
-        use_gmm: bool = True
+        use_gmm: bool = True,
+        frame=None,
+        use_positional_ratings: bool = False
     ):
         """
         Initialize advanced simulator
@@ -31,10 +37,16 @@ class AdvancedFantasySimulator:
             num_simulations: Number of simulations to run
             cache_dir: Cache directory for player models
             use_gmm: Use Gaussian Mixture Models for player prediction
+            frame: Optional LeagueFrame to read player points from
+            use_positional_ratings: Use the league's ESPN positional ratings for matchup
+                difficulty instead of deriving it from rosters (football only)
         """
         self.league = league
         self.num_simulations = num_simulations
         self.use_gmm = use_gmm
+        self.frame = frame
+        self.use_positional_ratings = use_positional_ratings
+        self.simulations_run = 0  # matchup and season simulations, for instrumentation
 
         # Initialize player performance model
         self.player_model = PlayerPerformanceModel(cache_dir=cache_dir)
@@ -52,7 +64,15 @@ class AdvancedFantasySimulator:
             all_players.extend(team.roster)
 
         # Bulk train
-        self.player_model.bulk_train(all_players, self.league.year)
+        self.player_model.bulk_train(all_players, self.league.year, frame=self.frame)
+
+    def _base_projection(self, player) -> float:
+        """Projected average points, falling back to season average points"""
+        if self.frame is not None:
+            projection = self.frame.base_projection(player.playerId)
+            if projection is not None:
+                return projection
+        return getattr(player, 'projected_avg_points', 0) or getattr(player, 'avg_points', 0)
 
     def simulate_roster_score(
         self,
@@ -87,7 +107,7 @@ class AdvancedFantasySimulator:
                 predicted_score = self.player_model.predict_performance(player, n_samples=1)[0]
             else:
                 # Fallback to normal distribution
-                mean = player.projected_avg_points if hasattr(player, 'projected_avg_points') and player.projected_avg_points > 0 else player.avg_points
+                mean = self._base_projection(player)
                 std = mean * 0.25
                 predicted_score = np.random.normal(mean, std)
 
@@ -119,7 +139,7 @@ class AdvancedFantasySimulator:
         def get_best(pos, count=1):
             available = [p for p in remaining if p.position == pos]
             available.sort(
-                key=lambda x: getattr(x, 'projected_avg_points', 0) or getattr(x, 'avg_points', 0),
+                key=lambda x: self._base_projection(x),
                 reverse=True
             )
             selected = available[:count]
@@ -140,7 +160,7 @@ class AdvancedFantasySimulator:
         if flex_eligible:
             flex = max(
                 flex_eligible,
-                key=lambda x: getattr(x, 'projected_avg_points', 0) or getattr(x, 'avg_points', 0)
+                key=lambda x: self._base_projection(x)
             )
             lineup.append(flex)
 
@@ -181,6 +201,7 @@ class AdvancedFantasySimulator:
 
             if team1_score > team2_score:
                 team1_wins += 1
+        self.simulations_run += n_simulations
 
         return {
             'team1_win_probability': team1_wins / n_simulations * 100,
@@ -331,7 +352,7 @@ class AdvancedFantasySimulator:
                 value = state['season_avg']
             else:
                 # Use projections
-                value = getattr(player, 'projected_avg_points', 0) or getattr(player, 'avg_points', 0)
+                value = self._base_projection(player)
 
             starter_value += value
 
@@ -343,7 +364,7 @@ class AdvancedFantasySimulator:
                 state = self.player_model.player_states[player.playerId]
                 value = state['season_avg'] * 0.3
             else:
-                value = (getattr(player, 'projected_avg_points', 0) or getattr(player, 'avg_points', 0)) * 0.3
+                value = self._base_projection(player) * 0.3
 
             bench_value += value
 
@@ -360,6 +381,11 @@ class AdvancedFantasySimulator:
         Returns:
             Multiplier (1.0 = average, >1.0 = favorable, <1.0 = unfavorable)
         """
+        if self.use_positional_ratings:
+            multiplier = self._positional_rating_multiplier(position, opponent_team)
+            if multiplier is not None:
+                return multiplier
+
         # Calculate points allowed by each team to each position
         position_rankings = {}
 
@@ -408,6 +434,27 @@ class AdvancedFantasySimulator:
             return opponent_avg / league_avg
         return 1.0
 
+    def _positional_rating_multiplier(self, position: str, opponent_team: str) -> Optional[float]:
+        """
+        Matchup multiplier from the league's current week positional ratings
+
+        Args:
+            position: Player position (RB, WR, QB, TE)
+            opponent_team: Opponent pro team abbreviation
+
+        Returns:
+            0.8 for the toughest defense (rank 1) up to 1.2 for the easiest, None if not rated
+        """
+        positional_ratings = getattr(self.league, 'positional_ratings', None)
+        if not callable(positional_ratings):
+            return None
+
+        ranks = positional_ratings(self.league.current_week).get(POSITIONAL_RATINGS_POSITION_MAP.get(position), {})
+        rank = ranks.get(str(PRO_TEAM_IDS.get(opponent_team)))
+        if not rank:
+            return None
+        return 0.8 + 0.4 * (rank - 1) / max(max(ranks.values()) - 1, 1)
+
     def _calculate_roster_value_ros(
         self,
         roster: List,
@@ -450,7 +497,7 @@ class AdvancedFantasySimulator:
                     )[0]
                 else:
                     # Fall back to projected points
-                    base_projection = getattr(player, 'projected_avg_points', 0) or getattr(player, 'avg_points', 0)
+                    base_projection = self._base_projection(player)
 
                 # Adjust for matchup difficulty if schedule data available
                 week_projection = base_projection
@@ -481,7 +528,7 @@ class AdvancedFantasySimulator:
                         use_state_bias=True
                     )[0]
                 else:
-                    base_projection = getattr(player, 'projected_avg_points', 0) or getattr(player, 'avg_points', 0)
+                    base_projection = self._base_projection(player)
 
                 # Adjust for matchup if available
                 week_projection = base_projection
@@ -534,7 +581,7 @@ class AdvancedFantasySimulator:
                 )[0]
             else:
                 # Fall back to projected points
-                base_projection = getattr(player, 'projected_avg_points', 0) or getattr(player, 'avg_points', 0)
+                base_projection = self._base_projection(player)
 
             # Adjust for matchup difficulty if schedule data available
             week_projection = base_projection
@@ -552,7 +599,7 @@ class AdvancedFantasySimulator:
             return player_ros_value / weeks_with_data
         else:
             # Fallback to season average
-            return getattr(player, 'projected_avg_points', 0) or getattr(player, 'avg_points', 0)
+            return self._base_projection(player)
 
     def find_trade_opportunities(
         self,
@@ -594,8 +641,8 @@ class AdvancedFantasySimulator:
                 for their_player in other_team.roster:
                     # Skip if same position and similar value (boring trade)
                     if my_player.position == their_player.position:
-                        my_val = getattr(my_player, 'projected_avg_points', 0) or getattr(my_player, 'avg_points', 0)
-                        their_val = getattr(their_player, 'projected_avg_points', 0) or getattr(their_player, 'avg_points', 0)
+                        my_val = self._base_projection(my_player)
+                        their_val = self._base_projection(their_player)
                         if abs(my_val - their_val) < 1.0:
                             continue
 
@@ -655,18 +702,20 @@ class AdvancedFantasySimulator:
         top_n: int = 10,
         positions: Optional[List[str]] = None,
         exclude_injured: bool = True,
-        use_ros: bool = True
+        use_ros: bool = True,
+        max_candidates: Optional[int] = None
     ) -> List[Dict]:
         """
         Recommend free agent pickups with ROS schedule awareness
 
         Args:
             my_team: Your team
-            free_agents: List of available free agents
+            free_agents: Available free agents, a list or an iterator such as League.iter_free_agents
             top_n: Number of recommendations
             positions: Filter by positions (None for all)
             exclude_injured: Exclude players with injury designations (default True)
             use_ros: Use rest of season projections with schedule awareness (default True)
+            max_candidates: Stop reading free_agents after scoring this many eligible players (None for all)
 
         Returns:
             List of free agent recommendations
@@ -677,6 +726,7 @@ class AdvancedFantasySimulator:
         end_week = reg_season_end
 
         recommendations = []
+        scored = 0
 
         for fa in free_agents:
             # Filter by position if specified
@@ -691,6 +741,8 @@ class AdvancedFantasySimulator:
                 if injury_status and injury_status.upper() not in ['ACTIVE', 'NORMAL', '', None]:
                     continue
 
+            scored += 1
+
             # Find weakest player at this position on my team
             position_players = [p for p in my_team.roster if p.position == fa.position]
 
@@ -708,24 +760,24 @@ class AdvancedFantasySimulator:
                 else:
                     drop_candidate = min(
                         position_players,
-                        key=lambda x: getattr(x, 'projected_avg_points', 0) or getattr(x, 'avg_points', 0)
+                        key=lambda x: self._base_projection(x)
                     )
                 priority_multiplier = 1.0
 
             # Calculate value added using ROS or season avg
             if use_ros:
                 fa_value = self._calculate_player_ros_value(fa, current_week, end_week, consider_schedule=True)
-                fa_season_avg = getattr(fa, 'projected_avg_points', 0) or getattr(fa, 'avg_points', 0)
+                fa_season_avg = self._base_projection(fa)
             else:
-                fa_value = getattr(fa, 'projected_avg_points', 0) or getattr(fa, 'avg_points', 0)
+                fa_value = self._base_projection(fa)
                 fa_season_avg = fa_value
 
             if drop_candidate:
                 if use_ros:
                     drop_value = self._calculate_player_ros_value(drop_candidate, current_week, end_week, consider_schedule=True)
-                    drop_season_avg = getattr(drop_candidate, 'projected_avg_points', 0) or getattr(drop_candidate, 'avg_points', 0)
+                    drop_season_avg = self._base_projection(drop_candidate)
                 else:
-                    drop_value = getattr(drop_candidate, 'projected_avg_points', 0) or getattr(drop_candidate, 'avg_points', 0)
+                    drop_value = self._base_projection(drop_candidate)
                     drop_season_avg = drop_value
                 value_added = (fa_value - drop_value) * priority_multiplier
             else:
@@ -747,6 +799,9 @@ class AdvancedFantasySimulator:
                     'uses_ros': use_ros
                 })
 
+            if max_candidates is not None and scored >= max_candidates:
+                break
+
         # Sort by value added
         recommendations.sort(key=lambda x: x['value_added'], reverse=True)
 
@@ -766,6 +821,7 @@ class AdvancedFantasySimulator:
             'championship_odds': 0
         } for team in self.league.teams}
 
+        self.simulations_run += self.num_simulations
         for _ in range(self.num_simulations):
             # Simulate remaining matchups for each week
             season_wins = {team.team_id: team.wins for team in self.league.teams}
@@ -0,0 +1,139 @@
+"""
+Timing and Profiling Instrumentation
+
+This module provides lightweight instrumentation for long running analyses:
+- Named phase timers (wall clock seconds and call counts)
+- Free form counters (HTTP requests, bytes downloaded, simulations, GMM fits)
+- Optional cProfile / pyinstrument capture around a call
+"""
+
+import io
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+PROFILERS = ('cprofile', 'pyinstrument')
+
+
+class PhaseTimer:
+    """Collects per-phase wall clock timings and counters, phases may run on several threads"""
+
+    def __init__(self):
+        self.phases: Dict[str, Dict] = {}
+        self.counters: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time a block of code, repeated phases accumulate
+
+        Args:
+            name: Phase name (e.g. 'league_fetch')
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                phase = self.phases.setdefault(name, {'seconds': 0.0, 'calls': 0})
+                phase['seconds'] += elapsed
+                phase['calls'] += 1
+
+    def merge(self, phases: Dict[str, Dict]):
+        """
+        Add phases timed by another timer, e.g. in a worker process
+
+        Args:
+            phases: Phases of the other timer ({name: {'seconds', 'calls'}})
+        """
+        with self._lock:
+            for name, other in phases.items():
+                phase = self.phases.setdefault(name, {'seconds': 0.0, 'calls': 0})
+                phase['seconds'] += other['seconds']
+                phase['calls'] += other['calls']
+
+    def increment(self, name: str, amount: float = 1):
+        """Add to a counter"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_counter(self, name: str, value: float):
+        """Set a counter to an absolute value"""
+        self.counters[name] = value
+
+    def summary(self) -> Dict:
+        """
+        Machine readable timing summary
+
+        Returns:
+            Dict with phases (seconds, calls), counters and total elapsed seconds
+        """
+        return {
+            'total_seconds': round(time.perf_counter() - self._started, 4),
+            'phases': {
+                name: {'seconds': round(phase['seconds'], 4), 'calls': phase['calls']}
+                for name, phase in self.phases.items()
+            },
+            'counters': dict(self.counters),
+        }
+
+    def format_table(self) -> str:
+        """Human readable phase table sorted by time spent"""
+        lines = [f"{'Phase':<28} {'Seconds':>10} {'Calls':>7}"]
+        for name, phase in sorted(self.phases.items(), key=lambda item: item[1]['seconds'], reverse=True):
+            lines.append(f"{name:<28} {phase['seconds']:>10.3f} {phase['calls']:>7}")
+        for name, value in self.counters.items():
+            lines.append(f"{name:<28} {value:>10,}")
+        return '\n'.join(lines)
+
+
+def profile_call(fn: Callable, profiler: str = 'cprofile', output_path: Optional[str] = None, top_n: int = 25):
+    """
+    Run a callable under a profiler
+
+    Args:
+        fn: Zero argument callable to profile
+        profiler: 'cprofile' or 'pyinstrument' (falls back to cprofile if not installed)
+        output_path: Where to save the profile (.prof stats for cprofile, .html for pyinstrument)
+        top_n: Number of functions printed for cprofile
+
+    Returns:
+        Tuple of (fn result, printable profile report)
+    """
+    if profiler not in PROFILERS:
+        raise ValueError(f'Unknown profiler: {profiler}, available options are {PROFILERS}')
+
+    if profiler == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            print("⚠️  pyinstrument is not installed, falling back to cProfile")
+            profiler = 'cprofile'
+        else:
+            prof = Profiler()
+            prof.start()
+            try:
+                result = fn()
+            finally:
+                prof.stop()
+            if output_path:
+                with open(output_path, 'w') as f:
+                    f.write(prof.output_html())
+            return result, prof.output_text(unicode=True, color=False)
+
+    import cProfile
+    import pstats
+
+    prof = cProfile.Profile()
+    try:
+        result = prof.runcall(fn)
+    finally:
+        if output_path:
+            prof.dump_stats(output_path)
+    report = io.StringIO()
+    pstats.Stats(prof, stream=report).sort_stats('cumulative').print_stats(top_n)
+    return result, report.getvalue()
@@ -0,0 +1,255 @@
+"""
+Columnar League Stats Store
+
+This module provides a NumPy-backed, column oriented view of every rostered
+player in a League so analytics can work on arrays instead of walking
+player.stats dicts:
+- player ids, position codes and pro-team codes
+- (players x scoring periods) actual and projected points matrices
+- ownership and roster assignment
+"""
+
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+
+FREE_AGENT = -1
+
+
+def _period_points(stats: Dict) -> Iterable:
+    """Yield (scoring_period, actual, projected) for every weekly stat line
+
+    Football and baseball key weekly stats by int scoring period with
+    points/projected_points, basketball keys them by str scoring period with
+    applied_total. Season totals (period 0) and split ids are skipped.
+    """
+    for key, line in stats.items():
+        if not isinstance(line, dict):
+            continue
+        if isinstance(key, int):
+            period = key
+        elif isinstance(key, str) and key.isdigit():
+            period = int(key)
+        else:
+            continue
+        if period <= 0:
+            continue
+
+        actual = line.get('points', line.get('applied_total'))
+        projected = line.get('projected_points')
+        yield period, actual, projected
+
+
+class LeagueFrame:
+    """Columnar store of rostered player data for a League"""
+
+    def __init__(self, league, num_periods: Optional[int] = None):
+        """
+        Build the frame from a loaded League in a single pass over the rosters
+
+        Args:
+            league: League instance with teams and rosters loaded
+            num_periods: Number of scoring periods (default: league.finalScoringPeriod)
+        """
+        self.league = league
+        self.num_periods = num_periods or getattr(league, 'finalScoringPeriod', 0) or 0
+
+        self.position_names: List[str] = []
+        self.pro_team_names: List[str] = []
+        self._position_codes: Dict[str, int] = {}
+        self._pro_team_codes: Dict[str, int] = {}
+
+        rows = []
+        for team in league.teams:
+            for player in team.roster:
+                rows.append((player, team.team_id))
+        self._build(rows)
+
+    def __len__(self):
+        return len(self.player_ids)
+
+    def __repr__(self):
+        return 'LeagueFrame(%d players, %d periods)' % (len(self), self.num_periods)
+
+    def _code(self, value, codes: Dict, names: List) -> int:
+        '''Returns the integer code for a categorical value, adding it if new'''
+        value = value if value is not None else ''
+        if value not in codes:
+            codes[value] = len(names)
+            names.append(value)
+        return codes[value]
+
+    def _build(self, rows: List):
+        '''Allocates every column once and fills it from (player, team_id) rows'''
+        # grow the period axis if any player has stats past num_periods
+        for player, _ in rows:
+            for period, _, _ in _period_points(getattr(player, 'stats', {}) or {}):
+                if period > self.num_periods:
+                    self.num_periods = period
+
+        n = len(rows)
+        self.player_ids = np.zeros(n, dtype=np.int64)
+        self.names: List[str] = [''] * n
+        self.positions = np.zeros(n, dtype=np.int16)
+        self.pro_teams = np.zeros(n, dtype=np.int16)
+        self.actual = np.full((n, self.num_periods), np.nan)
+        self.projected = np.full((n, self.num_periods), np.nan)
+        self.avg_points = np.zeros(n)
+        self.projected_avg_points = np.zeros(n)
+        self.projected_points = np.zeros(n)
+        self.points_per_game = np.zeros(n)
+        self.ownership = np.full(n, np.nan)
+        self.roster_team = np.full(n, FREE_AGENT, dtype=np.int32)
+        self.index: Dict[int, int] = {}
+
+        for row, (player, team_id) in enumerate(rows):
+            self._fill_row(row, player, team_id)
+
+    def _fill_row(self, row: int, player, team_id: int):
+        '''Writes a single player into an already allocated row'''
+        self.player_ids[row] = player.playerId
+        self.names[row] = player.name
+        self.positions[row] = self._code(getattr(player, 'position', ''), self._position_codes, self.position_names)
+        self.pro_teams[row] = self._code(getattr(player, 'proTeam', ''), self._pro_team_codes, self.pro_team_names)
+        self.avg_points[row] = getattr(player, 'avg_points', 0) or 0
+        self.projected_avg_points[row] = getattr(player, 'projected_avg_points', 0) or 0
+        self.projected_points[row] = getattr(player, 'projected_points', 0) or 0
+        self.points_per_game[row] = getattr(player, 'points_per_game', 0) or 0
+        owned = getattr(player, 'percent_owned', -1)
+        self.ownership[row] = owned if owned is not None and owned >= 0 else np.nan
+        self.roster_team[row] = team_id
+
+        self.actual[row] = np.nan
+        self.projected[row] = np.nan
+        for period, actual, projected in _period_points(getattr(player, 'stats', {}) or {}):
+            if period > self.num_periods:
+                continue
+            if actual is not None:
+                self.actual[row, period - 1] = actual
+            if projected is not None:
+                self.projected[row, period - 1] = projected
+        self.index[player.playerId] = row
+
+    def _grow(self, extra: int):
+        '''Appends extra empty rows to every column'''
+        self.player_ids = np.concatenate([self.player_ids, np.zeros(extra, dtype=np.int64)])
+        self.names.extend([''] * extra)
+        self.positions = np.concatenate([self.positions, np.zeros(extra, dtype=np.int16)])
+        self.pro_teams = np.concatenate([self.pro_teams, np.zeros(extra, dtype=np.int16)])
+        self.actual = np.vstack([self.actual, np.full((extra, self.num_periods), np.nan)])
+        self.projected = np.vstack([self.projected, np.full((extra, self.num_periods), np.nan)])
+        self.avg_points = np.concatenate([self.avg_points, np.zeros(extra)])
+        self.projected_avg_points = np.concatenate([self.projected_avg_points, np.zeros(extra)])
+        self.projected_points = np.concatenate([self.projected_points, np.zeros(extra)])
+        self.points_per_game = np.concatenate([self.points_per_game, np.zeros(extra)])
+        self.ownership = np.concatenate([self.ownership, np.full(extra, np.nan)])
+        self.roster_team = np.concatenate([self.roster_team, np.full(extra, FREE_AGENT, dtype=np.int32)])
+
+    def _widen(self, num_periods: int):
+        '''Extends the period axis of the points matrices'''
+        extra = num_periods - self.num_periods
+        self.actual = np.hstack([self.actual, np.full((len(self), extra), np.nan)])
+        self.projected = np.hstack([self.projected, np.full((len(self), extra), np.nan)])
+        self.num_periods = num_periods
+
+    def update_players(self, players: List, team_id: int = FREE_AGENT):
+        """
+        Insert or overwrite rows for the given players
+
+        Args:
+            players: Player objects to write
+            team_id: Roster assignment for these players (FREE_AGENT if unrostered)
+        """
+        max_period = self.num_periods
+        for player in players:
+            for period, _, _ in _period_points(getattr(player, 'stats', {}) or {}):
+                max_period = max(max_period, period)
+        if max_period > self.num_periods:
+            self._widen(max_period)
+
+        new_players = [p for p in players if p.playerId not in self.index]
+        start = len(self)
+        if new_players:
+            self._grow(len(new_players))
+            for offset, player in enumerate(new_players):
+                self.index[player.playerId] = start + offset
+
+        for player in players:
+            self._fill_row(self.index[player.playerId], player, team_id)
+
+    def refresh(self, teams: Optional[List] = None):
+        """
+        Incrementally refresh the frame from the current league rosters
+
+        Only the given teams are re-read (default: every team). Players that
+        left those rosters keep their stats but are marked as free agents.
+
+        Args:
+            teams: Teams whose rosters changed (default: all league teams)
+        """
+        teams = self.league.teams if teams is None else teams
+        for team in teams:
+            current = {player.playerId for player in team.roster}
+            for row in np.flatnonzero(self.roster_team == team.team_id):
+                if int(self.player_ids[row]) not in current:
+                    self.roster_team[row] = FREE_AGENT
+            self.update_players(team.roster, team.team_id)
+
+    def row(self, player_id: int) -> Optional[int]:
+        """Get the row index for a player id (None if not in the frame)"""
+        return self.index.get(player_id)
+
+    def weekly_points(self, player_id: int, projected: bool = False) -> np.ndarray:
+        """
+        Get a player's points for every scoring period
+
+        Args:
+            player_id: ESPN player id
+            projected: Return projected instead of actual points
+
+        Returns:
+            Array of length num_periods (NaN where no stat line exists)
+        """
+        row = self.index.get(player_id)
+        if row is None:
+            return np.full(self.num_periods, np.nan)
+        return (self.projected if projected else self.actual)[row]
+
+    def base_projection(self, player_id: int) -> Optional[float]:
+        """Projected average points, falling back to actual average points"""
+        row = self.index.get(player_id)
+        if row is None:
+            return None
+        return float(self.projected_avg_points[row] or self.avg_points[row])
+
+    def season_projection(self, player_id: int, num_games: int) -> Optional[float]:
+        """Projected points, falling back to points per game over num_games"""
+        row = self.index.get(player_id)
+        if row is None:
+            return None
+        return float(self.projected_points[row] or self.points_per_game[row] * num_games)
+
+    def position_mask(self, position: str) -> np.ndarray:
+        """Boolean mask of rows playing the given position"""
+        code = self._position_codes.get(position)
+        if code is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.positions == code
+
+    def team_mask(self, team_id: int) -> np.ndarray:
+        """Boolean mask of rows rostered by the given team"""
+        return self.roster_team == team_id
+
+    def to_dataframe(self):
+        """Export the per-player columns as a pandas DataFrame"""
+        import pandas as pd
+
+        return pd.DataFrame({
+            'playerId': self.player_ids,
+            'name': self.names,
+            'position': [self.position_names[code] for code in self.positions],
+            'proTeam': [self.pro_team_names[code] for code in self.pro_teams],
+            'team_id': self.roster_team,
+            'ownership': self.ownership,
+            'avg_points': self.avg_points,
+            'projected_avg_points': self.projected_avg_points,
+        })
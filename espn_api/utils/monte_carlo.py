@@ -3,17 +3,19 @@ from typing import List, Dict, Optional
 from ..base_league import BaseLeague
 
 class MonteCarloSimulator:
-    def __init__(self, league: BaseLeague, num_simulations: int = 1000, preseason: bool = False):
+    def __init__(self, league: BaseLeague, num_simulations: int = 1000, preseason: bool = False, frame=None):
         """Initialize Monte Carlo simulator for season predictions
         
         Args:
             league: League instance to simulate
             num_simulations: Number of season simulations to run
             preseason: If True, use preseason projections and simulate entire season
+            frame: Optional LeagueFrame to read player projections from
         """
         self.league = league
         self.num_simulations = num_simulations
         self.preseason = preseason
+        self.frame = frame
         self.teams = league.teams
         self.schedule = self._get_schedule()
         self.team_ratings = self._get_team_ratings()
@@ -67,14 +69,22 @@ class MonteCarloSimulator:
         """Get preseason projection for a team based on roster"""
         total_projection = 0
         for player in team.roster:
-            # Get player's ESPN projection
-            projection = getattr(player, 'projected_points', 0)
-            if projection == 0:
-                # Fallback to last season's points per game
-                projection = getattr(player, 'points_per_game', 0) * self.league.settings.reg_season_count
-            total_projection += projection
+            total_projection += self._player_projection(player)
         return total_projection
 
+    def _player_projection(self, player) -> float:
+        """Get a player's season projection"""
+        if self.frame is not None:
+            projection = self.frame.season_projection(player.playerId, self.league.settings.reg_season_count)
+            if projection is not None:
+                return projection
+        # Get player's ESPN projection
+        projection = getattr(player, 'projected_points', 0)
+        if projection == 0:
+            # Fallback to last season's points per game
+            projection = getattr(player, 'points_per_game', 0) * self.league.settings.reg_season_count
+        return projection
+
     def _calculate_roster_value(self, team) -> float:
         """Calculate overall roster value considering depth and positional importance"""
         value = 0
@@ -90,9 +100,7 @@ class MonteCarloSimulator:
         for player in team.roster:
             pos = player.position
             # Get player's projected points
-            points = getattr(player, 'projected_points', 0)
-            if points == 0:
-                points = getattr(player, 'points_per_game', 0) * self.league.settings.reg_season_count
+            points = self._player_projection(player)
             
             # Apply position weight
             value += points * position_weights.get(pos, 1.0)
@@ -155,10 +163,8 @@ class MonteCarloSimulator:
         
         for player in team.roster:
             pos = player.position
-            value = getattr(player, 'projected_points', 0)
-            if value == 0:
-                value = getattr(player, 'points_per_game', 0) * self.league.settings.reg_season_count
-                
+            value = self._player_projection(player)
+
             composition[pos] = composition.get(pos, 0) + value
             total_value += value
             
@@ -244,14 +250,9 @@ class MonteCarloSimulator:
         pos = player.position
         current_starter = self._get_current_starter(team, pos)
         
-        player_projection = getattr(player, 'projected_points', 0)
-        if player_projection == 0:
-            player_projection = getattr(player, 'points_per_game', 0) * self.league.settings.reg_season_count
-            
-        starter_projection = getattr(current_starter, 'projected_points', 0)
-        if starter_projection == 0:
-            starter_projection = getattr(current_starter, 'points_per_game', 0) * self.league.settings.reg_season_count
-            
+        player_projection = self._player_projection(player)
+        starter_projection = self._player_projection(current_starter) if current_starter else 0
+
         return player_projection - starter_projection
 
     def _get_current_starter(self, team, position: str):
@@ -6,12 +6,15 @@ to model different player states (hot streak, cold streak, normal)
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-from sklearn.mixture import GaussianMixture
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 import pickle
 import os
 from datetime import datetime, timedelta
 
+if TYPE_CHECKING:
+    # sklearn takes long to import, it is loaded when the first model is trained
+    from sklearn.mixture import GaussianMixture
+
 
 class PlayerPerformanceModel:
     """Models player performance using Gaussian Mixture Models"""
@@ -26,8 +29,9 @@ class PlayerPerformanceModel:
         """
         self.n_components = n_components
         self.cache_dir = cache_dir
-        self.models: Dict[int, GaussianMixture] = {}  # playerId -> GMM
+        self.models: Dict[int, 'GaussianMixture'] = {}  # playerId -> GMM
         self.player_states: Dict[int, Dict] = {}  # playerId -> state info
+        self.fit_count = 0  # GMM fits performed (cache hits excluded)
 
         os.makedirs(cache_dir, exist_ok=True)
 
@@ -43,7 +47,13 @@ class PlayerPerformanceModel:
         file_time = datetime.fromtimestamp(os.path.getmtime(cache_path))
         return datetime.now() - file_time < timedelta(hours=max_age_hours)
 
-    def train_model(self, player, year: int, force_retrain: bool = False) -> Optional[GaussianMixture]:
+    def train_model(
+        self,
+        player,
+        year: int,
+        force_retrain: bool = False,
+        weekly_scores: Optional[List[float]] = None
+    ) -> Optional['GaussianMixture']:
         """
         Train GMM for a player based on historical performance
 
@@ -51,6 +61,7 @@ class PlayerPerformanceModel:
             player: Player object with stats
             year: Current season year
             force_retrain: Force retraining even if cache exists
+            weekly_scores: Pre-extracted weekly scores (default: read player.stats)
 
         Returns:
             Trained GaussianMixture model or None if insufficient data
@@ -69,18 +80,15 @@ class PlayerPerformanceModel:
                 pass  # Cache load failed, retrain
 
         # Get historical weekly scores
-        weekly_scores = []
-        for week, stats in player.stats.items():
-            if week == 0:  # Skip season totals
-                continue
-            points = stats.get('points', 0)
-            if points > 0:  # Only include weeks where player played
-                weekly_scores.append(points)
+        if weekly_scores is None:
+            weekly_scores = self._weekly_scores(player)
 
         # Need at least 5 weeks of data for meaningful GMM
         if len(weekly_scores) < 5:
             return None
 
+        from sklearn.mixture import GaussianMixture
+
         # Reshape for sklearn
         X = np.array(weekly_scores).reshape(-1, 1)
 
@@ -93,6 +101,7 @@ class PlayerPerformanceModel:
                 random_state=42
             )
             gmm.fit(X)
+            self.fit_count += 1
 
             # Classify components as hot/normal/cold based on means
             component_means = gmm.means_.flatten()
@@ -138,6 +147,17 @@ class PlayerPerformanceModel:
         except Exception:
             return None
 
+    def _weekly_scores(self, player) -> List[float]:
+        """Extract weeks where the player scored from player.stats"""
+        weekly_scores = []
+        for week, stats in player.stats.items():
+            if week == 0:  # Skip season totals
+                continue
+            points = stats.get('points', 0)
+            if points > 0:  # Only include weeks where player played
+                weekly_scores.append(points)
+        return weekly_scores
+
     def predict_performance(
         self,
         player,
@@ -222,7 +242,7 @@ class PlayerPerformanceModel:
         """Get current state information for a player"""
         return self.player_states.get(player.playerId, {})
 
-    def bulk_train(self, players: List, year: int, force_retrain: bool = False) -> Dict[int, bool]:
+    def bulk_train(self, players: List, year: int, force_retrain: bool = False, frame=None) -> Dict[int, bool]:
         """
         Train models for multiple players
 
@@ -230,12 +250,17 @@ class PlayerPerformanceModel:
             players: List of Player objects
             year: Season year
             force_retrain: Force retraining even if cache exists
+            frame: Optional LeagueFrame to read weekly scores from
 
         Returns:
             Dict mapping player_id to training success
         """
         results = {}
         for player in players:
-            model = self.train_model(player, year, force_retrain)
+            weekly_scores = None
+            if frame is not None and frame.row(player.playerId) is not None:
+                points = frame.weekly_points(player.playerId)
+                weekly_scores = points[points > 0].tolist()
+            model = self.train_model(player, year, force_retrain, weekly_scores=weekly_scores)
             results[player.playerId] = model is not None
         return results
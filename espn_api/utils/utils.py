@@ -19,3 +19,15 @@ def json_parsing(obj, key):
 
     results = extract(obj, arr, key)
     return results[0] if results else results
+
+
+def news_items(news):
+    """Published date, headline and story of each item of a player news feed."""
+    return [
+        {
+            "published": item.get("published", ""),
+            "headline": item.get("headline", ""),
+            "story": item.get("story", "")
+        }
+        for item in news.get("news", {}).get("feed", [])
+    ]
@@ -14,13 +14,24 @@ For private leagues, you'll need to provide ESPN cookies:
 
 import argparse
 import json
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
 from typing import Optional
 
-import pandas as pd
+import numpy as np
+
 from espn_api.football import League
 from espn_api.utils.advanced_simulator import AdvancedFantasySimulator
+from espn_api.utils.instrumentation import PROFILERS, PhaseTimer, profile_call
+
+
+def _data_frame(rows):
+    """Table of rows, pandas is imported here since it is slow to load and only tables need it"""
+    import pandas as pd
+    return pd.DataFrame(rows)
 
 
 class FantasyDecisionMaker:
@@ -53,23 +64,22 @@ class FantasyDecisionMaker:
         self.year = year
         self.cache_dir = cache_dir
         self.num_simulations = num_simulations
+        self.timer = PhaseTimer()
 
         # Create cache directory
         os.makedirs(cache_dir, exist_ok=True)
 
         print(f"📊 Loading league {league_id} for {year}...")
-        self.league = League(
-            league_id=league_id,
-            year=year,
-            espn_s2=espn_s2,
-            swid=swid
-        )
+        with self.timer.phase('league_fetch'):
+            self.league = League(
+                league_id=league_id,
+                year=year,
+                espn_s2=espn_s2,
+                swid=swid
+            )
 
         print(f"🎯 Finding your team (ID: {team_id})...")
-        self.my_team = next((t for t in self.league.teams if t.team_id == team_id), None)
-
-        if not self.my_team:
-            raise ValueError(f"Team ID {team_id} not found in league")
+        self.my_team = self.team(team_id)
 
         print(f"✅ Found team: {self.my_team.team_name}")
         print(f"📈 Record: {self.my_team.wins}-{self.my_team.losses}")
@@ -77,47 +87,95 @@ class FantasyDecisionMaker:
         # Initialize simulator
         print(f"\n🔬 Initializing advanced simulator with {num_simulations:,} simulations...")
         print("   Training player performance models (this may take a minute)...")
-        self.simulator = AdvancedFantasySimulator(
-            league=self.league,
-            num_simulations=num_simulations,
-            cache_dir=cache_dir,
-            use_gmm=True
-        )
+        with self.timer.phase('gmm_training'):
+            self.simulator = AdvancedFantasySimulator(
+                league=self.league,
+                num_simulations=num_simulations,
+                cache_dir=cache_dir,
+                use_gmm=True
+            )
         print("✅ Simulator ready!\n")
 
-    def analyze_current_matchup(self):
-        """Analyze current week's matchup"""
+    def team(self, team_id: int):
+        """Team of the league with team_id, raises ValueError if there is none"""
+        team = next((t for t in self.league.teams if t.team_id == team_id), None)
+        if not team:
+            raise ValueError(f"Team ID {team_id} not found in league")
+        return team
+
+    def opponent(self, team, week: Optional[int] = None):
+        """Opponent of team in week (default: current week), None on a bye"""
+        week = week or self.league.current_week
+        opponent = team.schedule[week - 1]
+        if isinstance(opponent, int):
+            opponent = next((t for t in self.league.teams if t.team_id == opponent), None)
+        if not opponent or opponent.team_id == team.team_id:
+            return None
+        return opponent
+
+    def matchup_results(self, team, opponent, week: Optional[int] = None) -> dict:
+        """Simulated matchup of team against opponent (default: current week)"""
+        with self.timer.phase('matchup_simulation'):
+            return self.simulator.simulate_matchup(team, opponent, week=week or self.league.current_week)
+
+    def free_agent_pool(self, size: int = 100) -> list:
+        """Free agents to consider for pickups"""
+        with self.timer.phase('free_agent_fetch'):
+            return self.league.free_agents(size=size)
+
+    def free_agent_recommendations(self, team, free_agents: list, top_n: int = 10) -> list:
+        """Free agents that would improve team most over the rest of the season"""
+        with self.timer.phase('free_agent_scoring'):
+            return self.simulator.recommend_free_agents(
+                team,
+                free_agents,
+                top_n=top_n,
+                use_ros=True
+            )
+
+    def trade_opportunities(self, team) -> list:
+        """Realistic trades that favor team over the rest of the season"""
+        with self.timer.phase('trade_search'):
+            return self.simulator.find_trade_opportunities(
+                team,
+                min_advantage=3.0,  # Minimum 3 point advantage
+                max_trades_per_team=2,
+                min_acceptance_probability=30.0,  # At least 30% chance of acceptance
+                use_ros=True  # Use rest of season projections
+            )
+
+    def season_outlook(self) -> dict:
+        """Rest of season projections of every team, by team ID"""
+        with self.timer.phase('season_outlook'):
+            return self.simulator.simulate_season_rest_of_season()
+
+    def analyze_current_matchup(self, team=None, results: Optional[dict] = None):
+        """Analyze current week's matchup of team (default: your team), simulated unless results are given"""
+        team = team or self.my_team
         print("=" * 80)
         print(f"📅 WEEK {self.league.current_week} MATCHUP ANALYSIS")
         print("=" * 80)
 
         # Find current opponent
-        opponent_id = self.my_team.schedule[self.league.current_week - 1]
-        if isinstance(opponent_id, int):
-            opponent = next((t for t in self.league.teams if t.team_id == opponent_id), None)
-        else:
-            opponent = opponent_id
+        opponent = self.opponent(team)
 
-        if not opponent or opponent.team_id == self.my_team.team_id:
+        if not opponent:
             print("❌ No matchup this week (bye week)")
             return
 
-        print(f"\n{self.my_team.team_name} vs {opponent.team_name}")
-        print(f"Your Record: {self.my_team.wins}-{self.my_team.losses}")
+        print(f"\n{team.team_name} vs {opponent.team_name}")
+        print(f"Your Record: {team.wins}-{team.losses}")
         print(f"Their Record: {opponent.wins}-{opponent.losses}\n")
 
         # Run simulation
         print(f"🎲 Running {self.num_simulations:,} matchup simulations...")
-        results = self.simulator.simulate_matchup(
-            self.my_team,
-            opponent,
-            week=self.league.current_week
-        )
+        if results is None:
+            results = self.matchup_results(team, opponent)
 
         # Display results
         print(f"\n📊 SIMULATION RESULTS")
         print(f"{'─' * 80}")
-        print(f"\n{self.my_team.team_name}:")
+        print(f"\n{team.team_name}:")
         print(f"  Win Probability: {results['team1_win_probability']:.1f}%")
         print(f"  Projected Score: {results['team1_avg_score']:.1f} ± {results['team1_score_std']:.1f}")
         print(f"  Score Range (10th-90th percentile): {results['team1_score_range'][0]:.1f} - {results['team1_score_range'][1]:.1f}")
@@ -141,22 +199,21 @@ class FantasyDecisionMaker:
 
         print()
 
-    def analyze_free_agents(self, top_n: int = 10):
-        """Analyze and recommend free agents"""
+    def analyze_free_agents(self, top_n: int = 10, team=None, free_agents: Optional[list] = None,
+                            recommendations: Optional[list] = None):
+        """Analyze and recommend free agents for team (default: your team), fetched and scored unless given"""
+        team = team or self.my_team
         print("=" * 80)
         print("🆓 FREE AGENT ANALYSIS (REST OF SEASON)")
         print("=" * 80)
 
         print(f"\n📥 Fetching free agents...")
-        free_agents = self.league.free_agents(size=100)
+        if free_agents is None:
+            free_agents = self.free_agent_pool()
 
         print(f"🔍 Analyzing {len(free_agents)} free agents with ROS schedule awareness...\n")
-        recommendations = self.simulator.recommend_free_agents(
-            self.my_team,
-            free_agents,
-            top_n=top_n,
-            use_ros=True
-        )
+        if recommendations is None:
+            recommendations = self.free_agent_recommendations(team, free_agents, top_n=top_n)
 
         if not recommendations:
             print("✅ No significant free agent upgrades available")
@@ -193,7 +250,7 @@ class FantasyDecisionMaker:
                 'Own %': f"{rec['ownership_pct']:.1f}%"
             })
 
-        df = pd.DataFrame(data)
+        df = _data_frame(data)
         print(f"🎯 TOP FREE AGENT RECOMMENDATIONS{ros_label}:")
         if uses_ros:
             print("   (ROS values shown, season avg in parentheses if significantly different)\n")
@@ -202,8 +259,9 @@ class FantasyDecisionMaker:
         print(df.to_string(index=False))
         print()
 
-    def analyze_trades(self, max_opportunities: int = 5):
-        """Find and analyze trade opportunities"""
+    def analyze_trades(self, max_opportunities: int = 5, team=None, opportunities: Optional[list] = None):
+        """Find and analyze trade opportunities for team (default: your team), searched unless given"""
+        team = team or self.my_team
         print("=" * 80)
         print("🔄 TRADE OPPORTUNITY ANALYSIS (REST OF SEASON)")
         print("=" * 80)
@@ -211,13 +269,8 @@ class FantasyDecisionMaker:
         print(f"\n🔍 Searching for realistic trade opportunities...")
         print("   (Using ROS projections with schedule-aware matchup difficulty)\n")
 
-        opportunities = self.simulator.find_trade_opportunities(
-            self.my_team,
-            min_advantage=3.0,  # Minimum 3 point advantage
-            max_trades_per_team=2,
-            min_acceptance_probability=30.0,  # At least 30% chance of acceptance
-            use_ros=True  # Use rest of season projections
-        )
+        if opportunities is None:
+            opportunities = self.trade_opportunities(team)
 
         if not opportunities:
             print("❌ No favorable trade opportunities found")
@@ -263,45 +316,95 @@ class FantasyDecisionMaker:
                 print(f"  ⚠️  ASYMMETRIC BUT UNFAIR: You gain much more, unlikely to be accepted")
             print()
 
-    def analyze_season_outlook(self):
-        """Analyze rest of season outlook"""
+    def analyze_season_outlook(self, team=None, results: Optional[dict] = None):
+        """Analyze rest of season outlook for team (default: your team), simulated unless results are given"""
+        team = team or self.my_team
         print("=" * 80)
         print("🏆 REST OF SEASON OUTLOOK")
         print("=" * 80)
 
         print(f"\n🎲 Simulating rest of season ({self.num_simulations:,} simulations)...")
-        results = self.simulator.simulate_season_rest_of_season()
+        if results is None:
+            results = self.season_outlook()
 
         # Create standings DataFrame
         data = []
-        for team in self.league.teams:
-            team_results = results[team.team_id]
+        for other in self.league.teams:
+            team_results = results[other.team_id]
             data.append({
-                'Team': team.team_name[:25],
-                'Current': f"{team.wins}-{team.losses}",
+                'Team': other.team_name[:25],
+                'Current': f"{other.wins}-{other.losses}",
                 'Proj Wins': f"{team_results['projected_wins']:.1f}",
                 'Playoff %': f"{team_results['playoff_odds']:.1f}%",
                 'Ship %': f"{team_results['championship_odds']:.1f}%"
             })
 
         # Sort by projected wins
-        df = pd.DataFrame(data)
+        df = _data_frame(data)
         df = df.sort_values('Proj Wins', ascending=False)
 
         print(f"\n📊 PROJECTED STANDINGS:\n")
         print(df.to_string(index=False))
 
         # Highlight my team
-        my_results = results[self.team_id]
+        my_results = results[team.team_id]
         print(f"\n{'─' * 80}")
-        print(f"YOUR TEAM: {self.my_team.team_name}")
+        print(f"YOUR TEAM: {team.team_name}")
         print(f"{'─' * 80}")
-        print(f"  Current Record:        {self.my_team.wins}-{self.my_team.losses}")
+        print(f"  Current Record:        {team.wins}-{team.losses}")
         print(f"  Projected Final Wins:  {my_results['projected_wins']:.1f}")
         print(f"  Playoff Odds:          {my_results['playoff_odds']:.1f}%")
         print(f"  Championship Odds:     {my_results['championship_odds']:.1f}%")
         print()
 
+    def analyze_power_rankings(self, rankings: Optional[list] = None):
+        """Show this week's power rankings, computed unless rankings are given"""
+        print("=" * 80)
+        print(f"💪 WEEK {self.league.current_week} POWER RANKINGS")
+        print("=" * 80)
+
+        if rankings is None:
+            rankings = self.power_rankings()
+
+        data = [{
+            'Rank': i,
+            'Team': team.team_name[:25],
+            'Record': f"{team.wins}-{team.losses}",
+            'Power': points
+        } for i, (points, team) in enumerate(rankings, 1)]
+
+        print()
+        print(_data_frame(data).to_string(index=False))
+        print()
+
+    def power_rankings(self) -> list:
+        """(power points, team) of every team for the current week, best first"""
+        with self.timer.phase('power_rankings'):
+            return self.league.power_rankings(week=self.league.current_week)
+
+    def timing_summary(self) -> dict:
+        """
+        Machine readable timing summary
+
+        Returns:
+            Dict with per-phase seconds and calls, plus counters for HTTP requests,
+            bytes downloaded, simulations run and GMM fits
+        """
+        request_stats = getattr(getattr(self.league, 'espn_request', None), 'stats', None)
+        if isinstance(request_stats, dict):
+            self.timer.set_counter('http_requests', request_stats.get('requests', 0))
+            self.timer.set_counter('bytes_downloaded', request_stats.get('bytes', 0))
+
+        simulations_run = getattr(self.simulator, 'simulations_run', None)
+        if isinstance(simulations_run, int):
+            self.timer.set_counter('simulations_run', simulations_run)
+
+        fit_count = getattr(getattr(self.simulator, 'player_model', None), 'fit_count', None)
+        if isinstance(fit_count, int):
+            self.timer.set_counter('gmm_fits', fit_count)
+
+        return self.timer.summary()
+
     def generate_weekly_report(self, output_file: Optional[str] = None):
         """Generate comprehensive weekly report"""
         # Create reports directory if it doesn't exist
@@ -344,10 +447,119 @@ class FantasyDecisionMaker:
             # Trades
             self.analyze_trades(max_opportunities=5)
 
+            # Timing
+            print("=" * 80)
+            print("⏱️  TIMING SUMMARY (JSON)")
+            print("=" * 80)
+            print(json.dumps(self.timing_summary(), indent=2))
+
         sys.stdout = original_stdout
 
         print(f"✅ Report saved to: {output_file}\n")
 
+    def _team_sections(self, team, free_agents: list, top_n: int, seed: Optional[int] = None) -> dict:
+        """Matchup, free agent and trade sections of one team's league report, simulated from seed if given"""
+        if seed is not None:
+            np.random.seed(seed)
+        opponent = self.opponent(team)
+        matchup = self.matchup_results(team, opponent) if opponent else None
+        if matchup:
+            # the raw scores of every simulation are not reported
+            matchup = {k: v for k, v in matchup.items() if k not in ('team1_scores', 'team2_scores')}
+        return {
+            'matchup': matchup,
+            'recommendations': self.free_agent_recommendations(team, free_agents, top_n=top_n),
+            'opportunities': self.trade_opportunities(team)
+        }
+
+    def generate_league_reports(self, output_dir: Optional[str] = None, max_workers: Optional[int] = None,
+                                top_n: int = 10, max_opportunities: int = 5) -> dict:
+        """
+        Generate a weekly report for every team of the league
+
+        League level sections (season outlook, power rankings) and the free agent pool are
+        computed once and shared. The per-team sections (matchup, free agents, trades) are
+        CPU bound simulations, so they run in max_workers forked processes that inherit the
+        league, trained models and simulator instead of building their own. Without fork
+        (Windows) or with max_workers=1 they run in this process. One report is written per team.
+
+        Args:
+            output_dir: Directory for the reports (default: reports/league_report_week<N>_<date>)
+            max_workers: Worker processes (default: CPU count)
+            top_n: Free agent recommendations per team
+            max_opportunities: Trade opportunities shown per team
+
+        Returns:
+            Dict mapping team_id to its report path
+        """
+        if output_dir is None:
+            output_dir = os.path.join("reports", f"league_report_week{self.league.current_week}_{datetime.now().strftime('%Y%m%d')}")
+        os.makedirs(output_dir, exist_ok=True)
+        teams = list(self.league.teams)
+        max_workers = min(max_workers or os.cpu_count() or 1, len(teams))
+        parallel = max_workers > 1 and 'fork' in multiprocessing.get_all_start_methods()
+
+        print("=" * 80)
+        print(f"📝 GENERATING LEAGUE REPORTS ({len(teams)} teams)")
+        print("=" * 80)
+
+        print(f"\n🏆 Computing league sections...")
+        outlook = self.season_outlook()
+        rankings = self.power_rankings()
+        free_agents = self.free_agent_pool()
+
+        # every team simulates from its own seed, so its sections do not depend on the number
+        # of workers or on which teams a worker ran before
+        base_seed = int(np.random.randint(2 ** 32, dtype=np.uint64))
+        seeds = {team.team_id: int(np.random.SeedSequence([base_seed, team.team_id]).generate_state(1)[0]) for team in teams}
+
+        print(f"🎲 Analyzing {len(teams)} teams ({max_workers if parallel else 1} processes)...")
+        if parallel:
+            # forked workers inherit the decision maker through initargs instead of having it pickled
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('fork'),
+                                     initializer=_init_league_report_worker, initargs=(self, free_agents, top_n)) as executor:
+                results = list(executor.map(_league_report_sections, seeds.keys(), seeds.values()))
+            sections = {}
+            for team_id, team_sections, phases, simulations_run in results:
+                sections[team_id] = team_sections
+                self.timer.merge(phases)
+                if isinstance(self.simulator.simulations_run, int):
+                    self.simulator.simulations_run += simulations_run
+        else:
+            sections = {team.team_id: self._team_sections(team, free_agents, top_n, seed=seeds[team.team_id]) for team in teams}
+
+        timing = self.timing_summary()
+        reports = {}
+        for team in teams:
+            output_file = os.path.join(output_dir, f"team{team.team_id}.txt")
+            computed = sections[team.team_id]
+            with open(output_file, 'w') as f, redirect_stdout(f):
+                print(f"FANTASY FOOTBALL WEEKLY REPORT")
+                print(f"League: {self.league_id}")
+                print(f"Team: {team.team_name}")
+                print(f"Week: {self.league.current_week}")
+                print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                print(f"Simulations: {self.num_simulations:,}")
+                print("\n")
+
+                self.analyze_current_matchup(team, results=computed['matchup'])
+                self.analyze_season_outlook(team, results=outlook)
+                self.analyze_power_rankings(rankings)
+                self.analyze_free_agents(top_n=top_n, team=team, free_agents=free_agents,
+                                         recommendations=computed['recommendations'])
+                self.analyze_trades(max_opportunities=max_opportunities, team=team,
+                                    opportunities=computed['opportunities'])
+
+                # Timing of the whole league run
+                print("=" * 80)
+                print("⏱️  TIMING SUMMARY (JSON)")
+                print("=" * 80)
+                print(json.dumps(timing, indent=2))
+            reports[team.team_id] = output_file
+
+        print(f"✅ {len(reports)} reports saved to: {output_dir}\n")
+        return reports
+
     def run_interactive(self):
         """Run interactive decision-making session"""
         while True:
@@ -384,6 +596,28 @@ class FantasyDecisionMaker:
             input("\nPress Enter to continue...")
 
 
+# (decision maker, free agents, top_n) of a league report worker process, set by _init_league_report_worker
+_league_report = None
+
+
+def _init_league_report_worker(dm, free_agents: list, top_n: int):
+    """Worker process initializer: keeps the report inputs passed by the parent"""
+    global _league_report
+    _league_report = (dm, free_agents, top_n)
+
+
+def _league_report_sections(team_id: int, seed: int):
+    """Worker process: one team's report sections, with the phases and simulations it timed"""
+    dm, free_agents, top_n = _league_report
+    # this process's copy of the timer only collects this team's phases
+    dm.timer = PhaseTimer()
+    before = dm.simulator.simulations_run
+    sections = dm._team_sections(dm.team(team_id), free_agents, top_n, seed=seed)
+    after = dm.simulator.simulations_run
+    simulations_run = after - before if isinstance(before, int) and isinstance(after, int) else 0
+    return team_id, sections, dm.timer.phases, simulations_run
+
+
 def load_config(config_path: str) -> dict:
     """Load configuration from JSON file"""
     with open(config_path, 'r') as f:
@@ -410,6 +644,12 @@ Examples:
   # Quick report generation (non-interactive)
   python fantasy_decision_maker.py --league-id 123456 --team-id 1 --report-only
 
+  # Reports for every team of the league, sharing one league and simulator
+  python fantasy_decision_maker.py --league-id 123456 --team-id 1 --league-reports
+
+  # Long running JSON service for any team (e.g. for a league chat bot)
+  python fantasy_decision_maker.py --config config.json --serve --port 8765
+
 Getting ESPN Cookies for Private Leagues:
   1. Log into ESPN Fantasy Football in your browser
   2. Open Developer Tools (F12)
@@ -437,6 +677,20 @@ Getting ESPN Cookies for Private Leagues:
                         help='Cache directory for player models (default: .cache)')
     parser.add_argument('--report-only', action='store_true',
                         help='Generate report and exit (non-interactive)')
+    parser.add_argument('--league-reports', action='store_true',
+                        help='Generate a report for every team of the league and exit')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes of --league-reports (default: CPU count)')
+    parser.add_argument('--serve', action='store_true',
+                        help='Run a local JSON decision service instead of the interactive mode')
+    parser.add_argument('--host', type=str, default='127.0.0.1',
+                        help='Service interface (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765,
+                        help='Service port (default: 8765)')
+    parser.add_argument('--refresh-interval', type=float, default=300,
+                        help='Seconds between background league refreshes of the service (default: 300)')
+    parser.add_argument('--profile', nargs='?', const='cprofile', default=None, choices=PROFILERS,
+                        help='Profile the run with cprofile (default) or pyinstrument, saved to reports/')
 
     args = parser.parse_args()
 
@@ -488,8 +742,7 @@ Getting ESPN Cookies for Private Leagues:
         print("❌ Error: --team-id is required (or specify --config)")
         return 1
 
-    # Create decision maker
-    try:
+    def run():
         dm = FantasyDecisionMaker(
             league_id=league_id,
             team_id=team_id,
@@ -500,13 +753,33 @@ Getting ESPN Cookies for Private Leagues:
             num_simulations=num_simulations
         )
 
-        if args.report_only:
+        if args.serve:
+            from decision_service import serve
+            serve(dm, host=args.host, port=args.port, refresh_interval=args.refresh_interval)
+        elif args.league_reports:
+            dm.generate_league_reports(max_workers=args.workers)
+        elif args.report_only:
             # Generate report and exit
             dm.generate_weekly_report()
         else:
             # Run interactive mode
             dm.run_interactive()
 
+        print(dm.timer.format_table())
+        return dm
+
+    # Create decision maker
+    try:
+        if args.profile:
+            os.makedirs("reports", exist_ok=True)
+            extension = 'html' if args.profile == 'pyinstrument' else 'prof'
+            profile_path = os.path.join("reports", f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}")
+            _, report = profile_call(run, profiler=args.profile, output_path=profile_path)
+            print(report)
+            print(f"✅ Profile saved to: {profile_path}\n")
+        else:
+            run()
+
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
@@ -1,12 +1,16 @@
 
 from unittest import TestCase, mock
 from espn_api.requests.espn_requests import EspnFantasyRequests, ESPNAccessDenied
+from espn_api.requests.throttle import throttle
 
 class DummyLogger:
     def log_request(self, **kwargs):
         pass
 
 class TestAccessDenied(TestCase):
+    def setUp(self):
+        throttle.reset()
+
     def test_access_denied_no_cookies(self):
         req = EspnFantasyRequests(sport='nfl', year=2024, league_id=123456, cookies=None, logger=DummyLogger())
         with self.assertRaises(ESPNAccessDenied) as excinfo:
@@ -27,7 +31,7 @@ class TestAccessDenied(TestCase):
             req.checkRequestStatus(401)
         self.assertIn('espn_s2 and swid are required', str(excinfo.exception))
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_access_denied_with_cookies(self, mock_get):
         cookies = {'espn_s2': 'some_s2', 'SWID': 'some_swid'}
         req = EspnFantasyRequests(sport='nfl', year=2024, league_id=123456, cookies=cookies, logger=DummyLogger())
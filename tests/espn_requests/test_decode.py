@@ -0,0 +1,47 @@
+import json
+from unittest import TestCase, mock, skipIf
+
+import requests_mock
+
+from espn_api.requests import decode
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.throttle import throttle
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+class DecodeTest(TestCase):
+    def setUp(self):
+        throttle.reset()
+        with open('tests/hockey/unit/data/player_data.json') as data:
+            self.body = data.read().encode('utf-8')
+        self.expected = [{'id': player['id'], 'fullName': player['fullName']} for player in json.loads(self.body)]
+
+    def test_iter_fields_without_ijson(self):
+        with mock.patch.dict(decode._modules, {'ijson': None}):
+            players = list(decode.iter_fields(self.body, ('id', 'fullName')))
+
+        self.assertEqual(players, self.expected)
+
+    @skipIf(ijson is None, 'ijson is not installed')
+    def test_iter_fields_with_ijson(self):
+        players = list(decode.iter_fields(self.body, ('id', 'fullName')))
+
+        self.assertEqual(players, self.expected)
+
+    def test_loads_without_orjson(self):
+        with mock.patch.dict(decode._modules, {'orjson': None}):
+            self.assertEqual(decode.loads(self.body), json.loads(self.body))
+
+    @requests_mock.Mocker()
+    def test_get_pro_players_fields(self, m):
+        m.get(FANTASY_BASE_ENDPOINT + 'fhl/seasons/2020/players?view=players_wl', content=self.body)
+        request = EspnFantasyRequests(sport='nhl', year=2020, league_id=1)
+
+        players = request.get_pro_players(fields=('id', 'fullName'))
+
+        self.assertEqual(players, self.expected)
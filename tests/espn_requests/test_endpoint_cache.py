@@ -0,0 +1,44 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import requests_mock
+
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
+from espn_api.requests.endpoint_cache import EndpointCache, endpoint_cache, LEAGUE_HISTORY, SEASONS
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.throttle import throttle
+
+
+class EndpointCacheTest(TestCase):
+    def setUp(self):
+        endpoint_cache.clear()
+        throttle.reset()
+        self.addCleanup(endpoint_cache.clear)
+        self.seasons_endpoint = FANTASY_BASE_ENDPOINT + 'ffl/seasons/2019/segments/0/leagues/1234'
+        self.history_endpoint = FANTASY_BASE_ENDPOINT + 'ffl/leagueHistory/1234?seasonId=2019'
+
+    @requests_mock.Mocker()
+    def test_resolved_flavor_reused(self, m):
+        m.get(self.seasons_endpoint, status_code=401)
+        m.get(self.history_endpoint, json=[{'id': 1234}])
+
+        first = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234)
+        self.assertEqual(first.league_get(), {'id': 1234})
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(endpoint_cache.get('nfl', 1234, 2019), LEAGUE_HISTORY)
+
+        second = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234)
+        self.assertEqual(second.league_get(), {'id': 1234})
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(second.LEAGUE_ENDPOINT, self.history_endpoint)
+
+    def test_file_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'endpoints.json')
+            EndpointCache(path).set('nfl', 1234, 2016, SEASONS)
+
+            cache = EndpointCache(path)
+
+            self.assertEqual(cache.get('nfl', 1234, 2016), SEASONS)
+            self.assertIsNone(cache.get('nfl', 1234, 2017))
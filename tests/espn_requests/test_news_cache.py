@@ -0,0 +1,95 @@
+from unittest import TestCase, mock
+
+import requests
+import requests_mock
+
+from benchmarks.synthetic import SyntheticLeague
+
+from espn_api.requests.constant import NEWS_BASE_ENDPOINT
+from espn_api.requests.endpoint_cache import endpoint_cache
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.news_cache import NewsCache, news_cache
+from espn_api.requests.throttle import throttle
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def feed(request, context):
+    player_id = int(request.qs['playerid'][0])
+    return {'news': {'feed': [{'headline': 'Player %s' % player_id, 'story': 'Story', 'published': '2024-01-01'}]}}
+
+
+class NewsCacheTest(TestCase):
+    def setUp(self):
+        endpoint_cache.clear()
+        throttle.reset()
+        news_cache.clear()
+        self.addCleanup(news_cache.clear)
+        self.endpoint = NEWS_BASE_ENDPOINT + 'fba/news/players'
+        self.espn_request = EspnFantasyRequests(sport='nba', year=2024, league_id=1234)
+
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = NewsCache(ttl=60, clock=clock)
+        cache.put(('nba', 1), {'news': {}})
+        clock.now = 59
+        self.assertEqual(cache.get(('nba', 1)), {'news': {}})
+        self.assertIsNone(cache.get(('nba', 1), ttl=30))
+        clock.now = 60
+        self.assertIsNone(cache.get(('nba', 1)))
+        self.assertEqual(cache.stats, {'hits': 1, 'misses': 2})
+
+    @requests_mock.Mocker()
+    def test_bulk_fetch_cached(self, m):
+        m.get(self.endpoint, json=feed)
+        news = self.espn_request.get_players_news([1, 2, 3, 2], max_workers=3)
+        self.assertEqual(list(news), [1, 2, 3])
+        self.assertEqual(news[3]['news']['feed'][0]['headline'], 'Player 3')
+        self.assertEqual(m.call_count, 3)
+
+        # other leagues of the sport share the feeds
+        other = EspnFantasyRequests(sport='nba', year=2024, league_id=5678)
+        news = other.get_players_news([3, 4])
+        self.assertEqual(news[4]['news']['feed'][0]['headline'], 'Player 4')
+        self.assertEqual(m.call_count, 4)
+
+        # an expired feed is fetched again
+        self.espn_request.get_players_news([1], ttl=0)
+        self.assertEqual(m.call_count, 5)
+
+    @requests_mock.Mocker()
+    def test_failed_feed(self, m):
+        def feed_or_error(request, context):
+            if request.qs['playerid'][0] == '2':
+                raise requests.exceptions.ConnectTimeout('timed out')
+            return feed(request, context)
+
+        m.get(self.endpoint, json=feed_or_error)
+        with self.assertLogs(level='WARNING') as logs:
+            news = self.espn_request.get_players_news([1, 2, 3], max_workers=3)
+        self.assertEqual(list(news), [1, 2, 3])
+        self.assertIsNone(news[2])
+        self.assertEqual(news[3]['news']['feed'][0]['headline'], 'Player 3')
+        self.assertIn('player 2', logs.output[0])
+
+        # the failed feed is not cached, the others are
+        m.get(self.endpoint, json=feed)
+        calls = m.call_count
+        news = self.espn_request.get_players_news([1, 2, 3])
+        self.assertEqual(news[2]['news']['feed'][0]['headline'], 'Player 2')
+        self.assertEqual(m.call_count, calls + 1)
+
+    def test_attach_news(self):
+        league = SyntheticLeague('nba', num_teams=4, roster_size=3, year=2024).league()
+        players = league.teams[0].roster
+        news = {'news': {'feed': [{'headline': 'Headline', 'story': 'Story', 'published': '2024-01-01'}]}}
+        with mock.patch.object(league.espn_request, 'get_player_news', return_value=news) as get_player_news:
+            self.assertIs(league.attach_news(players), players)
+        self.assertEqual(get_player_news.call_count, len(players))
+        self.assertEqual(players[0].news, [{'published': '2024-01-01', 'headline': 'Headline', 'story': 'Story'}])
@@ -0,0 +1,68 @@
+import json
+from unittest import TestCase
+
+import requests_mock
+
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
+from espn_api.requests.endpoint_cache import endpoint_cache
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.throttle import throttle
+
+
+class RequestPlannerTest(TestCase):
+    def setUp(self):
+        endpoint_cache.clear()
+        throttle.reset()
+        self.addCleanup(endpoint_cache.clear)
+        self.endpoint = FANTASY_BASE_ENDPOINT + 'ffl/seasons/2019/segments/0/leagues/1234'
+        self.espn_request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234)
+        self.response = {
+            'id': 1234,
+            'schedule': [{'id': 1}],
+            'players': [{'id': 2}],
+            'positionAgainstOpponent': {'positionalRatings': {}},
+        }
+
+    @requests_mock.Mocker()
+    def test_compatible_views_merged(self, m):
+        m.get(self.endpoint, json=self.response)
+        plan = self.espn_request.plan()
+        scores = plan.add(['mMatchupScore', 'mScoreboard'], params={'scoringPeriodId': 3},
+                          headers={'x-fantasy-filter': json.dumps({'schedule': {'filterMatchupPeriodIds': {'value': [3]}}})})
+        ratings = plan.add('mPositionalRatings', params={'scoringPeriodId': 3})
+
+        self.assertEqual(plan.execute(), 1)
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(m.last_request.qs['view'], ['mmatchupscore', 'mscoreboard', 'mpositionalratings'])
+        self.assertEqual(json.loads(m.last_request.headers['x-fantasy-filter']), {'schedule': {'filterMatchupPeriodIds': {'value': [3]}}})
+
+        # each caller only gets its own collections and the shared keys
+        self.assertEqual(scores.response, {'id': 1234, 'schedule': [{'id': 1}], 'players': [{'id': 2}]})
+        self.assertEqual(ratings.response, {'id': 1234, 'positionAgainstOpponent': {'positionalRatings': {}}, 'players': [{'id': 2}]})
+
+    @requests_mock.Mocker()
+    def test_filters_merged_when_disjoint(self, m):
+        m.get(self.endpoint, json=self.response)
+        plan = self.espn_request.plan()
+        plan.add('mScoreboard', params={'scoringPeriodId': 3}, headers={'x-fantasy-filter': json.dumps({'schedule': {'limit': 1}})})
+        plan.add('kona_player_info', params={'scoringPeriodId': 3}, headers={'x-fantasy-filter': json.dumps({'players': {'limit': 5}})})
+
+        self.assertEqual(plan.execute(), 1)
+        self.assertEqual(json.loads(m.last_request.headers['x-fantasy-filter']), {'schedule': {'limit': 1}, 'players': {'limit': 5}})
+
+    @requests_mock.Mocker()
+    def test_incompatible_requests_kept_apart(self, m):
+        m.get(self.endpoint, json=self.response)
+        plan = self.espn_request.plan()
+        # different scoring periods
+        plan.add('mPositionalRatings', params={'scoringPeriodId': 3})
+        plan.add('mPositionalRatings', params={'scoringPeriodId': 4})
+        # a players filter would change the other requests players
+        plan.add('kona_player_info', params={'scoringPeriodId': 5}, headers={'x-fantasy-filter': json.dumps({'players': {'limit': 5}})})
+        plan.add('kona_playercard', params={'scoringPeriodId': 5})
+        # unknown views are only merged without filters
+        plan.add('mLiveScoring', params={'scoringPeriodId': 5})
+
+        self.assertEqual(plan.execute(), 4)
+        self.assertEqual(m.call_count, 4)
+        self.assertEqual(self.espn_request.stats['requests'], 4)
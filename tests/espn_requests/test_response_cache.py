@@ -0,0 +1,67 @@
+from unittest import TestCase, mock
+
+import requests_mock
+
+from benchmarks.synthetic import SyntheticLeague
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
+from espn_api.requests.endpoint_cache import endpoint_cache
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.response_cache import ResponseCache, CachedResponse
+from espn_api.requests.throttle import throttle
+
+
+class ResponseCacheTest(TestCase):
+    def setUp(self):
+        endpoint_cache.clear()
+        throttle.reset()
+        self.addCleanup(endpoint_cache.clear)
+        self.endpoint = FANTASY_BASE_ENDPOINT + 'ffl/seasons/2019/segments/0/leagues/1234'
+        self.espn_request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234)
+        self.params = {'view': 'mMatchupScore', 'scoringPeriodId': 3}
+
+    @requests_mock.Mocker()
+    def test_etag_revalidated(self, m):
+        m.get(self.endpoint, [
+            {'json': {'schedule': [1]}, 'headers': {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}},
+            {'status_code': 304},
+        ])
+        first = self.espn_request.league_get(params=self.params)
+        second = self.espn_request.league_get(params=self.params)
+
+        self.assertIs(second, first)
+        self.assertEqual(m.last_request.headers['If-None-Match'], '"v1"')
+        self.assertEqual(m.last_request.headers['If-Modified-Since'], 'Wed, 21 Oct 2015 07:28:00 GMT')
+        self.assertEqual(self.espn_request.response_cache.stats, {'not_modified': 1, 'unchanged': 0, 'changed': 1})
+
+    @requests_mock.Mocker()
+    def test_identical_body_without_validators(self, m):
+        m.get(self.endpoint, [{'json': {'schedule': [1]}}, {'json': {'schedule': [1]}}, {'json': {'schedule': [2]}}])
+        first = self.espn_request.league_get(params=self.params)
+        second = self.espn_request.league_get(params=self.params)
+        third = self.espn_request.league_get(params=self.params)
+
+        self.assertNotIn('If-None-Match', m.last_request.headers)
+        self.assertIs(second, first)
+        self.assertEqual(third, {'schedule': [2]})
+        self.assertEqual(self.espn_request.response_cache.stats, {'not_modified': 0, 'unchanged': 1, 'changed': 2})
+
+    @requests_mock.Mocker()
+    def test_keyed_by_request(self, m):
+        m.get(self.endpoint, json={'schedule': [1]})
+        first = self.espn_request.league_get(params=self.params)
+        other_week = self.espn_request.league_get(params=dict(self.params, scoringPeriodId=4))
+        self.assertIsNot(other_week, first)
+        self.assertEqual(len(self.espn_request.response_cache), 2)
+
+    def test_lru(self):
+        cache = ResponseCache(max_entries=2)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, CachedResponse({}, digest=key))
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 2)
+
+    def test_refresh_skips_unchanged_league(self):
+        league = SyntheticLeague('nfl', num_teams=6, roster_size=3, year=2024).league()
+        with mock.patch.object(league, '_refresh_teams') as refresh_teams:
+            league.refresh()
+        refresh_teams.assert_not_called()
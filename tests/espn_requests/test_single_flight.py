@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import requests_mock
+
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
+from espn_api.requests.endpoint_cache import endpoint_cache
+from espn_api.requests.espn_requests import EspnFantasyRequests, ESPNInvalidLeague
+from espn_api.requests.single_flight import AsyncSingleFlight, SingleFlight
+from espn_api.requests.throttle import throttle
+
+
+class SingleFlightTest(TestCase):
+    def setUp(self):
+        endpoint_cache.clear()
+        throttle.reset()
+        self.addCleanup(endpoint_cache.clear)
+        self.endpoint = FANTASY_BASE_ENDPOINT + 'ffl/seasons/2019/segments/0/leagues/1234'
+        self.release = threading.Event()
+
+    def slow_response(self, request, context):
+        self.release.wait(5)
+        return {'id': 1234}
+
+    def run_concurrently(self, fn, count=5):
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(fn) for _ in range(count)]
+            # let every thread reach the in flight call before it returns
+            time.sleep(0.2)
+            self.release.set()
+            return [future.result() for future in futures]
+
+    def test_do(self):
+        flight = SingleFlight()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            self.release.wait(5)
+            return object()
+
+        results = self.run_concurrently(lambda: flight.do('key', fn))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(flight.stats, {'calls': 1, 'shared': 4})
+        self.assertEqual(flight.in_flight(), 0)
+        # finished calls are not cached
+        self.assertIsNot(flight.do('key', fn), results[0])
+
+    @requests_mock.Mocker()
+    def test_identical_requests_share_one_call(self, m):
+        m.get(self.endpoint, json=self.slow_response)
+        requests = [EspnFantasyRequests(sport='nfl', year=2019, league_id=1234) for _ in range(5)]
+        calls = iter(requests)
+        results = self.run_concurrently(lambda: next(calls).league_get(params={'view': 'mTeam'}))
+
+        self.assertEqual(m.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(sum(request.stats['requests'] for request in requests), 1)
+
+    @requests_mock.Mocker()
+    def test_different_requests_not_shared(self, m):
+        m.get(self.endpoint, json={'id': 1234})
+        espn_request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234)
+        self.release.set()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda week: espn_request.league_get(params={'scoringPeriodId': week}), [1, 2]))
+        self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_errors_shared(self, m):
+        def not_found(request, context):
+            self.release.wait(5)
+            context.status_code = 404
+            return {}
+        m.get(self.endpoint, json=not_found)
+        espn_request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234)
+
+        def call():
+            try:
+                espn_request.league_get()
+            except ESPNInvalidLeague as e:
+                return e
+        errors = self.run_concurrently(call, count=3)
+        self.assertEqual(m.call_count, 1)
+        self.assertTrue(all(isinstance(error, ESPNInvalidLeague) for error in errors))
+
+    @requests_mock.Mocker()
+    def test_async(self, m):
+        m.get(self.endpoint, json=self.slow_response)
+        espn_request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234)
+
+        async def main():
+            tasks = [asyncio.ensure_future(espn_request.league_get_async(params={'view': 'mTeam'})) for _ in range(5)]
+            await asyncio.sleep(0.2)
+            self.release.set()
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(main())
+        self.assertEqual(m.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_async_cancelled_waiter(self):
+        flight = AsyncSingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.05)
+            return 'done'
+
+        async def main():
+            first = asyncio.ensure_future(flight.do('key', fn))
+            second = asyncio.ensure_future(flight.do('key', fn))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(main()), 'done')
+        self.assertEqual(flight.stats, {'calls': 1, 'shared': 1})
@@ -0,0 +1,127 @@
+from unittest import TestCase
+
+import requests
+import requests_mock
+
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
+from espn_api.requests.endpoint_cache import endpoint_cache
+from espn_api.requests.espn_requests import EspnFantasyRequests, ESPNUnknownError
+from espn_api.requests.throttle import ESPNUnavailable, RequestThrottle, TokenBucket, parse_retry_after
+from espn_api.requests.transport import LiveTransport
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class ThrottleTest(TestCase):
+    def setUp(self):
+        endpoint_cache.clear()
+        self.addCleanup(endpoint_cache.clear)
+        self.endpoint = FANTASY_BASE_ENDPOINT + 'ffl/seasons/2019/segments/0/leagues/1234'
+        self.clock = FakeClock()
+        self.throttle = RequestThrottle(requests_per_second=2, burst=2, max_retries=3, failure_threshold=3,
+                                        reset_timeout=10, sleep=self.clock.sleep, clock=self.clock)
+        self.espn_request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234, transport=LiveTransport(throttle=self.throttle))
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=2, burst=2, clock=self.clock)
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0, 0, 0.5, 1.0])
+        self.clock.now = 10
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(TokenBucket(rate=None).reserve(), 0)
+
+    @requests_mock.Mocker()
+    def test_rate_limited(self, m):
+        m.get(self.endpoint, json={'id': 1234})
+        for _ in range(4):
+            self.espn_request.league_get()
+        self.assertEqual(self.throttle.stats['throttled'], 2)
+        self.assertEqual(self.clock.now, 1.0)
+
+    @requests_mock.Mocker()
+    def test_retry_after_honored(self, m):
+        m.get(self.endpoint, [{'status_code': 429, 'headers': {'Retry-After': '7'}}, {'json': {'id': 1234}}])
+        self.assertEqual(self.espn_request.league_get(), {'id': 1234})
+        self.assertEqual(self.throttle.stats['retries'], 1)
+        self.assertEqual(self.throttle.stats['retry_wait_seconds'], 7)
+        # a 429 is not an outage
+        self.assertEqual(self.throttle.stats['failures'], 0)
+
+    @requests_mock.Mocker()
+    def test_retries_exhausted(self, m):
+        self.throttle.configure(failure_threshold=10)
+        m.get(self.endpoint, status_code=503)
+        with self.assertRaises(ESPNUnknownError):
+            self.espn_request.league_get()
+        self.assertEqual(m.call_count, 4)
+        self.assertEqual(self.throttle.stats['retries'], 3)
+
+    @requests_mock.Mocker()
+    def test_connection_errors_retried(self, m):
+        m.get(self.endpoint, [{'exc': requests.ConnectionError}, {'json': {'id': 1234}}])
+        self.assertEqual(self.espn_request.league_get(), {'id': 1234})
+        self.assertEqual(self.throttle.stats['failures'], 1)
+
+    @requests_mock.Mocker()
+    def test_circuit_breaker(self, m):
+        self.throttle.configure(max_retries=0)
+        m.get(self.endpoint, status_code=500)
+        for _ in range(3):
+            with self.assertRaises(ESPNUnknownError):
+                self.espn_request.league_get()
+        self.assertEqual(self.throttle.stats['circuit_opened'], 1)
+
+        # open, fail without a request
+        with self.assertRaises(ESPNUnavailable):
+            self.espn_request.league_get()
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(self.throttle.stats['circuit_rejected'], 1)
+
+        # half open after reset_timeout, a success closes it
+        self.clock.now += 10
+        m.get(self.endpoint, json={'id': 1234})
+        self.assertEqual(self.espn_request.league_get(), {'id': 1234})
+        self.assertEqual(self.throttle.breaker.state, 'closed')
+
+    @requests_mock.Mocker()
+    def test_busy_trial_keeps_circuit_half_open(self, m):
+        self.throttle.configure(max_retries=0)
+        m.get(self.endpoint, status_code=500)
+        for _ in range(3):
+            with self.assertRaises(ESPNUnknownError):
+                self.espn_request.league_get()
+
+        # a 429 to the half open trial neither closes the circuit nor resets its failures
+        self.clock.now += 10
+        m.get(self.endpoint, status_code=429)
+        with self.assertRaises(ESPNUnknownError):
+            self.espn_request.league_get()
+        self.assertEqual(self.throttle.breaker.state, 'half_open')
+        self.assertEqual(self.throttle.breaker.failures, 3)
+
+        # the next request is the new trial
+        m.get(self.endpoint, json={'id': 1234})
+        self.assertEqual(self.espn_request.league_get(), {'id': 1234})
+        self.assertEqual(self.throttle.breaker.state, 'closed')
+
+    @requests_mock.Mocker()
+    def test_no_retries_once_open(self, m):
+        m.get(self.endpoint, status_code=502)
+        with self.assertRaises(ESPNUnknownError):
+            self.espn_request.league_get()
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(self.throttle.stats['retries'], 2)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after('120'), 120)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT', now=1445412470), 10)
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertIsNone(parse_retry_after(None))
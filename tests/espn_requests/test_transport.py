@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+import requests_mock
+
+from espn_api.hockey import League as HockeyLeague
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.throttle import throttle
+from espn_api.requests.transport import RecordTransport, ReplayTransport, CassetteMiss
+
+
+class TransportTest(TestCase):
+    def setUp(self):
+        throttle.reset()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cassette = os.path.join(self.tmp_dir.name, 'cassette.jsonl')
+        self.league_endpoint = FANTASY_BASE_ENDPOINT + 'fhl/seasons/2020/segments/0/leagues/1'
+        self.base_endpoint = FANTASY_BASE_ENDPOINT + 'fhl/seasons/2020'
+        with open('tests/hockey/unit/data/league_data.json') as data:
+            self.league_data = json.loads(data.read())
+        with open('tests/hockey/unit/data/player_data.json') as data:
+            self.player_data = json.loads(data.read())
+
+    def record_league(self):
+        with requests_mock.Mocker() as m:
+            m.get(self.league_endpoint + '?view=mTeam&view=mRoster&view=mMatchup&view=mSettings&view=mStandings', json=self.league_data)
+            m.get(self.league_endpoint + '?view=mDraftDetail', json={})
+            m.get(self.base_endpoint + '/players?view=players_wl', json=self.player_data)
+            return HockeyLeague(1, 2020, transport=RecordTransport(self.cassette))
+
+    def test_record_writes_cassette(self):
+        self.record_league()
+
+        with open(self.cassette) as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(entries[1]['filter'], json.dumps({"filterActive": {"value": True}}))
+        self.assertEqual(entries[0]['status'], 200)
+
+    def test_replay_league(self):
+        league = self.record_league()
+
+        replayed = HockeyLeague(1, 2020, transport=ReplayTransport(self.cassette))
+
+        self.assertEqual([repr(team) for team in replayed.teams], [repr(team) for team in league.teams])
+        self.assertEqual(replayed.player_map, league.player_map)
+
+    def test_replay_strict_miss(self):
+        self.record_league()
+        request = EspnFantasyRequests(sport='nhl', year=2020, league_id=1, transport=ReplayTransport(self.cassette))
+
+        with self.assertRaises(CassetteMiss):
+            request.get(extend='/players', params={'view': 'players_wl'})
+
+    def test_replay_lenient_ignores_filter(self):
+        self.record_league()
+        request = EspnFantasyRequests(sport='nhl', year=2020, league_id=1, transport=ReplayTransport(self.cassette, match='lenient'))
+
+        data = request.get(extend='/players', params={'view': 'players_wl'}, headers={'x-fantasy-filter': '{}'})
+        self.assertEqual(data, self.player_data)
+
+    def test_replay_in_recorded_order(self):
+        entries = [
+            {'url': 'https://espn/x', 'params': [], 'filter': None, 'status': 200, 'body': '{"n": 1}'},
+            {'url': 'https://espn/x', 'params': [], 'filter': None, 'status': 200, 'body': '{"n": 2}'},
+        ]
+        transport = ReplayTransport(entries=entries)
+
+        self.assertEqual([transport.get('https://espn/x').json()['n'] for _ in range(3)], [1, 2, 2])
+
+    def test_unknown_match_mode(self):
+        with self.assertRaises(ValueError):
+            ReplayTransport(entries=[], match='fuzzy')
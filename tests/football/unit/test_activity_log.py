@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from benchmarks.synthetic import SyntheticLeague
+from espn_api.activity_log import ActivityLog
+
+
+def topic(topic_id, date):
+    return {'id': topic_id, 'date': date, 'messages': [{'messageTypeId': 178, 'to': 1, 'targetId': 100}]}
+
+
+def transaction(transaction_id, scoring_period):
+    return {'id': transaction_id, 'teamId': 1, 'type': 'FREEAGENT', 'status': 'EXECUTED',
+            'scoringPeriodId': scoring_period, 'processDate': 1000 + scoring_period, 'items': []}
+
+
+class ActivityLogTest(TestCase):
+    def setUp(self):
+        self.league = SyntheticLeague('nfl', num_teams=4, roster_size=3, year=2024).league()
+        self.league.scoringPeriodId = 3
+        # newest first, like ESPN
+        self.topics = [topic('t%s' % i, 1000 + i) for i in range(60, 0, -1)]
+        self.transactions = {1: [transaction('x1', 1)], 2: [transaction('x2', 2)], 3: [transaction('x3', 3)]}
+        self.log = ActivityLog()
+        self.addCleanup(self.log.close)
+
+    def league_get(self, params=None, headers=None, extend=''):
+        filters = json.loads(headers['x-fantasy-filter'])
+        if extend == '/communication/':
+            topics = filters['topics']
+            return {'topics': self.topics[topics['offset']:topics['offset'] + topics['limit']]}
+        return {'transactions': self.transactions.get(params['scoringPeriodId'], [])}
+
+    def ingest(self, method, **kwargs):
+        with mock.patch.object(self.league.espn_request, 'league_get', side_effect=self.league_get) as league_get:
+            added = getattr(self.log, method)(self.league, **kwargs)
+        return added, league_get.call_count
+
+    def test_activity_pages_until_watermark(self):
+        self.assertEqual(self.ingest('ingest_activity', page_size=25), (60, 3))
+        self.assertEqual(self.log.watermark(self.league), (1060, None))
+
+        self.assertEqual(self.ingest('ingest_activity', page_size=25), (0, 1))
+
+        self.topics = [topic('t%s' % i, 1000 + i) for i in range(63, 60, -1)] + self.topics
+        self.assertEqual(self.ingest('ingest_activity', page_size=25), (3, 1))
+        self.assertEqual(self.log.watermark(self.league), (1063, None))
+
+        activity = self.log.activity(self.league)
+        self.assertEqual(len(activity), 63)
+        self.assertEqual(activity[0]['id'], 't63')
+        self.assertEqual([t['id'] for t in self.log.activity(self.league, since=1061)], ['t63', 't62'])
+
+    def test_max_pages_resumes_before_watermark(self):
+        self.assertEqual(self.ingest('ingest_activity', page_size=25, max_pages=1), (25, 1))
+        # nothing below the last page read was ingested, the watermark stays
+        self.assertEqual(self.log.watermark(self.league), (None, None))
+
+        # newer topics arriving meanwhile shift the pages, the resume reads some topics again
+        self.topics = [topic('t%s' % i, 1000 + i) for i in range(63, 60, -1)] + self.topics
+        self.assertEqual(self.ingest('ingest_activity', page_size=25, max_pages=1), (22, 1))
+        self.assertEqual(self.ingest('ingest_activity', page_size=25), (13, 1))
+        self.assertEqual(self.log.watermark(self.league), (1060, None))
+
+        # the new topics are newer than the watermark of the interrupted ingest
+        self.assertEqual(self.ingest('ingest_activity', page_size=25), (3, 1))
+        self.assertEqual(self.log.watermark(self.league), (1063, None))
+        self.assertEqual(len(self.log.activity(self.league)), 63)
+
+    def test_transactions_from_watermark_period(self):
+        self.assertEqual(self.ingest('ingest_transactions'), (3, 3))
+        self.assertEqual(self.log.watermark(self.league, 'transactions'), (None, 3))
+
+        # only the watermark period is read again
+        self.transactions[3].append(transaction('x4', 3))
+        self.assertEqual(self.ingest('ingest_transactions'), (1, 1))
+
+        self.league.scoringPeriodId = 4
+        self.transactions[4] = [transaction('x5', 4)]
+        self.assertEqual(self.ingest('ingest_transactions'), (1, 2))
+        self.assertEqual(len(self.log.transactions(self.league)), 5)
+        self.assertEqual({t['id'] for t in self.log.transactions(self.league, scoring_period=3)}, {'x3', 'x4'})
+
+    def test_logs_kept_per_league_and_file(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'activity.db')
+        with ActivityLog(path) as log:
+            self.log = log
+            self.ingest('ingest', page_size=25)
+        other = SyntheticLeague('nfl', num_teams=4, roster_size=3, year=2024).league()
+        other.league_id += 1
+        with ActivityLog(path) as log:
+            self.assertEqual(len(log.activity(self.league)), 60)
+            self.assertEqual(len(log.transactions(self.league)), 3)
+            self.assertEqual(log.activity(other), [])
+            self.assertEqual(log.watermark(other), (None, None))
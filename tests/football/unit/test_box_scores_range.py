@@ -0,0 +1,60 @@
+import json
+from unittest import TestCase, mock
+
+from benchmarks.synthetic import SPORTS, SyntheticLeague
+
+
+class BoxScoresRangeTest(TestCase):
+    def box_score_payload(self, synthetic):
+        '''mMatchupScore-like payload built from the league schedule and rosters'''
+        league_payload = synthetic.league_payload()
+        rosters = {team['id']: team['roster'] for team in league_payload['teams']}
+
+        def league_get(params=None, headers=None, extend=''):
+            if not headers:
+                return {'positionAgainstOpponent': {'positionalRatings': {}}}
+            period = int(json.loads(headers['x-fantasy-filter'])['schedule']['filterMatchupPeriodIds']['value'][0])
+            schedule = []
+            for matchup in league_payload['schedule']:
+                if matchup['matchupPeriodId'] != period:
+                    continue
+                matchup = dict(matchup)
+                for side in ('home', 'away'):
+                    if side in matchup:
+                        matchup[side] = dict(matchup[side], rosterForCurrentScoringPeriod=rosters[matchup[side]['teamId']])
+                schedule.append(matchup)
+            return {'schedule': schedule, 'positionAgainstOpponent': {'positionalRatings': {}}}
+        return league_get
+
+    def test_every_sport(self):
+        for sport in SPORTS:
+            with self.subTest(sport=sport):
+                synthetic = SyntheticLeague(sport, num_teams=6, roster_size=3, year=2024)
+                league = synthetic.league()
+                pro_schedule = synthetic.pro_schedule_payload() if SPORTS[sport]['pro_schedule'] else {'settings': {'proTeams': []}}
+
+                with mock.patch.object(league.espn_request, 'league_get', side_effect=self.box_score_payload(synthetic)) as league_get, \
+                        mock.patch.object(league.espn_request, 'get_pro_schedule', return_value=pro_schedule) as get_pro_schedule:
+                    box_scores = league.box_scores_range(1, 3, max_workers=3)
+
+                self.assertEqual(sorted(box_scores), [1, 2, 3])
+                self.assertEqual(len(box_scores[2]), 3)
+                self.assertIn(box_scores[2][0].home_team, league.teams)
+                self.assertLessEqual(get_pro_schedule.call_count, 1)
+                # football positional ratings come with the box score request
+                self.assertEqual(league_get.call_count, 3)
+                if sport == 'nfl':
+                    self.assertIn('mPositionalRatings', league_get.call_args.kwargs['params']['view'])
+
+    def test_matches_single_week(self):
+        synthetic = SyntheticLeague('nfl', num_teams=6, roster_size=5, year=2024)
+        league = synthetic.league()
+        pro_schedule = synthetic.pro_schedule_payload()
+
+        with mock.patch.object(league.espn_request, 'league_get', side_effect=self.box_score_payload(synthetic)), \
+                mock.patch.object(league.espn_request, 'get_pro_schedule', return_value=pro_schedule):
+            week = league.box_scores(2)
+            weeks = league.box_scores_range(2, 2)
+
+        self.assertEqual([repr(box_score) for box_score in weeks[2]], [repr(box_score) for box_score in week])
+        self.assertEqual([box_score.home_score for box_score in weeks[2]], [box_score.home_score for box_score in week])
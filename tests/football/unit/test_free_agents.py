@@ -0,0 +1,50 @@
+import json
+import threading
+from unittest import TestCase, mock
+
+from benchmarks.synthetic import SyntheticLeague
+from espn_api.football import Player
+
+
+class IterFreeAgentsTest(TestCase):
+    def setUp(self):
+        synthetic = SyntheticLeague('nfl', num_teams=4, roster_size=3, year=2024)
+        self.league = synthetic.league()
+        entry = synthetic.free_agent_entries()[0]
+        self.pool = []
+        for i in range(7):
+            player = json.loads(json.dumps(entry))
+            player['id'] = player['playerPoolEntry']['id'] = player['playerPoolEntry']['player']['id'] = 9000 + i
+            self.pool.append(player)
+        self.offsets = []
+        self.lock = threading.Lock()
+
+    def league_get(self, params=None, headers=None, extend=''):
+        filters = json.loads(headers['x-fantasy-filter'])['players']
+        offset = filters.get('offset', 0)
+        with self.lock:
+            self.offsets.append(offset)
+        return {'players': self.pool[offset:offset + filters['limit']]}
+
+    def test_pages_through_offsets(self):
+        with mock.patch.object(self.league.espn_request, 'league_get', side_effect=self.league_get):
+            players = list(self.league.iter_free_agents(page_size=3))
+        self.assertEqual([player.playerId for player in players], [9000 + i for i in range(7)])
+        self.assertTrue(all(isinstance(player, Player) for player in players))
+        self.assertEqual(sorted(self.offsets), [0, 3, 6])
+
+    def test_stops_fetching_when_consumer_stops(self):
+        with mock.patch.object(self.league.espn_request, 'league_get', side_effect=self.league_get):
+            free_agents = self.league.iter_free_agents(page_size=3, prefetch=False)
+            self.assertEqual(next(free_agents).playerId, 9000)
+            free_agents.close()
+        self.assertEqual(self.offsets, [0])
+
+    def test_limit_and_positions(self):
+        with mock.patch.object(self.league.espn_request, 'league_get', side_effect=self.league_get) as league_get:
+            players = list(self.league.iter_free_agents(page_size=3, limit=4, positions=['RB', 'WR']))
+        self.assertEqual(len(players), 4)
+        # the page after the limit is not requested
+        self.assertEqual(sorted(self.offsets), [0, 3])
+        filters = json.loads(league_get.call_args.kwargs['headers']['x-fantasy-filter'])
+        self.assertEqual(filters['players']['filterSlotIds']['value'], [2, 4])
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from benchmarks.synthetic import SPORTS, SyntheticLeague, league_class
+from espn_api.football import LeagueHistory
+from espn_api.requests.transport import ReplayTransport
+
+
+class LeagueHistoryTest(TestCase):
+    def setUp(self):
+        self.years = [2016, 2017, 2018, 2019]
+
+    def history_transport(self, sport='nfl', roster_size=None):
+        '''Replays every season, without the player pool and pro schedule requests'''
+        entries = []
+        for i, year in enumerate(self.years):
+            synthetic = SyntheticLeague(sport, num_teams=6, roster_size=roster_size, year=year, seed=i, previous_seasons=self.years[:i])
+            entries += [entry for entry in synthetic.cassette() if not entry['url'].endswith('/players') and 'proTeamSchedules_wl' not in str(entry['params'])]
+        return ReplayTransport(entries=entries)
+
+    def test_loads_all_seasons(self):
+        history = LeagueHistory(123456, 2019, transport=self.history_transport(roster_size=6), max_workers=3)
+
+        self.assertEqual(history.years, self.years)
+        self.assertEqual(repr(history), 'LeagueHistory(123456, 2016-2019)')
+        self.assertEqual(len(history.drafts[2016]), 6 * 6)
+        self.assertTrue(all(pick.playerName for pick in history.drafts[2016]))
+        # only the schedules are kept, not the raw payloads of every season
+        self.assertTrue(all(not league._payloads for league in history.seasons.values()))
+
+    def test_records_match_seasons(self):
+        history = LeagueHistory(123456, 2019, transport=self.history_transport(roster_size=6))
+
+        for team_id, record in history.records.items():
+            teams = [league.get_team_data(team_id) for league in history.seasons.values()]
+            self.assertEqual(record['wins'], sum(team.wins for team in teams))
+            self.assertEqual(record['losses'], sum(team.losses for team in teams))
+            self.assertEqual(record['seasons'], len(self.years))
+
+        head_to_head = history.head_to_head_record(1, 2)
+        reverse = history.head_to_head_record(2, 1)
+        self.assertEqual(head_to_head['wins'], reverse['losses'])
+        self.assertAlmostEqual(head_to_head['points_for'], reverse['points_against'])
+
+        standings = history.all_time_standings()
+        self.assertEqual(len(standings), 6)
+        self.assertGreaterEqual(standings[0]['win_pct'], standings[-1]['win_pct'])
+
+    def test_every_sport(self):
+        for sport in SPORTS:
+            with self.subTest(sport=sport):
+                package = __import__(league_class(sport).__module__.rsplit('.', 1)[0], fromlist=['LeagueHistory'])
+                history = package.LeagueHistory(123456, 2019, transport=self.history_transport(sport, roster_size=3))
+
+                self.assertEqual(history.years, self.years)
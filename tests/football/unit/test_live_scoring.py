@@ -0,0 +1,107 @@
+import asyncio
+import copy
+from datetime import datetime, timedelta
+from unittest import TestCase, mock
+
+from benchmarks.synthetic import SyntheticLeague
+from espn_api.football import LiveScoring
+
+
+class LiveScoringTest(TestCase):
+    def setUp(self):
+        synthetic = SyntheticLeague('nfl', num_teams=4, roster_size=3, year=2024)
+        self.league = synthetic.league()
+        self.pro_schedule = synthetic.pro_schedule_payload()
+        week = str(self.league.current_week)
+
+        league_payload = synthetic.league_payload()
+        rosters = {team['id']: team['roster'] for team in league_payload['teams']}
+        schedule = []
+        for matchup in league_payload['schedule']:
+            if matchup['matchupPeriodId'] == self.league.currentMatchupPeriod:
+                matchup = copy.deepcopy(matchup)
+                for side in ('home', 'away'):
+                    matchup[side]['rosterForCurrentScoringPeriod'] = rosters[matchup[side]['teamId']]
+                schedule.append(matchup)
+        self.payload = {'schedule': schedule, 'positionAgainstOpponent': {'positionalRatings': {}}}
+
+        patches = [
+            mock.patch.object(self.league.espn_request, 'league_get', side_effect=lambda **kwargs: self.payload),
+            mock.patch.object(self.league.espn_request, 'get_pro_schedule', side_effect=lambda: self.pro_schedule),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def kickoff(self, delta: timedelta):
+        '''Moves every game of the week to now + delta'''
+        self.pro_schedule = copy.deepcopy(self.pro_schedule)
+        week = str(self.league.current_week)
+        for team in self.pro_schedule['settings']['proTeams']:
+            for game in team['proGamesByScoringPeriod'].get(week, []):
+                game['date'] = (datetime.now() + delta).timestamp() * 1000
+
+    def score(self, matchup: int, side: str, points: float):
+        '''New payload with points added to one side of a matchup'''
+        self.payload = copy.deepcopy(self.payload)
+        self.payload['schedule'][matchup][side]['totalPoints'] += points
+
+    def test_live_games_polled_often(self):
+        self.kickoff(-timedelta(hours=1))
+        updates = []
+        live = LiveScoring(self.league, live_interval=30, callbacks=[updates.append])
+
+        # the week has not scored yet
+        self.assertEqual(live.poll(), [])
+        self.assertTrue(live.live)
+        self.assertAlmostEqual(live.next_delay(), 30, delta=1)
+
+        self.score(0, 'home', 7)
+        self.score(1, 'away', 3)
+        first = live.poll()
+        self.assertEqual(len(first), 2)
+        self.assertEqual(updates, first)
+
+        # unchanged payload, nothing is parsed or published
+        with mock.patch.object(self.league, '_build_box_scores') as build:
+            self.assertEqual(live.poll(), [])
+        build.assert_not_called()
+
+        self.score(0, 'home', 6)
+        (update,) = live.poll()
+        self.assertAlmostEqual(update.home_delta, 6)
+        self.assertEqual(update.away_delta, 0)
+        self.assertEqual(update.players, {})
+        self.assertEqual(len(updates), 3)
+
+    def test_waits_for_kickoff(self):
+        self.kickoff(timedelta(minutes=5))
+        live = LiveScoring(self.league, idle_interval=15 * 60)
+        live.poll()
+        self.assertAlmostEqual(live.next_delay(), 5 * 60, delta=2)
+
+        self.kickoff(timedelta(hours=2))
+        live.poll()
+        self.assertAlmostEqual(live.next_delay(), 15 * 60, delta=2)
+
+    def test_stops_when_games_are_over(self):
+        self.kickoff(-timedelta(hours=5))
+        sleep = mock.Mock()
+        live = LiveScoring(self.league, sleep=sleep)
+        live.run()
+
+        self.assertEqual(live.polls, 1)
+        self.assertTrue(live.finished)
+        self.assertIsNone(live.next_delay())
+        sleep.assert_not_called()
+
+    def test_async_updates(self):
+        self.kickoff(-timedelta(hours=5))
+        self.score(0, 'home', 7)
+        self.score(1, 'home', 7)
+        live = LiveScoring(self.league)
+
+        async def collect():
+            return [update async for update in live.updates()]
+
+        self.assertEqual(len(asyncio.run(collect())), 2)
@@ -0,0 +1,89 @@
+import json
+import threading
+from unittest import TestCase, mock
+
+from benchmarks.synthetic import SyntheticLeague
+from espn_api.football import Player
+from espn_api.player_cards import batches
+
+
+class PlayerCardsTest(TestCase):
+    def setUp(self):
+        synthetic = SyntheticLeague('nfl', num_teams=4, roster_size=3, year=2024)
+        self.league = synthetic.league()
+        entry = synthetic.free_agent_entries()[0]
+        self.cards = {}
+        for i in range(120):
+            card = json.loads(json.dumps(entry))
+            card['id'] = card['playerPoolEntry']['id'] = card['playerPoolEntry']['player']['id'] = 9000 + i
+            self.cards[9000 + i] = card
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def get_player_card(self, player_ids, max_scoring_period, additional_filters=None):
+        with self.lock:
+            self.requested.append(list(player_ids))
+        return {'players': [self.cards[player_id] for player_id in player_ids if player_id in self.cards]}
+
+    def test_batches(self):
+        self.assertEqual(batches([], 50), [])
+        self.assertEqual([len(chunk) for chunk in batches(list(range(120)), 50)], [40, 40, 40])
+        self.assertEqual([len(chunk) for chunk in batches(list(range(50)), 50)], [50])
+
+    def test_chunks_and_caches(self):
+        ids = [9000 + i for i in range(120)]
+        with mock.patch.object(self.league.espn_request, 'get_player_card', side_effect=self.get_player_card), \
+                mock.patch.object(self.league.espn_request, 'get_pro_schedule') as get_pro_schedule:
+            players = self.league.player_info(playerId=ids)
+            self.assertEqual([player.playerId for player in players], ids)
+            self.assertTrue(all(isinstance(player, Player) for player in players))
+            self.assertEqual(sorted(len(chunk) for chunk in self.requested), [40, 40, 40])
+
+            # cached cards are not requested again, new ids are
+            player = self.league.player_info(playerId=9005)
+            self.assertEqual(player.playerId, 9005)
+            self.league.player_info(playerId=[9001, 123])
+            self.assertEqual(len(self.requested), 4)
+            self.assertEqual(self.requested[-1], [123])
+            # the pro schedule read when the league was built is reused
+            get_pro_schedule.assert_not_called()
+
+        self.assertEqual(self.league.player_cards.stats, {'hits': 2, 'misses': 121, 'requests': 4})
+
+    def test_cards_refreshed(self):
+        now = [0.0]
+        self.league.player_cards.clock = lambda: now[0]
+
+        def rename(name):
+            # ESPN answers with a new card, the cached one is left as it was
+            card = json.loads(json.dumps(self.cards[9000]))
+            card['playerPoolEntry']['player']['fullName'] = name
+            self.cards[9000] = card
+
+        def name():
+            return self.league.player_info(playerId=9000).name
+
+        with mock.patch.object(self.league.espn_request, 'get_player_card', side_effect=self.get_player_card):
+            first = name()
+            rename('Changed Player')
+            self.assertEqual(name(), first)
+
+            # expired after ttl seconds
+            now[0] += self.league.player_cards.ttl
+            self.assertEqual(name(), 'Changed Player')
+
+            # keyed on the current scoring period
+            rename('Next Week Player')
+            self.league.scoringPeriodId += 1
+            self.assertEqual(name(), 'Next Week Player')
+
+            # dropped by refresh
+            rename('Refreshed Player')
+            self.league.refresh()
+            self.assertEqual(name(), 'Refreshed Player')
+        self.assertEqual(len(self.requested), 4)
+
+    def test_unknown_player(self):
+        with mock.patch.object(self.league.espn_request, 'get_player_card', side_effect=self.get_player_card):
+            self.assertIsNone(self.league.player_info('Not A Player'))
+            self.assertIsNone(self.league.player_info(playerId=123))
@@ -0,0 +1,53 @@
+from unittest import TestCase, mock
+
+from benchmarks.synthetic import SyntheticLeague
+from espn_api.utils.advanced_simulator import AdvancedFantasySimulator
+
+
+def ratings_payload(params=None, headers=None, extend=''):
+    '''mPositionalRatings-like payload, RB ranks depend on the scoring period'''
+    week = params['scoringPeriodId']
+    return {'positionAgainstOpponent': {'positionalRatings': {
+        '2': {'ratingsByOpponent': {'1': {'rank': week}, '2': {'rank': 32}, '3': {'rank': 1}}},
+    }}}
+
+
+class PositionalRatingsTest(TestCase):
+    def setUp(self):
+        self.league = SyntheticLeague('nfl', num_teams=6, roster_size=3, year=2024, current_matchup_period=5).league()
+
+    def test_fetched_once_per_week(self):
+        with mock.patch.object(self.league.espn_request, 'league_get', side_effect=ratings_payload) as league_get:
+            ratings = self.league.positional_ratings(3)
+            self.assertEqual(self.league.positional_ratings(3), ratings)
+            self.league.positional_ratings(4)
+
+        self.assertEqual(ratings, {'2': {'1': 3, '2': 32, '3': 1}})
+        self.assertEqual(league_get.call_count, 2)
+
+    def test_refresh_only_current_and_future_weeks(self):
+        current_week = self.league.current_week
+        with mock.patch.object(self.league.espn_request, 'league_get', side_effect=ratings_payload) as league_get:
+            self.league.positional_ratings(current_week - 1)
+            self.league.positional_ratings(current_week)
+            self.league.positional_ratings(current_week - 1, refresh=True)
+            self.assertEqual(league_get.call_count, 2)
+            self.league.positional_ratings(current_week, refresh=True)
+            self.assertEqual(league_get.call_count, 3)
+
+    def test_prefetch(self):
+        with mock.patch.object(self.league.espn_request, 'league_get', side_effect=ratings_payload) as league_get:
+            self.league.positional_ratings(1)
+            self.league.prefetch_positional_ratings(max_workers=3)
+            self.league.positional_ratings(2)
+
+        self.assertEqual(league_get.call_count, self.league.current_week)
+        self.assertEqual(sorted(self.league._positional_ratings), list(range(1, self.league.current_week + 1)))
+
+    def test_simulator_matchup_strength(self):
+        simulator = AdvancedFantasySimulator(self.league, num_simulations=10, use_gmm=False, use_positional_ratings=True)
+        with mock.patch.object(self.league.espn_request, 'league_get', side_effect=ratings_payload) as league_get:
+            # proTeamId 2 (BUF) is the easiest RB matchup, 3 (CHI) the toughest
+            self.assertAlmostEqual(simulator._calculate_opponent_strength('RB', 'BUF'), 1.2)
+            self.assertAlmostEqual(simulator._calculate_opponent_strength('RB', 'CHI'), 0.8)
+        self.assertEqual(league_get.call_count, 1)
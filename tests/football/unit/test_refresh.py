@@ -0,0 +1,85 @@
+import copy
+from unittest import TestCase, mock
+
+from benchmarks.synthetic import SyntheticLeague, league_class
+
+
+class IncrementalRefreshTest(TestCase):
+    def setUp(self):
+        synthetic = SyntheticLeague('nfl', num_teams=6, roster_size=3, year=2024)
+        self.league = league_class('nfl')(synthetic.league_id, synthetic.year, transport=synthetic.transport(), keep_payloads=True)
+        self.payload = copy.deepcopy(self.league._payloads['league'])
+        self.pro_schedule = self.league._payloads['pro_schedule']
+
+    def refresh(self):
+        with mock.patch.object(self.league.espn_request, 'get_league', return_value=self.payload), \
+                mock.patch.object(self.league.espn_request, 'get_pro_schedule', return_value=self.pro_schedule):
+            return self.league.refresh()
+
+    def test_unchanged(self):
+        teams = list(self.league.teams)
+        players = [list(team.roster) for team in teams]
+
+        self.assertEqual(self.refresh(), {'teams': [], 'rosters': [], 'schedules': []})
+        self.assertEqual(self.league.teams, teams)
+        for team, roster in zip(self.league.teams, players):
+            self.assertTrue(all(a is b for a, b in zip(team.roster, roster)))
+
+    def test_roster_change(self):
+        team, other = self.league.teams[0], self.league.teams[1]
+        other_players = list(other.roster)
+        self.payload['teams'][0]['roster']['entries'].pop()
+
+        changes = self.refresh()
+        self.assertEqual(changes, {'teams': [], 'rosters': [team], 'schedules': []})
+        self.assertIs(self.league.teams[0], team)
+        self.assertEqual(len(team.roster), 2)
+        self.assertTrue(all(a is b for a, b in zip(other.roster, other_players)))
+
+    def test_record_change(self):
+        wins = self.league.teams[2].wins
+        self.payload['teams'][2]['name'] = 'Renamed'
+        self.payload['teams'][2]['record']['overall']['wins'] += 1
+
+        changes = self.refresh()
+        team = self.league.teams[2]
+        self.assertEqual(changes['teams'], [team])
+        self.assertEqual(team.team_name, 'Renamed')
+        self.assertEqual(team.wins, wins + 1)
+        # roster and schedule are left alone
+        self.assertEqual(changes['rosters'], [])
+        self.assertIsInstance(team.schedule[0], type(team))
+
+    def test_schedule_change(self):
+        matchup = self.payload['schedule'][0]
+        matchup['home']['totalPoints'] += 100
+
+        changes = self.refresh()
+        home = next(team for team in self.league.teams if team.team_id == matchup['home']['teamId'])
+        away = next(team for team in self.league.teams if team.team_id == matchup['away']['teamId'])
+        self.assertEqual(set(changes['schedules']), {home, away})
+        week = home.schedule.index(away)
+        self.assertAlmostEqual(home.mov[week], matchup['home']['totalPoints'] - matchup['away']['totalPoints'])
+        self.assertAlmostEqual(away.mov[week], matchup['away']['totalPoints'] - matchup['home']['totalPoints'])
+
+    def test_refresh_prefetched(self):
+        teams = list(self.league.teams)
+        self.payload['teams'][0]['roster']['entries'].pop()
+        with mock.patch.object(self.league.espn_request, 'get_league', return_value=self.payload), \
+                mock.patch.object(self.league.espn_request, 'get_pro_schedule', return_value=self.pro_schedule):
+            fetched = self.league.fetch_refresh()
+        # fetching leaves the league alone, applying needs no request
+        self.assertEqual(len(teams[0].roster), 3)
+
+        with mock.patch.object(self.league.espn_request, 'get_league') as get_league, \
+                mock.patch.object(self.league.espn_request, 'get_pro_schedule') as get_pro_schedule:
+            changes = self.league.refresh(fetched)
+        get_league.assert_not_called()
+        get_pro_schedule.assert_not_called()
+        self.assertEqual(changes['rosters'], [teams[0]])
+        self.assertEqual(len(teams[0].roster), 2)
+
+    def test_load_roster_week_rebuilt(self):
+        with mock.patch.object(self.league.espn_request, 'league_get', return_value=self.payload):
+            self.league.load_roster_week(1)
+        self.assertEqual(len(self.refresh()['rosters']), len(self.league.teams))
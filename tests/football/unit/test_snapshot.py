@@ -0,0 +1,46 @@
+import gzip
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from benchmarks.synthetic import SyntheticLeague, league_class
+
+
+class SnapshotTest(TestCase):
+    def setUp(self):
+        self.synthetic = SyntheticLeague('nfl', num_teams=6, roster_size=3, year=2024)
+        self.League = league_class('nfl')
+
+    def test_round_trip(self):
+        league = self.League(self.synthetic.league_id, self.synthetic.year, transport=self.synthetic.transport(), keep_payloads=True)
+
+        offline = mock.Mock()
+        offline.get.side_effect = AssertionError('network access')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'league.json.gz')
+            league.save_snapshot(path)
+            snapshot_league = self.League.from_snapshot(path, transport=offline)
+
+        offline.get.assert_not_called()
+        self.assertEqual(snapshot_league.current_week, league.current_week)
+        self.assertEqual(snapshot_league.player_map, league.player_map)
+        self.assertEqual([repr(team) for team in snapshot_league.teams], [repr(team) for team in league.teams])
+        self.assertEqual(repr(snapshot_league.teams[0].roster), repr(league.teams[0].roster))
+        self.assertEqual(len(snapshot_league.draft), len(league.draft))
+
+    def test_payloads_not_kept_by_default(self):
+        league = self.League(self.synthetic.league_id, self.synthetic.year, transport=self.synthetic.transport())
+
+        self.assertEqual(league._payloads, {})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                league.save_snapshot(os.path.join(tmp_dir, 'league.json.gz'))
+
+    def test_wrong_sport(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'league.json.gz')
+            with gzip.open(path, 'wt') as f:
+                json.dump({'version': 1, 'sport': 'nhl', 'league_id': 1, 'year': 2020, 'payloads': {}, 'players': []}, f)
+            with self.assertRaises(ValueError):
+                self.League.from_snapshot(path)
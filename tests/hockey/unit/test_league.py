@@ -3,7 +3,9 @@ from unittest import TestCase, mock
 
 from espn_api.base_league import BaseLeague
 from espn_api.hockey import League as HockeyLeague, Team
+from espn_api.player_pool import PlayerPool, player_pools
 from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.throttle import throttle
 
 
 class BaseLeagueTest(TestCase):
@@ -11,6 +13,8 @@ class BaseLeagueTest(TestCase):
         self.league_id = 1
         self.season = 2020
         self.league = BaseLeague(self.league_id, self.season, sport= 'nhl')
+        player_pools.clear()
+        throttle.reset()
 
         with open('tests/hockey/unit/data/league_data.json') as data:
                 self.league_data = json.loads(data.read())
@@ -44,6 +48,38 @@ class BaseLeagueTest(TestCase):
         self.assertEqual(self.league.player_map[2555315], 'Charlie  Coyle')
         mock_get_players.assert_called_once()
 
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    def test_base_league_shares_player_pool(self, mock_get_players):
+        mock_get_players.return_value = [{'id': 1, 'fullName': 'Sebastian Aho'}]
+        other_league = BaseLeague(2, self.season, sport='nhl')
+
+        self.league._fetch_players()
+        other_league._fetch_players()
+
+        self.assertIs(self.league.player_map, other_league.player_map)
+        self.assertIn(('nhl', self.season), player_pools)
+        mock_get_players.assert_called_once()
+
+        player_pools.refresh_interval = 0
+        try:
+            other_league._fetch_players()
+        finally:
+            player_pools.refresh_interval = 24 * 60 * 60
+        self.assertEqual(mock_get_players.call_count, 2)
+
+    def test_base_league_builds_no_players(self):
+        with self.assertRaisesRegex(Exception, 'nhl leagues do not build players'):
+            self.league._player({})
+
+    def test_player_pool_duplicate_names(self):
+        pool = PlayerPool([{'id': 3, 'fullName': 'Sebastian Aho'}, {'id': 4, 'fullName': 'Sebastian Aho'}])
+
+        self.assertEqual(pool['Sebastian Aho'], 3)
+        self.assertEqual(pool.ids('Sebastian Aho'), (3, 4))
+        self.assertEqual(pool[4], 'Sebastian Aho')
+        with self.assertRaises(TypeError):
+            pool[5] = 'Someone Else'
+
     @mock.patch.object(EspnFantasyRequests, 'get_pro_schedule')
     def test_base_league_fetch_schedule(self, mock_get_pro_schedule):
         with open('tests/hockey/unit/data/pro_schedule.json') as data:
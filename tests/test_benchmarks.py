@@ -0,0 +1,92 @@
+"""
+Tests for the benchmark suite
+
+Keeps the synthetic league generator and the runner working as the
+library changes
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.run import compare_results, main
+from benchmarks.synthetic import SPORTS, SyntheticLeague
+
+
+class TestSyntheticLeague(unittest.TestCase):
+    """Test synthetic leagues load in every sport package"""
+
+    def test_every_sport_constructs(self):
+        """Test a League is built from replayed payloads for every sport"""
+        for sport in SPORTS:
+            with self.subTest(sport=sport):
+                synthetic = SyntheticLeague(sport, num_teams=8, num_free_agents=5)
+                league = synthetic.league()
+
+                self.assertEqual(len(league.teams), 8)
+                self.assertEqual(len(league.teams[0].roster), len(SPORTS[sport]['roster']))
+                self.assertEqual(len(league.draft), 8 * len(SPORTS[sport]['roster']))
+                self.assertEqual(league.currentMatchupPeriod, synthetic.current_matchup_period)
+
+    def test_odd_team_count_and_roster_size(self):
+        """Test odd leagues get byes and rosters can be resized"""
+        synthetic = SyntheticLeague('nfl', num_teams=9, roster_size=20)
+        league = synthetic.league()
+
+        self.assertEqual(len(league.teams[0].roster), 20)
+        completed = synthetic.current_matchup_period - 1
+        for team in league.teams:
+            self.assertEqual(team.wins + team.losses + team.ties, len([o for o in team.outcomes[:completed] if o != 'U']))
+
+    def test_weekly_stats(self):
+        """Test football players get weekly actual and projected points"""
+        league = SyntheticLeague('nfl', num_teams=8).league()
+        player = league.teams[0].roster[0]
+
+        self.assertEqual(player.position, 'QB')
+        self.assertIn('points', player.stats[1])
+        self.assertIn('projected_points', player.stats[league.finalScoringPeriod])
+        self.assertGreater(player.avg_points, 0)
+
+    def test_deterministic(self):
+        """Test the same seed produces the same payloads"""
+        first = SyntheticLeague('nba', num_teams=8, seed=3).league_payload()
+        second = SyntheticLeague('nba', num_teams=8, seed=3).league_payload()
+
+        self.assertEqual(first, second)
+
+    def test_unknown_sport(self):
+        """Test unknown sports are rejected"""
+        with self.assertRaises(ValueError):
+            SyntheticLeague('cricket')
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """Test benchmark runner output and comparison"""
+
+    def test_results_json(self):
+        """Test the runner writes comparable JSON results"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = os.path.join(tmp_dir, 'results.json')
+            code = main(['--sports', 'nfl', '--teams', '8', '--quick', '--repeat', '1',
+                         '--filter', 'power_rankings', 'standings', '--output', output])
+            with open(output) as f:
+                results = json.load(f)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(set(results['results']), {'league.standings_weekly[nfl-8t]', 'league.power_rankings[nfl-8t]'})
+        self.assertGreater(results['results']['league.power_rankings[nfl-8t]']['median'], 0)
+
+    def test_compare_flags_regressions(self):
+        """Test slowdowns beyond the threshold are flagged"""
+        baseline = {'results': {'a': {'median': 1.0}, 'b': {'median': 1.0}, 'c': {'median': 1.0}}}
+        current = {'results': {'a': {'median': 1.5}, 'b': {'median': 1.05}, 'c': {'median': 0.5}, 'd': {'median': 1.0}}}
+
+        rows = {row['benchmark']: row['status'] for row in compare_results(baseline, current, threshold=0.1)}
+
+        self.assertEqual(rows, {'a': 'REGRESSION', 'b': '', 'c': 'improved'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,8 +6,12 @@ Tests the main application functionality end-to-end
 
 import unittest
 from unittest.mock import Mock, MagicMock, patch
+import multiprocessing
 import sys
 import os
+import tempfile
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -219,6 +223,120 @@ class TestFantasyDecisionMaker(unittest.TestCase):
         except Exception as e:
             self.fail(f"generate_weekly_report raised {e}")
 
+    def _mock_league_report(self):
+        """Mock the simulations behind a league report"""
+        self.dm.simulator.simulate_matchup.return_value = {
+            'team1_win_probability': 60.0,
+            'team2_win_probability': 40.0,
+            'team1_avg_score': 115.0,
+            'team1_score_std': 12.0,
+            'team1_score_range': (95.0, 135.0),
+            'team2_avg_score': 110.0,
+            'team2_score_std': 14.0,
+            'team2_score_range': (90.0, 130.0)
+        }
+        self.dm.league.free_agents.return_value = []
+        self.dm.simulator.recommend_free_agents.return_value = []
+        self.dm.simulator.find_trade_opportunities.return_value = []
+        self.dm.simulator.simulate_season_rest_of_season.return_value = {
+            team.team_id: {'projected_wins': 8.5, 'playoff_odds': 60.0, 'championship_odds': 10.0}
+            for team in self.dm.league.teams
+        }
+        self.dm.league.power_rankings.return_value = [('%.2f' % (50 - i), team) for i, team in enumerate(self.dm.league.teams)]
+
+    def test_generate_league_reports(self):
+        """Test league sections are computed once and every team gets a report"""
+        self._mock_league_report()
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            reports = self.dm.generate_league_reports(output_dir=output_dir, max_workers=1)
+
+            self.assertEqual(sorted(reports), list(range(1, 11)))
+            for team in self.dm.league.teams:
+                with open(reports[team.team_id]) as f:
+                    report = f.read()
+                self.assertIn(f"YOUR TEAM: {team.team_name}", report)
+                self.assertIn("POWER RANKINGS", report)
+                self.assertIn("TIMING SUMMARY", report)
+            with open(reports[10]) as f:
+                self.assertIn("No matchup this week", f.read())
+
+        self.assertEqual(self.dm.simulator.simulate_season_rest_of_season.call_count, 1)
+        self.assertEqual(self.dm.league.power_rankings.call_count, 1)
+        self.assertEqual(self.dm.league.free_agents.call_count, 1)
+        # team 10 plays itself in week 10, a bye
+        self.assertEqual(self.dm.simulator.simulate_matchup.call_count, 9)
+        self.assertEqual(self.dm.simulator.find_trade_opportunities.call_count, 10)
+        self.assertEqual(self.dm.timer.summary()['phases']['trade_search']['calls'], 10)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'worker processes are forked')
+    def test_generate_league_reports_in_processes(self):
+        """Test per-team sections computed in worker processes reach the reports and timings"""
+        self._mock_league_report()
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            reports = self.dm.generate_league_reports(output_dir=output_dir, max_workers=3)
+
+            self.assertEqual(sorted(reports), list(range(1, 11)))
+            with open(reports[2]) as f:
+                report = f.read()
+            self.assertIn("Win Probability: 60.0%", report)
+            self.assertIn("TIMING SUMMARY", report)
+
+        # league sections in this process, team sections in the workers
+        self.assertEqual(self.dm.simulator.simulate_season_rest_of_season.call_count, 1)
+        self.assertEqual(self.dm.simulator.find_trade_opportunities.call_count, 0)
+        phases = self.dm.timer.summary()['phases']
+        self.assertEqual(phases['trade_search']['calls'], 10)
+        self.assertEqual(phases['matchup_simulation']['calls'], 9)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'worker processes are forked')
+    def test_league_reports_independent_of_workers(self):
+        """Test each team simulates from its own seed, whatever process runs it"""
+        self._mock_league_report()
+        matchup = dict(self.dm.simulator.simulate_matchup.return_value)
+        self.dm.simulator.simulate_matchup.return_value = None
+        self.dm.simulator.simulate_matchup.side_effect = \
+            lambda *args, **kwargs: dict(matchup, team1_win_probability=round(float(np.random.uniform(0, 100)), 4))
+
+        def win_probabilities(max_workers):
+            np.random.seed(7)
+            with tempfile.TemporaryDirectory() as output_dir:
+                reports = self.dm.generate_league_reports(output_dir=output_dir, max_workers=max_workers)
+                lines = {}
+                for team_id, path in reports.items():
+                    with open(path) as f:
+                        lines[team_id] = [line for line in f if 'Win Probability' in line]
+                return lines
+
+        in_process = win_probabilities(1)
+        self.assertEqual(win_probabilities(3), in_process)
+        self.assertEqual(win_probabilities(2), in_process)
+        # teams do not share their noise
+        self.assertEqual(len({tuple(lines) for lines in in_process.values() if lines}), 9)
+
+    def test_timing_summary(self):
+        """Test phases and counters are reported in the timing summary"""
+        self.dm.league.free_agents.return_value = []
+        self.dm.simulator.recommend_free_agents.return_value = []
+        self.dm.league.espn_request.stats = {'requests': 4, 'bytes': 2048}
+        self.dm.simulator.simulations_run = 100
+        self.dm.simulator.player_model.fit_count = 7
+
+        self.dm.analyze_free_agents()
+        summary = self.dm.timing_summary()
+
+        self.assertIn('league_fetch', summary['phases'])
+        self.assertIn('gmm_training', summary['phases'])
+        self.assertEqual(summary['phases']['free_agent_fetch']['calls'], 1)
+        self.assertEqual(summary['phases']['free_agent_scoring']['calls'], 1)
+        self.assertEqual(summary['counters'], {
+            'http_requests': 4,
+            'bytes_downloaded': 2048,
+            'simulations_run': 100,
+            'gmm_fits': 7
+        })
+
 
 class TestDecisionMakerHelpers(unittest.TestCase):
     """Test helper functions and edge cases"""
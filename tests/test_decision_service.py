@@ -0,0 +1,224 @@
+"""
+Tests for the long running decision service
+"""
+
+import json
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import Mock, patch
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from decision_service import DecisionService, make_server
+from fantasy_decision_maker import FantasyDecisionMaker
+
+
+def _team(team_id):
+    team = Mock()
+    team.team_id = team_id
+    team.team_name = f"Team {team_id}"
+    team.wins = team_id
+    team.losses = 9 - team_id
+    # team i plays team 10 - i in week 1, team 5 is on a bye
+    team.schedule = [10 - team_id]
+    team.roster = []
+    return team
+
+
+class TestDecisionService(unittest.TestCase):
+    """Cached answers, background refresh and the HTTP routes"""
+
+    @patch('fantasy_decision_maker.League')
+    @patch('fantasy_decision_maker.AdvancedFantasySimulator')
+    def setUp(self, mock_simulator, mock_league):
+        league = Mock()
+        league.teams = [_team(i) for i in range(1, 10)]
+        league.current_week = 1
+        league.refresh.return_value = {'teams': [], 'rosters': [], 'schedules': []}
+        mock_league.return_value = league
+
+        simulator = Mock()
+        simulator.use_gmm = True
+        simulator.simulate_matchup.return_value = {
+            'team1_win_probability': 60.0,
+            'team2_win_probability': 40.0,
+            'team1_avg_score': np.float64(110.0),
+            'team1_score_range': (np.float64(95.0), np.float64(125.0)),
+            'team1_scores': [110.0] * 100,
+            'team2_scores': [100.0] * 100
+        }
+        simulator.simulate_season_rest_of_season.return_value = {
+            team.team_id: {'projected_wins': team.team_id + 0.5, 'playoff_odds': 50.0, 'championship_odds': 10.0}
+            for team in league.teams
+        }
+        mock_simulator.return_value = simulator
+
+        self.dm = FantasyDecisionMaker(league_id=123456, team_id=1, year=2024, num_simulations=100)
+        self.service = DecisionService(self.dm, refresh_interval=0.01)
+
+    @patch('decision_service.LeagueFrame')
+    def test_answers_are_cached_until_the_league_changes(self, mock_frame):
+        """Test queries are computed once and again only after a changing refresh"""
+        first = self.service.matchup(2)
+        self.assertEqual(first['opponent'], 'Team 8')
+        self.assertNotIn('team1_scores', first)
+        self.assertIs(self.service.matchup(2), first)
+        self.assertEqual(self.dm.simulator.simulate_matchup.call_count, 1)
+
+        self.assertFalse(self.service.refresh())
+        self.service.matchup(2)
+        self.assertEqual(self.dm.simulator.simulate_matchup.call_count, 1)
+
+        changed = self.dm.league.teams[1]
+        changed.roster = [Mock()]
+        self.dm.league.refresh.return_value = {'teams': [], 'rosters': [changed], 'schedules': []}
+        self.assertTrue(self.service.refresh())
+        self.service.matchup(2)
+        self.assertEqual(self.dm.simulator.simulate_matchup.call_count, 2)
+        mock_frame.assert_called_once_with(self.dm.league)
+        self.assertIs(self.dm.simulator.frame, mock_frame.return_value)
+        self.dm.simulator.player_model.bulk_train.assert_called_once_with(changed.roster, self.dm.league.year,
+                                                                        frame=mock_frame.return_value)
+
+    def test_slow_answer_does_not_block_other_keys(self):
+        """Test an answer being computed only holds up queries for the same key"""
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow():
+            calls.append('slow')
+            started.set()
+            release.wait(5)
+            return 'slow'
+
+        first = threading.Thread(target=self.service._cached, args=('slow', slow))
+        second = threading.Thread(target=self.service._cached, args=('slow', slow))
+        first.start()
+        self.assertTrue(started.wait(5))
+        second.start()
+
+        # other keys go ahead while the slow answer is computed
+        self.assertEqual(self.service._cached('fast', lambda: 'fast'), 'fast')
+
+        release.set()
+        first.join(5)
+        second.join(5)
+        self.assertEqual(calls, ['slow'])
+        self.assertEqual(self.service.stats, {'hits': 1, 'misses': 2, 'refreshes': 0, 'refresh_errors': 0})
+
+    def test_queries_answered_while_the_league_is_fetched(self):
+        """Test a refresh does not hold up queries while fetching the league"""
+        fetching, release = threading.Event(), threading.Event()
+
+        def fetch():
+            fetching.set()
+            release.wait(5)
+            return ('league', 'pro_schedule')
+
+        self.dm.league.fetch_refresh.side_effect = fetch
+        refresher = threading.Thread(target=self.service.refresh)
+        refresher.start()
+        self.assertTrue(fetching.wait(5))
+        self.assertEqual(self.service.matchup(2)['opponent'], 'Team 8')
+        release.set()
+        refresher.join(5)
+
+        self.dm.league.refresh.assert_called_once_with(('league', 'pro_schedule'))
+
+    def test_query_waits_while_the_refresh_is_applied(self):
+        """Test a query sent while a refresh changes the league answers from the refreshed league"""
+        self.dm.simulator.frame = None
+        applying, release = threading.Event(), threading.Event()
+        changed = self.dm.league.teams[1]
+
+        def apply(fetched):
+            applying.set()
+            release.wait(5)
+            changed.team_name = 'Renamed'
+            return {'teams': [changed], 'rosters': [], 'schedules': []}
+
+        self.dm.league.refresh.side_effect = apply
+        refresher = threading.Thread(target=self.service.refresh)
+        refresher.start()
+        self.assertTrue(applying.wait(5))
+
+        answers = []
+        query = threading.Thread(target=lambda: answers.append(self.service.matchup(2)))
+        query.start()
+        query.join(0.2)
+        self.assertTrue(query.is_alive())
+        self.assertEqual(self.dm.simulator.simulate_matchup.call_count, 0)
+
+        release.set()
+        refresher.join(5)
+        query.join(5)
+        self.assertEqual(answers[0]['team'], 'Renamed')
+        self.assertEqual(self.service.generation, 1)
+        self.assertIs(self.service.matchup(2), answers[0])
+
+    def test_free_agents_fetched_once_for_every_team(self):
+        """Test the free agent pool is shared by the answers of every team"""
+        self.dm.league.free_agents.return_value = ['fa']
+        self.dm.simulator.recommend_free_agents.return_value = []
+
+        for team_id in range(1, 10):
+            self.service.free_agents(team_id, top_n=3)
+
+        self.assertEqual(self.dm.league.free_agents.call_count, 1)
+        self.assertEqual(self.dm.simulator.recommend_free_agents.call_count, 9)
+        self.assertEqual(self.dm.simulator.recommend_free_agents.call_args[0][1], ['fa'])
+
+    def test_background_refresh(self):
+        """Test start warms the shared answers and refreshes until stopped"""
+        self.service.start()
+        self.addCleanup(self.service.stop)
+        self.assertEqual(self.dm.simulator.simulate_season_rest_of_season.call_count, 1)
+        for _ in range(200):
+            if self.service.stats['refreshes'] >= 2:
+                break
+            threading.Event().wait(0.01)
+        self.service.stop()
+        self.assertGreaterEqual(self.service.stats['refreshes'], 2)
+        self.assertEqual(self.service.stats['refresh_errors'], 0)
+
+    def test_http_routes(self):
+        """Test the JSON routes over HTTP"""
+        server = make_server(self.service, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        def get(path, method='GET'):
+            try:
+                with urlopen(Request(url + path, method=method)) as response:
+                    return response.status, json.loads(response.read())
+            except HTTPError as e:
+                return e.code, json.loads(e.read())
+
+        status, matchup = get('/teams/3/matchup')
+        self.assertEqual(status, 200)
+        self.assertEqual(matchup['opponent'], 'Team 7')
+        self.assertEqual(matchup['team1_score_range'], [95.0, 125.0])
+
+        self.assertEqual(get('/teams/5/matchup')[1]['opponent'], None)
+
+        status, outlook = get('/outlook')
+        self.assertEqual([team['team_id'] for team in outlook['teams']], list(range(9, 0, -1)))
+
+        self.assertEqual(get('/teams/99/matchup')[0], 404)
+        self.assertEqual(get('/teams/1/trades?limit=x')[0], 400)
+        self.assertEqual(get('/nowhere')[0], 404)
+        self.assertEqual(get('/refresh', method='POST'), (200, {'changed': False, 'generation': 0}))
+        self.assertEqual(get('/health')[1]['stats']['refreshes'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+from unittest import TestCase
+
+from benchmarks.synthetic import SyntheticLeague
+from espn_api.fleet import FleetEntry, LeagueFleet
+from espn_api.player_pool import player_pools
+from espn_api.requests.throttle import throttle
+from espn_api.requests.transport import ReplayTransport
+
+
+class LeagueFleetTest(TestCase):
+    def setUp(self):
+        self.entries = [('nfl', 1, 2024, None), ('nfl', 2, 2024, {'espn_s2': 'cookie', 'SWID': '{swid}'}),
+                        ('nba', 3, 2024, None), ('nfl', 4, 2024, None)]
+        self.fleet = LeagueFleet(self.entries, max_workers=3, transport=self.transport)
+
+    @staticmethod
+    def transport(entry: FleetEntry):
+        if entry.league_id == 4:
+            raise Exception('league 4 is private')
+        return SyntheticLeague(entry.sport, num_teams=4, roster_size=3, year=entry.year, league_id=entry.league_id).transport()
+
+    def test_results_per_league(self):
+        results = self.fleet.run(lambda league: len(league.teams))
+        self.assertEqual(set(results), {('nfl', 1, 2024), ('nfl', 2, 2024), ('nba', 3, 2024), ('nfl', 4, 2024)})
+        self.assertEqual(results[('nfl', 1, 2024)].value, 4)
+        self.assertEqual(results[('nba', 3, 2024)].league.sport, 'nba')
+        self.assertEqual(results[('nfl', 2, 2024)].league.espn_request.cookies, {'espn_s2': 'cookie', 'SWID': '{swid}'})
+        # a failing league does not stop the others
+        self.assertIsNone(results[('nfl', 4, 2024)].value)
+        self.assertEqual(str(results[('nfl', 4, 2024)].error), 'league 4 is private')
+
+        # pro schedules are downloaded once per sport and year
+        self.assertEqual(self.fleet.shared_payloads.stats['fetches'], 2)
+        self.assertEqual(self.fleet.shared_payloads.stats['hits'], 1)
+
+    def test_leagues_kept(self):
+        first = {result.entry.key: result.league for result in self.fleet.leagues()}
+        second = self.fleet.run(lambda league: league)
+        self.assertIs(second[('nfl', 1, 2024)].value, first[('nfl', 1, 2024)])
+        self.assertIs(self.fleet.league(('nfl', 1, 2024)), first[('nfl', 1, 2024)])
+
+    def test_refresh_keeps_draft(self):
+        league = self.fleet.league(('nba', 3, 2024))
+        picks = len(league.draft)
+        self.assertGreater(picks, 0)
+        for _ in range(2):
+            (result,) = [result for result in self.fleet.refresh() if result.entry.sport == 'nba']
+            self.assertIsNone(result.error)
+        self.assertEqual(len(league.draft), picks)
+
+    def test_leagues_share_live_transport(self):
+        throttle.reset()
+        player_pools.clear()
+        self.addCleanup(player_pools.clear)
+        fleet = LeagueFleet([('nfl', 1, 2024), ('nfl', 2, 2024, {'espn_s2': 'cookie', 'SWID': '{swid}'})])
+        cassette = [entry for league_id in (1, 2)
+                    for entry in SyntheticLeague('nfl', num_teams=4, roster_size=3, year=2024, league_id=league_id).cassette()]
+        # answer the shared session from the synthetic leagues instead of ESPN
+        fleet.live_transport.session = ReplayTransport(entries=cassette)
+
+        results = fleet.run(lambda league: league.espn_request.transport)
+        self.assertEqual({result.error for result in results.values()}, {None})
+        self.assertEqual({id(result.value) for result in results.values()}, {id(fleet.live_transport)})
+
+    def test_own_rate_budget(self):
+        rate = throttle.bucket.rate
+        fleet = LeagueFleet([('nfl', 1, 2024)], requests_per_second=2)
+        self.assertIs(fleet.live_transport.throttle, fleet.throttle)
+        self.assertEqual(fleet.throttle.bucket.rate, 2)
+        # the process wide throttle is left alone
+        self.assertIsNot(fleet.throttle, throttle)
+        self.assertEqual(throttle.bucket.rate, rate)
+        self.assertIs(LeagueFleet([('nfl', 1, 2024)]).live_transport.throttle, throttle)
+
+    def test_unknown_sport(self):
+        fleet = LeagueFleet([('cricket', 1, 2024)])
+        (result,) = list(fleet.map())
+        self.assertIn('Unknown sport', str(result.error))
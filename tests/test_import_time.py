@@ -0,0 +1,55 @@
+"""
+Import time checks
+
+Heavy optional dependencies (scikit-learn, pandas) must only load when the
+code that needs them runs, workers that only read standings should not pay for them.
+The import time itself is measured by the import.* benchmarks (benchmarks/run.py)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('sklearn', 'pandas')
+
+
+def measure_import(statement: str) -> dict:
+    """Run statement in a fresh interpreter, return the heavy modules it loaded and every loaded module"""
+    code = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"print(json.dumps({{'modules': [m for m in {HEAVY_MODULES!r} if m in sys.modules], "
+        "'loaded': sorted(sys.modules)}))\n"
+    )
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+    """Test importing the library does not load what it does not need"""
+
+    def test_sport_package_is_lazy(self):
+        """Test importing a sport package does not load its submodules"""
+        result = measure_import('import espn_api.football')
+        self.assertNotIn('espn_api.football.league', result['loaded'])
+        self.assertNotIn('espn_api.football.live_scoring', result['loaded'])
+
+    def test_league_without_heavy_dependencies(self):
+        """Test League and the simulator import without scikit-learn or pandas"""
+        result = measure_import(
+            'from espn_api.football import League\n'
+            'from espn_api.utils.advanced_simulator import AdvancedFantasySimulator'
+        )
+        self.assertEqual(result['modules'], [])
+
+    def test_cli_without_heavy_dependencies(self):
+        """Test the decision maker CLI imports without scikit-learn or pandas"""
+        result = measure_import('import fantasy_decision_maker')
+        self.assertEqual(result['modules'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -302,6 +302,24 @@ class TestAdvancedFantasySimulator(unittest.TestCase):
         for rec in recommendations:
             self.assertEqual(rec['position'], 'RB')
 
+    def test_free_agents_stop_at_max_candidates(self):
+        """Test that free agents past max_candidates are not read"""
+        my_team = self.teams[0]
+        read = []
+
+        def free_agents():
+            for i, position in enumerate(["QB", "RB", "WR", "RB"]):
+                read.append(i)
+                yield self._create_mock_player("FA %s" % i, position, 15.0, 9010 + i)
+
+        self.simulator.recommend_free_agents(
+            my_team, free_agents(), positions=['RB'], exclude_injured=False,
+            use_ros=False, max_candidates=1
+        )
+
+        # the QB is filtered out and not counted
+        self.assertEqual(read, [0, 1])
+
     def test_simulate_season_rest_of_season(self):
         """Test rest of season simulation"""
         results = self.simulator.simulate_season_rest_of_season()
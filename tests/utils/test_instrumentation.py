@@ -0,0 +1,68 @@
+"""
+Unit tests for timing and profiling instrumentation
+"""
+
+import os
+import tempfile
+import unittest
+
+from espn_api.utils.instrumentation import PhaseTimer, profile_call
+
+
+class TestPhaseTimer(unittest.TestCase):
+    """Test cases for PhaseTimer"""
+
+    def test_phases_accumulate(self):
+        """Test repeated phases add up seconds and calls"""
+        timer = PhaseTimer()
+        for _ in range(3):
+            with timer.phase('fetch'):
+                pass
+
+        summary = timer.summary()
+
+        self.assertEqual(summary['phases']['fetch']['calls'], 3)
+        self.assertGreaterEqual(summary['phases']['fetch']['seconds'], 0)
+        self.assertGreaterEqual(summary['total_seconds'], summary['phases']['fetch']['seconds'])
+
+    def test_phase_recorded_on_error(self):
+        """Test a phase is still recorded when the block raises"""
+        timer = PhaseTimer()
+        with self.assertRaises(RuntimeError):
+            with timer.phase('simulate'):
+                raise RuntimeError('boom')
+
+        self.assertEqual(timer.summary()['phases']['simulate']['calls'], 1)
+
+    def test_counters(self):
+        """Test counters increment and can be set"""
+        timer = PhaseTimer()
+        timer.increment('requests')
+        timer.increment('requests', 2)
+        timer.set_counter('bytes', 100)
+
+        self.assertEqual(timer.summary()['counters'], {'requests': 3, 'bytes': 100})
+        self.assertIn('requests', timer.format_table())
+
+
+class TestProfileCall(unittest.TestCase):
+    """Test cases for profile_call"""
+
+    def test_cprofile(self):
+        """Test cProfile returns the result, a report and a stats file"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, 'run.prof')
+            result, report = profile_call(lambda: sum(range(1000)), output_path=output_path)
+
+            self.assertEqual(result, sum(range(1000)))
+            self.assertIn('function calls', report)
+            self.assertTrue(os.path.exists(output_path))
+
+    def test_unknown_profiler(self):
+        """Test unknown profilers are rejected"""
+        with self.assertRaises(ValueError):
+            profile_call(lambda: None, profiler='perf')
+
+
+if __name__ == '__main__':
+    unittest.main()
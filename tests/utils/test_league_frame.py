@@ -0,0 +1,168 @@
+"""
+Unit tests for LeagueFrame
+
+Tests columnar construction, incremental refresh and simulator consumption
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import numpy as np
+from espn_api.utils.league_frame import LeagueFrame, FREE_AGENT
+from espn_api.utils.advanced_simulator import AdvancedFantasySimulator
+from espn_api.utils.monte_carlo import MonteCarloSimulator
+
+
+class TestLeagueFrame(unittest.TestCase):
+    """Test LeagueFrame functionality"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.league = Mock()
+        self.league.year = 2024
+        self.league.current_week = 4
+        self.league.finalScoringPeriod = 4
+        self.league.settings = Mock()
+        self.league.settings.reg_season_count = 14
+
+        self.qb = self._create_mock_player(1, 'QB', 'KC', [20.0, 25.0, 18.0], owned=99.5)
+        self.rb = self._create_mock_player(2, 'RB', 'SF', [12.0, 0.0, 15.0], owned=80.0)
+        self.wr = self._create_mock_player(3, 'WR', 'KC', [9.0, 11.0, 7.0], owned=60.0)
+
+        self.team1 = Mock(team_id=1, roster=[self.qb, self.rb])
+        self.team2 = Mock(team_id=2, roster=[self.wr])
+        self.league.teams = [self.team1, self.team2]
+
+    def _create_mock_player(self, player_id, position, pro_team, weekly_scores, owned=50.0):
+        """Create a mock player with weekly stats"""
+        player = Mock()
+        player.playerId = player_id
+        player.name = f"Player {player_id}"
+        player.position = position
+        player.proTeam = pro_team
+        player.percent_owned = owned
+        player.avg_points = np.mean(weekly_scores)
+        player.projected_avg_points = player.avg_points + 1
+        player.projected_points = 0
+        player.points_per_game = player.avg_points
+        player.stats = {0: {'points': sum(weekly_scores), 'avg_points': player.avg_points}}
+        for week, score in enumerate(weekly_scores, 1):
+            player.stats[week] = {'points': score, 'projected_points': score + 1}
+        return player
+
+    def test_build_columns(self):
+        """Test frame is built with one row per rostered player"""
+        frame = LeagueFrame(self.league)
+
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(frame.actual.shape, (3, 4))
+        self.assertEqual(frame.projected.shape, (3, 4))
+        np.testing.assert_array_equal(frame.player_ids, [1, 2, 3])
+        np.testing.assert_array_equal(frame.roster_team, [1, 1, 2])
+        self.assertEqual(frame.pro_teams[0], frame.pro_teams[2])
+        self.assertEqual(frame.position_names[frame.positions[1]], 'RB')
+        self.assertAlmostEqual(frame.ownership[0], 99.5)
+
+    def test_weekly_points(self):
+        """Test weekly points matrix skips season totals and missing weeks"""
+        frame = LeagueFrame(self.league)
+
+        points = frame.weekly_points(1)
+        np.testing.assert_array_equal(points[:3], [20.0, 25.0, 18.0])
+        self.assertTrue(np.isnan(points[3]))
+        np.testing.assert_array_equal(frame.weekly_points(1, projected=True)[:3], [21.0, 26.0, 19.0])
+        self.assertTrue(np.isnan(frame.weekly_points(999)).all())
+
+    def test_basketball_style_stats(self):
+        """Test str keyed scoring periods with applied_total are read"""
+        player = self._create_mock_player(4, 'PG', 'BOS', [30.5])
+        player.stats = {'2024_total': {'applied_total': 300}, '1': {'applied_total': 30.5}, '2': {'applied_total': 41.0}}
+        self.team2.roster = [player]
+
+        frame = LeagueFrame(self.league)
+        np.testing.assert_array_equal(frame.weekly_points(4)[:2], [30.5, 41.0])
+
+    def test_masks(self):
+        """Test position and team masks"""
+        frame = LeagueFrame(self.league)
+
+        np.testing.assert_array_equal(frame.position_mask('QB'), [True, False, False])
+        np.testing.assert_array_equal(frame.team_mask(1), [True, True, False])
+        self.assertFalse(frame.position_mask('K').any())
+
+    def test_refresh_incremental(self):
+        """Test refresh updates moved players and appends new ones"""
+        frame = LeagueFrame(self.league)
+        new_player = self._create_mock_player(5, 'TE', 'DAL', [6.0, 8.0, 10.0, 12.0, 14.0])
+        self.team1.roster = [self.qb, new_player]
+
+        frame.refresh(teams=[self.team1])
+
+        self.assertEqual(len(frame), 4)
+        self.assertEqual(frame.roster_team[frame.row(2)], FREE_AGENT)
+        self.assertEqual(frame.roster_team[frame.row(5)], 1)
+        self.assertEqual(frame.num_periods, 5)
+        self.assertEqual(frame.weekly_points(5)[4], 14.0)
+        # unchanged team rows are untouched
+        self.assertEqual(frame.roster_team[frame.row(3)], 2)
+
+    def test_base_projection(self):
+        """Test projection falls back to average points"""
+        self.qb.projected_avg_points = 0
+        frame = LeagueFrame(self.league)
+
+        self.assertAlmostEqual(frame.base_projection(1), self.qb.avg_points)
+        self.assertAlmostEqual(frame.base_projection(2), self.rb.projected_avg_points)
+        self.assertIsNone(frame.base_projection(999))
+
+    def test_simulator_consumes_frame(self):
+        """Test AdvancedFantasySimulator reads projections from the frame"""
+        frame = LeagueFrame(self.league)
+        # Diverge the player object from the frame to prove the frame is used
+        self.qb.projected_avg_points = 0
+        self.qb.avg_points = 0
+
+        with patch('espn_api.utils.advanced_simulator.PlayerPerformanceModel'):
+            simulator = AdvancedFantasySimulator(self.league, num_simulations=10, use_gmm=False, frame=frame)
+
+        self.assertAlmostEqual(simulator._base_projection(self.qb), 22.0)
+
+    def test_monte_carlo_frame_projection_matches_players(self):
+        """Test MonteCarloSimulator projects the same season points with and without a frame"""
+        self.qb.projected_points = 350.0
+        self.wr.points_per_game = 0
+        for team in self.league.teams:
+            team.schedule = []
+
+        frame = LeagueFrame(self.league)
+        with_frame = MonteCarloSimulator(self.league, num_simulations=10, preseason=True, frame=frame)
+        without_frame = MonteCarloSimulator(self.league, num_simulations=10, preseason=True)
+
+        for player in (self.qb, self.rb, self.wr):
+            self.assertAlmostEqual(with_frame._player_projection(player), without_frame._player_projection(player))
+        self.assertAlmostEqual(with_frame._player_projection(self.qb), 350.0)
+        self.assertAlmostEqual(with_frame._player_projection(self.rb), 14 * self.rb.avg_points)
+        for team in self.league.teams:
+            self.assertAlmostEqual(with_frame.team_ratings[team.team_id]['mean'],
+                                   without_frame.team_ratings[team.team_id]['mean'])
+
+    def test_bulk_train_uses_frame(self):
+        """Test PlayerPerformanceModel.bulk_train reads weekly scores from the frame"""
+        from espn_api.utils.player_performance import PlayerPerformanceModel
+
+        frame = LeagueFrame(self.league)
+        model = PlayerPerformanceModel(cache_dir=self._tmp_dir())
+        with patch.object(model, 'train_model', return_value=None) as train:
+            model.bulk_train([self.rb], 2024, frame=frame)
+
+        self.assertEqual(train.call_args.kwargs['weekly_scores'], [12.0, 15.0])
+
+    def _tmp_dir(self):
+        import tempfile
+        import shutil
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path, True)
+        return path
+
+
+if __name__ == '__main__':
+    unittest.main()